@@ -1,8 +1,20 @@
 import os
 import json
+import queue
+import threading
+import time
+import unicodedata
+from sys import intern
+from collections import OrderedDict
 from ytmusicapi import YTMusic
 import ytmusicapi.navigation
-from gi.repository import GLib
+import ytmusicapi.continuations
+import ytmusicapi.mixins.playlists
+import ytmusicapi.parsers.playlists
+from ytmusicapi.continuations import CONTINUATION_ITEMS, get_continuation_token
+from ytmusicapi.parsers.playlists import parse_playlist_items
+from gi.repository import GLib, GObject
+from api.track_store import TrackStore
 
 # Monkeypatch ytmusicapi.navigation.nav to handle UI changes like musicImmersiveHeaderRenderer
 _original_nav = ytmusicapi.navigation.nav
@@ -50,9 +62,280 @@ def robust_nav(root, items, none_if_absent=False):
 
 ytmusicapi.navigation.nav = robust_nav
 
+# Patch get_continuations_2025 so get_playlist can stop after the first page and
+# hand back the continuation token instead of walking every page up to `limit`.
+_original_get_continuations_2025 = ytmusicapi.continuations.get_continuations_2025
+_first_page_capture = threading.local()
+
+
+def first_page_continuations(results, limit, request_func, parse_func):
+    if not getattr(_first_page_capture, "active", False):
+        return _original_get_continuations_2025(
+            results, limit, request_func, parse_func
+        )
+    try:
+        _first_page_capture.token = get_continuation_token(results["contents"])
+    except (KeyError, IndexError, TypeError):
+        _first_page_capture.token = None
+    return []
+
+
+# Both modules bind the name via `from ytmusicapi.continuations import *`
+ytmusicapi.mixins.playlists.get_continuations_2025 = first_page_continuations
+ytmusicapi.parsers.playlists.get_continuations_2025 = first_page_continuations
+
+
+_MISSING = object()
+
+
+def _intern(value):
+    return intern(value) if value else None
+
+
+def _parse_duration(text):
+    """'3:45' / '1:02:03' -> seconds, or None."""
+    try:
+        seconds = 0
+        for part in str(text).split(":"):
+            seconds = seconds * 60 + int(part)
+        return seconds
+    except (TypeError, ValueError):
+        return None
+
+
+class Track:
+    """
+    Immutable, normalised track record.
+
+    Built from ytmusicapi track dicts by parse_track(). Only the fields the
+    app uses are kept: one thumbnail URL instead of every size, artist and
+    album names/ids interned so repeated artists share one string, and no
+    feedback tokens or nested renderer data.
+
+    Attribute access is the fast path. get()/[] accept the ytmusicapi keys
+    ("videoId", "artists", "thumbnails", ...) so dict-style code keeps
+    working; nested values for those are rebuilt on access.
+    """
+
+    __slots__ = (
+        "video_id",
+        "set_video_id",
+        "title",
+        "artists",  # ((name, id), ...)
+        "artist",  # names joined with ", "
+        "album",
+        "album_id",
+        "thumb",
+        "duration_seconds",
+        "like_status",
+        "explicit",
+    )
+
+    def __init__(
+        self,
+        video_id,
+        title,
+        artists=(),
+        album=None,
+        album_id=None,
+        thumb=None,
+        duration_seconds=None,
+        like_status="INDIFFERENT",
+        explicit=False,
+        set_video_id=None,
+        artist=None,
+    ):
+        artists = tuple((_intern(name), _intern(aid)) for name, aid in artists)
+        if artist is None:
+            artist = ", ".join(name for name, _ in artists if name)
+        init = object.__setattr__
+        init(self, "video_id", video_id or None)
+        init(self, "set_video_id", set_video_id or None)
+        init(self, "title", title or "Unknown")
+        init(self, "artists", artists)
+        init(self, "artist", _intern(artist) or "")
+        init(self, "album", _intern(album))
+        init(self, "album_id", _intern(album_id))
+        init(self, "thumb", thumb or None)
+        init(self, "duration_seconds", duration_seconds or None)
+        init(self, "like_status", _intern(like_status) or "INDIFFERENT")
+        init(self, "explicit", bool(explicit))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Track is immutable, use replace()")
+
+    def __delattr__(self, name):
+        raise AttributeError("Track is immutable")
+
+    def __repr__(self):
+        return f"Track({self.video_id!r}, {self.title!r})"
+
+    def replace(self, **changes):
+        """Returns a copy with the given attributes changed."""
+        fields = {name: getattr(self, name) for name in self.__slots__}
+        fields.update(changes)
+        if "artists" in changes and "artist" not in changes:
+            fields["artist"] = None
+        return Track(**fields)
+
+    @property
+    def duration(self):
+        seconds = self.duration_seconds
+        if not seconds:
+            return ""
+        if seconds >= 3600:
+            return f"{seconds // 3600}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+        return f"{seconds // 60}:{seconds % 60:02d}"
+
+    # --- ytmusicapi dict compatibility ---
+
+    _KEYS = {
+        "videoId": lambda t: t.video_id,
+        "setVideoId": lambda t: t.set_video_id,
+        "title": lambda t: t.title,
+        "artist": lambda t: t.artist,
+        "artists": lambda t: [{"name": n, "id": i} for n, i in t.artists],
+        "album": lambda t: (
+            {"name": t.album, "id": t.album_id} if t.album or t.album_id else None
+        ),
+        "thumb": lambda t: t.thumb,
+        "thumbnails": lambda t: [{"url": t.thumb}] if t.thumb else [],
+        "duration": lambda t: t.duration,
+        "duration_seconds": lambda t: t.duration_seconds,
+        "likeStatus": lambda t: t.like_status,
+        "isExplicit": lambda t: t.explicit,
+        "explicit": lambda t: t.explicit,
+    }
+
+    def get(self, key, default=None):
+        getter = self._KEYS.get(key)
+        if getter is None:
+            return default
+        value = getter(self)
+        return default if value is None else value
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self.get(key, _MISSING) is not _MISSING
+
+    def to_dict(self):
+        """Compact JSON-friendly form; parse_track() reads it back."""
+        data = {
+            "videoId": self.video_id,
+            "title": self.title,
+            "artists": [{"name": n, "id": i} for n, i in self.artists],
+            "thumb": self.thumb,
+            "likeStatus": self.like_status,
+        }
+        if self.set_video_id:
+            data["setVideoId"] = self.set_video_id
+        if self.album or self.album_id:
+            data["album"] = {"name": self.album, "id": self.album_id}
+        if self.duration_seconds:
+            data["duration_seconds"] = self.duration_seconds
+        if self.explicit:
+            data["isExplicit"] = True
+        if not self.artists and self.artist:
+            data["artist"] = self.artist
+        return data
+
+
+def parse_track(data, fallback_thumb=None):
+    """
+    Normalises a ytmusicapi track dict (playlist, album, watch playlist or a
+    stored to_dict()) into a Track. Tracks are returned unchanged.
+    """
+    if isinstance(data, Track):
+        return data
+
+    artists = []
+    raw_artists = data.get("artists")
+    if isinstance(raw_artists, list):
+        for a in raw_artists:
+            if isinstance(a, dict) and a.get("name"):
+                artists.append((a["name"], a.get("id")))
+    artist = data.get("artist")
+    if isinstance(artist, list):
+        artists = [(a.get("name"), a.get("id")) for a in artist if a]
+        artist = None
+    elif artists:
+        artist = None
+
+    album = data.get("album")
+    album_name = album_id = None
+    if isinstance(album, dict):
+        album_name, album_id = album.get("name"), album.get("id")
+    elif album:
+        album_name = str(album)
+
+    thumbnails = data.get("thumbnails") or data.get("thumbnail")
+    if isinstance(thumbnails, list) and thumbnails:
+        thumb = thumbnails[-1].get("url")
+    else:
+        thumb = data.get("thumb") or fallback_thumb
+
+    duration_seconds = data.get("duration_seconds") or _parse_duration(
+        data.get("duration") or data.get("length")
+    )
+
+    return Track(
+        data.get("videoId"),
+        data.get("title"),
+        artists=artists,
+        album=album_name,
+        album_id=album_id,
+        thumb=thumb,
+        duration_seconds=duration_seconds,
+        like_status=data.get("likeStatus"),
+        explicit=data.get("isExplicit") or data.get("explicit"),
+        set_video_id=data.get("setVideoId"),
+        artist=str(artist) if artist else None,
+    )
+
+
+def parse_tracks(items, fallback_thumb=None):
+    return [parse_track(t, fallback_thumb) for t in items or () if t]
+
+
+def fold_text(text):
+    """Case- and accent-insensitive form of text for matching: 'Beyoncé' -> 'beyonce'."""
+    if not text:
+        return ""
+    if not text.isascii():
+        text = "".join(
+            c
+            for c in unicodedata.normalize("NFKD", text)
+            if not unicodedata.combining(c)
+        )
+    return " ".join(text.casefold().split())
+
+
+def track_search_key(track):
+    """Folded title and artists, split by a newline so no query spans both."""
+    return f"{fold_text(track.title)}\n{fold_text(track.artist)}"
+
+
+class AuthEvents(GObject.Object):
+    """Main-thread notifications about the background session check."""
+
+    __gsignals__ = {
+        "session-validated": (
+            GObject.SignalFlags.RUN_FIRST,
+            None,
+            (bool,),
+        ),  # is_valid
+    }
+
 
 class MusicClient:
     _instance = None
+    # How long a validation result is trusted before hitting the network again
+    VALIDATION_TTL = 60
 
     def __new__(cls):
         if cls._instance is None:
@@ -65,10 +348,24 @@ class MusicClient:
         data_dir = os.path.join(GLib.get_user_data_dir(), "muse")
         self.auth_path = os.path.join(data_dir, "headers_auth.json")
         self._is_authed = False
-        self._playlist_cache = {}  # Cache fully-fetched playlists
+        # Fully-fetched playlists: a small in-memory LRU in front of the disk store
+        self._playlist_cache = OrderedDict()  # id -> (tracks, meta, fetched_at)
+        self._track_store = TrackStore()
+        # One writer thread applies store puts in call order. Invalidations bump
+        # the playlist's generation so puts of older data are dropped.
+        self._store_writes = queue.Queue()
+        self._store_writer = None
+        self._store_lock = threading.Lock()
+        self._store_generations = {}  # playlist id -> invalidation count
+        self._store_epoch = 0  # bumped when the whole store is cleared
         self._user_info = None  # Cache for account info
         self._subscribed_artists = set()  # Set of channel IDs
+        self._library_subscriptions = []  # Last fetched subscriptions list
         self._library_playlists = []  # Cache for editable playlists
+        self.auth_events = AuthEvents()
+        self._validation = None  # (timestamp, is_valid)
+        self._validating = False
+        self._validation_lock = threading.Lock()
         self.try_login()
 
     def try_login(self):
@@ -83,28 +380,44 @@ class MusicClient:
                 # Normalize keys for ytmusicapi and remove Bearer tokens
                 headers = self._normalize_headers(headers)
 
+                # No network here: assume the saved session is good so the UI can
+                # come up immediately, and confirm it in the background.
                 self.api = YTMusic(auth=headers)
-                if self.validate_session():
-                    print("Authenticated via saved session.")
-                    self._is_authed = True
-                    return True
-                else:
-                    print("Saved session invalid.")
+                self._is_authed = True
+                print("Loaded saved session; validating in background.")
+                self.validate_session_async(fall_back=True)
+                return True
             except Exception as e:
                 print(f"Failed to load saved session: {e}")
 
+        return self._fallback_login()
+
+    def _fallback_login(self):
+        api, is_authed = self._fallback_api()
+        self._set_session(api, is_authed)
+        return is_authed
+
+    def _fallback_api(self):
+        """
+        Returns (api, is_authed) for the fallback session without touching the
+        client's state, so it can be built on a worker thread.
+        """
         # 2. Check for browser.json in cwd (Manually provided)
         browser_path = os.path.join(os.getcwd(), "browser.json")
         if os.path.exists(browser_path):
             print(f"Found browser.json at {browser_path}. Importing...")
-            if self.login(browser_path):
-                return True
+            api = self._prepare_login(browser_path)
+            if api is not None:
+                return api, True
 
         # 3. Fallback
         print("Falling back to unauthenticated mode.")
-        self.api = YTMusic()
-        self._is_authed = False
-        return False
+        return YTMusic(), False
+
+    def _set_session(self, api, is_authed):
+        self.api = api
+        self._is_authed = is_authed
+        self._validation = (time.time(), is_authed) if is_authed else None
 
     def _normalize_headers(self, headers):
         """
@@ -191,6 +504,19 @@ class MusicClient:
         """
         Robust login method for browser.json or headers dict.
         """
+        api = self._prepare_login(auth_input)
+        if api is None:
+            self._set_session(YTMusic(), False)
+            return False
+        self._set_session(api, True)
+        print("Login successful and saved.")
+        return True
+
+    def _prepare_login(self, auth_input):
+        """
+        Saves the credentials and returns a validated YTMusic for them, or None.
+        Leaves the client's current session alone.
+        """
         try:
             headers = None
             if isinstance(auth_input, str):
@@ -213,7 +539,7 @@ class MusicClient:
 
             if not headers:
                 print("Invalid auth input.")
-                return False
+                return None
 
             # CRITICAL: Enforce Headers for Stability
             # 1. Accept-Language must be English to avoid parsing errors
@@ -244,33 +570,32 @@ class MusicClient:
 
             # Initialize API with dict directly
             print(f"Initializing YTMusic with headers: {list(headers.keys())}")
-            self.api = YTMusic(auth=headers)
+            api = YTMusic(auth=headers)
 
-            # Validate
-            if self.validate_session():
-                self._is_authed = True
-                print("Login successful and saved.")
-                return True
-            else:
-                print("Login failed: Session invalid after init.")
-                self.api = YTMusic()
-                self._is_authed = False
-                return False
+            # Validate (fresh credentials, so never trust an old result)
+            if self._check_session(api):
+                return api
+            print("Login failed: Session invalid after init.")
+            return None
 
         except Exception as e:
             import traceback
 
             print(f"Login exception: {e}")
             traceback.print_exc()
-            self.api = YTMusic()
-            self._is_authed = False
-            return False
+            return None
 
     def search(self, query, *args, **kwargs):
         if not self.api:
             return []
         return self.api.search(query, *args, **kwargs)
 
+    def get_search_suggestions(self, query):
+        """Query completions for the search box, as a list of strings."""
+        if not self.api:
+            return []
+        return self.api.get_search_suggestions(query)
+
     def get_song(self, video_id):
         if not self.api:
             return None
@@ -294,6 +619,7 @@ class MusicClient:
         try:
             subs = self.api.get_library_subscriptions(limit=limit)
             if subs:
+                self._library_subscriptions = subs
                 for s in subs:
                     bid = s.get("browseId")
                     if bid:
@@ -370,10 +696,82 @@ class MusicClient:
 
         return False
 
+    @staticmethod
+    def _parse_track_list(data, fallback_thumb=None):
+        """Replaces data["tracks"] with Track records, in place."""
+        if isinstance(data, dict) and data.get("tracks"):
+            data["tracks"] = parse_tracks(data["tracks"], fallback_thumb)
+        return data
+
     def get_playlist(self, playlist_id, limit=None):
         if not self.api:
             return None
-        return self.api.get_playlist(playlist_id, limit=limit)
+        return self._parse_track_list(self.api.get_playlist(playlist_id, limit=limit))
+
+    def get_playlist_page(
+        self, playlist_id, continuation=None, is_collaborative=False
+    ):
+        """
+        Fetches a single page of a playlist.
+        Without a continuation token this returns the get_playlist() dict holding
+        only the first page of tracks. With one it returns {"tracks": [...]}.
+        Either way "continuation" is the token for the next page, or None at the end.
+        """
+        if not self.api:
+            return None
+        if playlist_id == "LM" and not self.is_authenticated():
+            return None
+
+        if continuation is None:
+            _first_page_capture.active = True
+            _first_page_capture.token = None
+            try:
+                data = self.api.get_playlist(playlist_id, limit=None)
+                token = _first_page_capture.token
+            finally:
+                _first_page_capture.active = False
+            if data is not None:
+                data["continuation"] = token
+            return self._parse_track_list(data)
+
+        response = self.api._send_request("browse", {"continuation": continuation})
+        items = ytmusicapi.navigation.nav(response, CONTINUATION_ITEMS, True)
+        if not items:
+            return {"tracks": [], "continuation": None}
+
+        tracks = parse_tracks(
+            parse_playlist_items(items, is_collaborative=is_collaborative)
+        )
+        token = None
+        if tracks:
+            try:
+                token = get_continuation_token(items)
+            except (KeyError, IndexError, TypeError):
+                token = None
+        return {"tracks": tracks, "continuation": token}
+
+    def iter_playlist_pages(
+        self, playlist_id, continuation, is_collaborative=False, limit=5000
+    ):
+        """
+        Yields (tracks, next_continuation) for each page after continuation,
+        one request per page, until the end or roughly limit tracks.
+        Blocks on network I/O; iterate from a worker thread.
+        """
+        count = 0
+        while continuation and count < limit:
+            page = self.get_playlist_page(
+                playlist_id, continuation=continuation, is_collaborative=is_collaborative
+            )
+            if not page:
+                return
+            tracks = page.get("tracks") or []
+            continuation = page.get("continuation")
+            if not tracks:
+                yield [], None
+                return
+            count += len(tracks)
+            yield tracks, continuation
 
     def get_watch_playlist(
         self, video_id=None, playlist_id=None, limit=25, radio=False
@@ -384,21 +782,113 @@ class MusicClient:
             res = self.api.get_watch_playlist(
                 videoId=video_id, playlistId=playlist_id, limit=limit, radio=radio
             )
-            return res
+            return self._parse_track_list(res)
         except Exception as e:
             print(f"Error getting watch playlist: {e}")
             return {}
 
+    MEMORY_CACHED_PLAYLISTS = 8
+
+    def get_cached_playlist(self, playlist_id):
+        """
+        Returns (tracks, meta, is_stale) for a fully-fetched playlist, or None.
+        Checks memory first, then the on-disk store. May block on disk I/O.
+        """
+        entry = self._playlist_cache.get(playlist_id)
+        if entry is None:
+            stored = self._track_store.get(playlist_id)
+            if stored is None:
+                return None
+            tracks, meta, fetched_at = stored
+            entry = (parse_tracks(tracks), meta, fetched_at)
+            self._remember_playlist(playlist_id, entry)
+        else:
+            self._playlist_cache.move_to_end(playlist_id)
+
+        tracks, meta, fetched_at = entry
+        return tracks, meta, self._track_store.is_stale(fetched_at)
+
     def get_cached_playlist_tracks(self, playlist_id):
-        return self._playlist_cache.get(playlist_id)
+        cached = self.get_cached_playlist(playlist_id)
+        return cached[0] if cached else None
 
-    def set_cached_playlist_tracks(self, playlist_id, tracks):
-        self._playlist_cache[playlist_id] = tracks
+    def playlist_generation(self, playlist_id):
+        """
+        Changes whenever the playlist's cached tracks are invalidated. Pass the
+        value read before fetching to set_cached_playlist_tracks so a list
+        fetched before an edit is not cached as fresh afterwards.
+        """
+        with self._store_lock:
+            return self._generation_locked(playlist_id)
+
+    def _generation_locked(self, playlist_id):
+        return self._store_epoch, self._store_generations.get(playlist_id, 0)
+
+    def set_cached_playlist_tracks(
+        self, playlist_id, tracks, meta=None, generation=None
+    ):
+        with self._store_lock:
+            current = self._generation_locked(playlist_id)
+            if generation is None:
+                generation = current
+            elif generation != current:
+                print(f"Not caching {playlist_id}: it was edited while fetching.")
+                return
+            if meta is None and playlist_id in self._playlist_cache:
+                meta = self._playlist_cache[playlist_id][1]
+            fetched_at = time.time()
+            self._remember_playlist(playlist_id, (tracks, meta, fetched_at))
+            # Serialising thousands of tracks shouldn't hold up the caller
+            # (often the UI); the writer thread does it, in call order.
+            self._store_writes.put(
+                (playlist_id, list(tracks), meta, fetched_at, generation)
+            )
+            if self._store_writer is None:
+                self._store_writer = threading.Thread(
+                    target=self._store_write_loop, daemon=True
+                )
+                self._store_writer.start()
+
+    def _store_write_loop(self):
+        while True:
+            entry = self._store_writes.get()
+            playlist_id, tracks, meta, fetched_at, generation = entry
+            try:
+                tracks = [parse_track(t).to_dict() for t in tracks]
+            except Exception as e:
+                print(f"Error serialising playlist {playlist_id}: {e}")
+                continue
+            # Checked under the lock invalidate takes, so a put can't land after it
+            with self._store_lock:
+                if generation == self._generation_locked(playlist_id):
+                    self._track_store.put(playlist_id, tracks, meta, fetched_at)
+
+    def iter_memory_cached_tracks(self):
+        """Tracks of the playlists currently held in memory. Never touches disk."""
+        for tracks, _meta, _fetched_at in list(self._playlist_cache.values()):
+            yield from tracks
+
+    def invalidate_playlist_cache(self, playlist_id):
+        with self._store_lock:
+            self._store_generations[playlist_id] = (
+                self._store_generations.get(playlist_id, 0) + 1
+            )
+            self._playlist_cache.pop(playlist_id, None)
+            self._track_store.invalidate(playlist_id)
+
+    def _remember_playlist(self, playlist_id, entry):
+        self._playlist_cache[playlist_id] = entry
+        self._playlist_cache.move_to_end(playlist_id)
+        while len(self._playlist_cache) > self.MEMORY_CACHED_PLAYLISTS:
+            self._playlist_cache.popitem(last=False)
 
     def get_album(self, browse_id):
         if not self.api:
             return None
-        return self.api.get_album(browse_id)
+        data = self.api.get_album(browse_id)
+        # Album tracks carry no art of their own; they use the cover
+        thumbnails = (data or {}).get("thumbnails") or [{}]
+        return self._parse_track_list(data, thumbnails[-1].get("url"))
 
     def get_artist(self, channel_id):
         if not self.api:
@@ -424,7 +914,7 @@ class MusicClient:
             return []
         # Liked songs is actually a playlist 'LM'
         res = self.api.get_liked_songs(limit=limit)
-        return res
+        return self._parse_track_list(res)
 
     def get_charts(self, country="US"):
         if not self.api:
@@ -579,27 +1069,80 @@ class MusicClient:
             return False
         try:
             self.api.rate_song(video_id, rating)
+            # Liked Music ("LM") changes with every like/unlike
+            self.invalidate_playlist_cache("LM")
             return True
         except Exception as e:
             print(f"Error rating song: {e}")
             return False
 
-    def validate_session(self):
+    def validate_session(self, max_age=VALIDATION_TTL):
         """
-        Check if the current session is valid by attempting an authenticated request.
+        Checks if the current session is valid by making a lightweight authenticated request.
+        A result younger than max_age seconds is reused instead of hitting the network.
         """
         if self.api is None:
             return False
 
+        cached = self._validation
+        if cached and time.time() - cached[0] < max_age:
+            return cached[1]
+
+        is_valid = self._check_session(self.api)
+        self._validation = (time.time(), is_valid)
+        return is_valid
+
+    @staticmethod
+    def _check_session(api):
         try:
             # Try to fetch liked songs (requires auth)
             # Just metadata is enough
-            self.api.get_liked_songs(limit=1)
+            api.get_liked_songs(limit=1)
             return True
         except Exception as e:
             print(f"Session validation failed: {e}")
             return False
 
+    def validate_session_async(self, fall_back=False):
+        """
+        Validates the session on a background thread and emits
+        auth_events::session-validated on the main thread. Concurrent calls
+        share one check. With fall_back, an invalid session is replaced by the
+        fallback one: it is built on the worker, but swapped in on the main
+        thread right before the signal, so handlers see the new state.
+        """
+        with self._validation_lock:
+            if self._validating:
+                return
+            self._validating = True
+
+        checked_api = self.api
+
+        def job():
+            session = None
+            try:
+                is_valid = self.validate_session()
+                if is_valid:
+                    print("Authenticated via saved session.")
+                else:
+                    print("Saved session invalid.")
+                    session = (
+                        self._fallback_api() if fall_back else (checked_api, False)
+                    )
+            finally:
+                with self._validation_lock:
+                    self._validating = False
+            GLib.idle_add(finish, session)
+
+        def finish(session):
+            # A login that happened meanwhile wins over this (older) result
+            if session is not None and self.api is checked_api:
+                self._set_session(*session)
+            self.auth_events.emit("session-validated", self.is_authenticated())
+            return False
+
+        threading.Thread(target=job, daemon=True).start()
+
     def logout(self):
         """
         Log out by deleting the saved auth file and resetting the API.
@@ -613,6 +1156,14 @@ class MusicClient:
 
         self.api = YTMusic()
         self._is_authed = False
+        self._validation = None
+        # Cached track lists belong to the old account
+        with self._store_lock:
+            self._store_epoch += 1
+            self._store_generations.clear()
+            self._playlist_cache.clear()
+            self._track_store.clear()
+        self._library_subscriptions = []
         print("Logged out. API reset to unauthenticated mode.")
         return True
 
@@ -629,6 +1180,7 @@ class MusicClient:
                 privacyStatus=privacy,
                 moveItem=moveItem,
             )
+            self.invalidate_playlist_cache(playlist_id)
             return True
         except Exception as e:
             print(f"Error editing playlist: {e}")
@@ -639,6 +1191,7 @@ class MusicClient:
             return False
         try:
             self.api.delete_playlist(playlist_id)
+            self.invalidate_playlist_cache(playlist_id)
             return True
         except Exception as e:
             print(f"Error deleting playlist: {e}")
@@ -649,6 +1202,7 @@ class MusicClient:
             return False
         try:
             self.api.add_playlist_items(playlist_id, video_ids, duplicates=duplicates)
+            self.invalidate_playlist_cache(playlist_id)
             return True
         except Exception as e:
             print(f"Error adding to playlist: {e}")
@@ -659,6 +1213,7 @@ class MusicClient:
             return False
         try:
             self.api.remove_playlist_items(playlist_id, videos)
+            self.invalidate_playlist_cache(playlist_id)
             return True
         except Exception as e:
             print(f"Error removing from playlist: {e}")
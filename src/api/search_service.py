@@ -0,0 +1,115 @@
+import threading
+import time
+from collections import OrderedDict
+from gi.repository import GLib
+from api.client import MusicClient
+
+# Search results change slowly; this only has to cover a browsing session.
+SEARCH_TTL = 10 * 60
+MAX_CACHED_SEARCHES = 64
+
+
+class SearchService:
+    """
+    Runs MusicClient.search off the main thread for one search box.
+
+    Every search() call starts a new generation; results are handed to the
+    callback on the main loop only if no newer search was started since, so a
+    slow earlier query can never overwrite a newer one. Results are kept in an
+    LRU cache keyed by (query, filter) for SEARCH_TTL seconds, and a query that
+    is already in flight is joined instead of being sent again.
+
+    search(), cached() and cancel() must be called from the main thread.
+    """
+
+    def __init__(self, client=None, ttl=SEARCH_TTL, max_entries=MAX_CACHED_SEARCHES):
+        self.client = client or MusicClient()
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._cache = OrderedDict()  # key -> (results, fetched_at)
+        self._inflight = {}  # key -> [waiter, ...]
+        self._generation = 0
+
+    @staticmethod
+    def _key(query, filter):
+        return " ".join(query.split()).casefold(), filter
+
+    def cached(self, query, filter=None):
+        """Returns fresh cached results for the query, or None."""
+        key = self._key(query, filter)
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            results, fetched_at = entry
+            if time.monotonic() - fetched_at > self.ttl:
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return results
+
+    def search(self, query, callback, filter=None):
+        """
+        Searches for query and calls callback(results) on the main loop,
+        unless a newer search or cancel() superseded it. results is None if
+        the request failed. Cache hits are delivered before this returns.
+        """
+        self._generation += 1
+        generation = self._generation
+
+        def deliver(results):
+            if generation == self._generation:
+                callback(results)
+
+        results = self.cached(query, filter)
+        if results is not None:
+            deliver(results)
+            return
+
+        key = self._key(query, filter)
+        with self._lock:
+            waiters = self._inflight.get(key)
+            if waiters is not None:
+                waiters.append(deliver)
+                return
+            self._inflight[key] = [deliver]
+
+        thread = threading.Thread(
+            target=self._fetch, args=(key, query.strip(), filter), daemon=True
+        )
+        thread.start()
+
+    def cancel(self):
+        """Drops the results of every search started so far."""
+        self._generation += 1
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+    def _request(self, query, filter):
+        return self.client.search(query, filter=filter)
+
+    def _fetch(self, key, query, filter):
+        try:
+            results = self._request(query, filter)
+        except Exception as e:
+            print(f"Error searching for '{query}': {e}")
+            results = None
+
+        with self._lock:
+            waiters = self._inflight.pop(key, [])
+            if results is not None:
+                self._cache[key] = (results, time.monotonic())
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.max_entries:
+                    self._cache.popitem(last=False)
+
+        GLib.idle_add(self._deliver, waiters, results)
+
+    @staticmethod
+    def _deliver(waiters, results):
+        for deliver in waiters:
+            deliver(results)
+        return False
@@ -0,0 +1,213 @@
+import json
+import os
+import threading
+from bisect import bisect_left
+from collections import namedtuple
+from gi.repository import GLib
+from api.client import MusicClient, fold_text
+from api.search_service import SearchService
+
+MAX_HISTORY = 100
+REMOTE_SUGGESTION_TTL = 30 * 60
+
+# kind is one of "query" (past or remote), "artist", "playlist", "track".
+# payload carries what activating it needs: a browseId, playlistId or Track.
+Suggestion = namedtuple("Suggestion", "kind label subtitle payload")
+
+# Lower sorts first among equally good matches
+KIND_RANK = {"query": 0, "artist": 1, "playlist": 2, "track": 3}
+
+
+fold = fold_text
+
+
+class PrefixIndex:
+    """
+    Immutable sorted-array index over suggestion labels.
+
+    Labels are keyed by their start and, separately, by every later word
+    start, so "beat" finds "Beat It" first and then "The Beatles". lookup()
+    is a bisect plus a short scan per array, cheap enough to run on every
+    keystroke on the main thread.
+    """
+
+    # Keys examined per array and lookup; bounds the cost of short prefixes
+    MAX_SCAN = 500
+
+    def __init__(self, suggestions=()):
+        self._suggestions = list(suggestions)
+        labels = []
+        words = []
+        for i, suggestion in enumerate(self._suggestions):
+            label = fold(suggestion.label)
+            labels.append((label, i))
+            start = label.find(" ")
+            while start != -1:
+                words.append((label[start + 1 :], i))
+                start = label.find(" ", start + 1)
+        self._labels = self._split(labels)
+        self._words = self._split(words)
+
+    @staticmethod
+    def _split(pairs):
+        pairs.sort()
+        return [key for key, _ in pairs], [i for _, i in pairs]
+
+    def __len__(self):
+        return len(self._suggestions)
+
+    def _scan(self, keys_ids, prefix):
+        keys, ids = keys_ids
+        i = bisect_left(keys, prefix)
+        end = min(len(keys), i + self.MAX_SCAN)
+        while i < end and keys[i].startswith(prefix):
+            yield ids[i]
+            i += 1
+
+    def _rank(self, sid):
+        suggestion = self._suggestions[sid]
+        return KIND_RANK.get(suggestion.kind, 9), len(suggestion.label)
+
+    def lookup(self, prefix, limit=8):
+        prefix = fold(prefix)
+        if not prefix:
+            return []
+        results = sorted(set(self._scan(self._labels, prefix)), key=self._rank)
+        if len(results) < limit:
+            seen = set(results)
+            inner = set(self._scan(self._words, prefix)) - seen
+            results += sorted(inner, key=self._rank)
+        return [self._suggestions[sid] for sid in results[:limit]]
+
+
+class RemoteSuggestions(SearchService):
+    """get_search_suggestions with the same stale-dropping and caching."""
+
+    def __init__(self, client=None):
+        super().__init__(client, ttl=REMOTE_SUGGESTION_TTL, max_entries=256)
+
+    def _request(self, query, filter):
+        return self.client.get_search_suggestions(query)
+
+
+class SuggestionProvider:
+    """
+    As-you-type suggestions for the search box.
+
+    local() answers from two PrefixIndexes: a small one over past queries,
+    rebuilt whenever a search is committed, and one over library playlists,
+    subscribed artists and tracks of the playlists cached in memory, which
+    refresh() rebuilds off the main thread. remote holds the ytmusicapi
+    completions.
+    """
+
+    def __init__(self, client=None, history_path=None):
+        self.client = client or MusicClient()
+        self.remote = RemoteSuggestions(self.client)
+        self.history_path = history_path or os.path.join(
+            GLib.get_user_data_dir(), "muse", "search_history.json"
+        )
+        self._history = self._load_history()  # most recent first
+        self._history_index = PrefixIndex(self._history_suggestions())
+        self._library_index = PrefixIndex()
+        self._refreshing = False
+        self._save_lock = threading.Lock()
+
+    def local(self, query, limit=8):
+        results = self._history_index.lookup(query, limit)
+        if len(results) < limit:
+            shown = {fold(s.label) for s in results}
+            for suggestion in self._library_index.lookup(query, limit):
+                if fold(suggestion.label) not in shown:
+                    results.append(suggestion)
+        return results[:limit]
+
+    def add_query(self, query):
+        """Records a search the user committed to (Enter or opening a result)."""
+        query = " ".join(query.split())
+        if not query:
+            return
+        folded = fold(query)
+        self._history = [q for q in self._history if fold(q) != folded]
+        self._history.insert(0, query)
+        del self._history[MAX_HISTORY:]
+        # Only the history index: at most MAX_HISTORY labels
+        self._history_index = PrefixIndex(self._history_suggestions())
+        history = list(self._history)
+        threading.Thread(
+            target=self._save_history, args=(history,), daemon=True
+        ).start()
+
+    def refresh(self):
+        """Rebuilds the index in the background from the client's caches."""
+        if self._refreshing:
+            return
+        self._refreshing = True
+        threading.Thread(target=self._refresh_job, daemon=True).start()
+
+    def _refresh_job(self):
+        try:
+            index = PrefixIndex(self._collect_library())
+        except Exception as e:
+            print(f"Error building search suggestions: {e}")
+            index = None
+        GLib.idle_add(self._on_refreshed, index)
+
+    def _on_refreshed(self, index):
+        self._refreshing = False
+        if index is not None:
+            self._library_index = index
+        return False
+
+    def _collect_library(self):
+        client = self.client
+        suggestions = []
+        if client.is_authenticated():
+            playlists = client._library_playlists or client.get_library_playlists()
+            for p in playlists or []:
+                pid = p.get("playlistId")
+                if pid and p.get("title"):
+                    suggestions.append(
+                        Suggestion("playlist", p["title"], "Playlist", pid)
+                    )
+
+            artists = (
+                client._library_subscriptions or client.get_library_subscriptions()
+            )
+            for a in artists or []:
+                name = a.get("artist") or a.get("title")
+                if a.get("browseId") and name:
+                    suggestions.append(
+                        Suggestion("artist", name, "Artist", a["browseId"])
+                    )
+
+        seen = set()
+        for track in client.iter_memory_cached_tracks():
+            if track.video_id and track.title and track.video_id not in seen:
+                seen.add(track.video_id)
+                suggestions.append(
+                    Suggestion("track", track.title, track.artist or "Song", track)
+                )
+        return suggestions
+
+    def _history_suggestions(self):
+        return [Suggestion("query", q, "Recent search", q) for q in self._history]
+
+    def _load_history(self):
+        try:
+            with open(self.history_path) as f:
+                history = json.load(f)
+            return [q for q in history if isinstance(q, str)][:MAX_HISTORY]
+        except (OSError, ValueError):
+            return []
+
+    def _save_history(self, history):
+        with self._save_lock:
+            try:
+                os.makedirs(os.path.dirname(self.history_path), exist_ok=True)
+                tmp = self.history_path + ".tmp"
+                with open(tmp, "w") as f:
+                    json.dump(history, f)
+                os.replace(tmp, self.history_path)
+            except OSError as e:
+                print(f"Error saving search history: {e}")
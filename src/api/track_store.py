@@ -0,0 +1,147 @@
+import os
+import json
+import sqlite3
+import threading
+import time
+from gi.repository import GLib
+
+# Entries older than this are still served, but the caller should revalidate.
+DEFAULT_TTL = 6 * 3600
+MAX_PLAYLISTS = 200
+
+
+class TrackStore:
+    """
+    On-disk cache of playlist/album track lists backed by SQLite.
+
+    Each row holds the JSON track list plus page metadata (title, meta lines,
+    thumbnails...) and when it was fetched, so pages can render immediately
+    and refresh in the background once is_stale() (stale-while-revalidate).
+    The least recently opened rows are evicted beyond max_entries.
+    """
+
+    def __init__(self, path=None, ttl=DEFAULT_TTL, max_entries=MAX_PLAYLISTS):
+        if path is None:
+            data_dir = os.path.join(GLib.get_user_data_dir(), "muse")
+            os.makedirs(data_dir, exist_ok=True)
+            path = os.path.join(data_dir, "tracks.db")
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS playlists (
+                    playlist_id TEXT PRIMARY KEY,
+                    tracks TEXT NOT NULL,
+                    meta TEXT,
+                    fetched_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """)
+            self._conn.commit()
+        return self._conn
+
+    def is_stale(self, fetched_at):
+        return time.time() - fetched_at > self.ttl
+
+    def get(self, playlist_id):
+        """Returns (tracks, meta, fetched_at) or None if nothing is stored."""
+        if not playlist_id:
+            return None
+        with self._lock:
+            try:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT tracks, meta, fetched_at FROM playlists WHERE playlist_id = ?",
+                    (playlist_id,),
+                ).fetchone()
+                if row is None:
+                    return None
+                conn.execute(
+                    "UPDATE playlists SET accessed_at = ? WHERE playlist_id = ?",
+                    (time.time(), playlist_id),
+                )
+                conn.commit()
+            except Exception as e:
+                print(f"[TRACK-STORE] Read failed for {playlist_id}: {e}")
+                return None
+
+        tracks_json, meta_json, fetched_at = row
+        try:
+            tracks = json.loads(tracks_json)
+            meta = json.loads(meta_json) if meta_json else None
+        except ValueError:
+            self.invalidate(playlist_id)
+            return None
+        return tracks, meta, fetched_at
+
+    def put(self, playlist_id, tracks, meta=None, fetched_at=None):
+        """
+        Stores a complete track list. Existing meta is kept when meta is None.
+        fetched_at defaults to now; pass the time the list was actually fetched.
+        """
+        if not playlist_id or tracks is None:
+            return
+        now = time.time()
+        if fetched_at is None:
+            fetched_at = now
+        try:
+            tracks_json = json.dumps(tracks)
+            meta_json = json.dumps(meta) if meta is not None else None
+        except (TypeError, ValueError) as e:
+            print(f"[TRACK-STORE] Cannot serialise {playlist_id}: {e}")
+            return
+
+        with self._lock:
+            try:
+                conn = self._connect()
+                conn.execute(
+                    """
+                    INSERT INTO playlists (playlist_id, tracks, meta, fetched_at, accessed_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT(playlist_id) DO UPDATE SET
+                        tracks = excluded.tracks,
+                        meta = COALESCE(excluded.meta, playlists.meta),
+                        fetched_at = excluded.fetched_at,
+                        accessed_at = excluded.accessed_at
+                    """,
+                    (playlist_id, tracks_json, meta_json, fetched_at, now),
+                )
+                conn.execute(
+                    """
+                    DELETE FROM playlists WHERE playlist_id NOT IN (
+                        SELECT playlist_id FROM playlists
+                        ORDER BY accessed_at DESC LIMIT ?
+                    )
+                    """,
+                    (self.max_entries,),
+                )
+                conn.commit()
+            except Exception as e:
+                print(f"[TRACK-STORE] Write failed for {playlist_id}: {e}")
+
+    def invalidate(self, playlist_id):
+        with self._lock:
+            try:
+                conn = self._connect()
+                conn.execute(
+                    "DELETE FROM playlists WHERE playlist_id = ?", (playlist_id,)
+                )
+                conn.commit()
+            except Exception as e:
+                print(f"[TRACK-STORE] Invalidate failed for {playlist_id}: {e}")
+
+    def clear(self):
+        with self._lock:
+            try:
+                conn = self._connect()
+                conn.execute("DELETE FROM playlists")
+                conn.commit()
+            except Exception as e:
+                print(f"[TRACK-STORE] Clear failed: {e}")
@@ -34,22 +34,27 @@ def setup_logging():
     builtins.print = _custom_print
 
 
-def set_debug_logs(enabled):
-    global _debug_enabled
-    _debug_enabled = enabled
-
+def _load_config():
     config_path = _get_config_path()
-    config = {}
-
-    # Load existing config to not overwrite other settings if they exist
     if os.path.exists(config_path):
         try:
             with open(config_path, "r") as f:
-                config = json.load(f)
+                return json.load(f)
         except Exception:
             pass
+    return {}
+
+
+def get_setting(key, default=None):
+    return _load_config().get(key, default)
 
-    config["debug_logs"] = enabled
+
+def set_setting(key, value):
+    config_path = _get_config_path()
+
+    # Load existing config to not overwrite other settings if they exist
+    config = _load_config()
+    config[key] = value
 
     os.makedirs(os.path.dirname(config_path), exist_ok=True)
     try:
@@ -59,5 +64,11 @@ def set_debug_logs(enabled):
         _original_print(f"Failed to save settings: {e}")
 
 
+def set_debug_logs(enabled):
+    global _debug_enabled
+    _debug_enabled = enabled
+    set_setting("debug_logs", enabled)
+
+
 def get_debug_logs():
     return _debug_enabled
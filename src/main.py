@@ -1,3 +1,4 @@
+import startup_trace
 import sys
 import gi
 
@@ -10,6 +11,7 @@ import os
 import logger
 
 logger.setup_logging()
+startup_trace.mark("imports")
 
 
 class MusicApp(Adw.Application):
@@ -37,9 +39,13 @@ class MusicApp(Adw.Application):
             Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
         )
 
+        startup_trace.mark("css")
+
         win = self.props.active_window
         if not win:
             win = MainWindow(application=self)
+            startup_trace.mark("main window")
+            startup_trace.watch_first_frame(win)
         win.present()
 
 
@@ -0,0 +1,251 @@
+import json
+import os
+import queue
+import threading
+import time
+from urllib.parse import urlparse, parse_qs
+import urllib3
+from gi.repository import GLib
+from ui.image_loader import DEFAULT_HEADERS
+import logger
+
+DEFAULT_MAX_MB = 2048
+# googlevideo throttles large single requests; fetch in ranges like yt-dlp does
+CHUNK_SIZE = 10 * 1024 * 1024
+# Index changes within this many seconds are written out together
+SAVE_DELAY = 2.0
+
+_EXTENSIONS = {"audio/webm": "webm", "audio/mp4": "m4a"}
+
+
+def _extension_for(url):
+    mime = parse_qs(urlparse(url).query).get("mime", [""])[0]
+    return _EXTENSIONS.get(mime, "audio")
+
+
+class AudioCache:
+    """
+    On-disk cache of audio streams keyed by videoId.
+
+    index.json maps videoId -> {file, size, accessed, pinned}. Unpinned
+    entries are evicted least-recently-played first once the total exceeds
+    the byte budget; pinned entries (offline playlists) are never evicted.
+    Downloads run one at a time on a background worker.
+
+    lookup() is a pure in-memory read, safe on the main and streaming threads.
+    Index changes are written out on a timer thread, coalesced over SAVE_DELAY.
+    """
+
+    def __init__(self, root=None):
+        self.root = root or os.path.join(GLib.get_user_cache_dir(), "mixtapes", "audio")
+        # Whether played tracks are cached automatically; kept in step by
+        # Player.set_audio_cache so the hot paths never read config.json.
+        self.enabled = logger.get_setting("audio_cache", False)
+        self.max_bytes = (
+            int(logger.get_setting("audio_cache_max_mb", DEFAULT_MAX_MB)) * 1024 * 1024
+        )
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()  # serialises index.json writes
+        self._save_timer = None
+        self._index = None
+        self._queue = queue.Queue()
+        self._queued = set()
+        self._thread = None
+        self._http = urllib3.PoolManager(num_pools=4, headers=DEFAULT_HEADERS)
+
+    def _index_path(self):
+        return os.path.join(self.root, "index.json")
+
+    def _ensure_loaded(self):
+        if self._index is not None:
+            return
+        self._index = {}
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            with open(self._index_path(), "r") as f:
+                index = json.load(f)
+            for video_id, meta in index.items():
+                if os.path.exists(os.path.join(self.root, meta["file"])):
+                    self._index[video_id] = meta
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"[AUDIO-CACHE] Failed to load index: {e}")
+
+    def _save_soon_locked(self):
+        if self._save_timer is None:
+            self._save_timer = threading.Timer(SAVE_DELAY, self._save)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _save(self):
+        with self._lock:
+            self._save_timer = None
+            data = json.dumps(self._index)
+        with self._save_lock:
+            tmp = self._index_path() + ".tmp"
+            try:
+                with open(tmp, "w") as f:
+                    f.write(data)
+                os.replace(tmp, self._index_path())
+            except Exception as e:
+                print(f"[AUDIO-CACHE] Failed to save index: {e}")
+
+    def lookup(self, video_id):
+        """Returns the local file for video_id, or None. Never writes."""
+        if not video_id:
+            return None
+        with self._lock:
+            self._ensure_loaded()
+            meta = self._index.get(video_id)
+        if not meta:
+            return None
+        path = os.path.join(self.root, meta["file"])
+        # A vanished file is dropped from the index on the next load
+        return path if os.path.exists(path) else None
+
+    def mark_played(self, video_id):
+        """Moves video_id to the recent end of the LRU. Call when it is played."""
+        with self._lock:
+            self._ensure_loaded()
+            meta = self._index.get(video_id)
+            if meta:
+                meta["accessed"] = time.time()
+                self._save_soon_locked()
+
+    def is_pinned(self, video_id):
+        with self._lock:
+            self._ensure_loaded()
+            meta = self._index.get(video_id)
+            return bool(meta and meta.get("pinned"))
+
+    def unpin(self, video_ids):
+        """Releases offline copies; they become normal (evictable) entries."""
+        with self._lock:
+            self._ensure_loaded()
+            for video_id in video_ids:
+                meta = self._index.get(video_id)
+                if meta:
+                    meta["pinned"] = False
+            if not self.enabled:
+                # Nothing else is going to use them
+                for video_id in video_ids:
+                    self._remove_locked(video_id)
+            self._evict_locked()
+            self._save_soon_locked()
+
+    def request(self, video_id, resolve, pin=False):
+        """
+        Queues a download of video_id. resolve(video_id) is called on the
+        worker and must return a stream URL. Already cached tracks are only
+        (re)pinned.
+        """
+        if not video_id:
+            return
+        with self._lock:
+            self._ensure_loaded()
+            meta = self._index.get(video_id)
+            if meta:
+                if pin and not meta.get("pinned"):
+                    meta["pinned"] = True
+                    self._save_soon_locked()
+                return
+            if video_id in self._queued:
+                return
+            self._queued.add(video_id)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._worker, name="audio-cache", daemon=True
+                )
+                self._thread.start()
+        self._queue.put((video_id, resolve, pin))
+
+    def _worker(self):
+        while True:
+            video_id, resolve, pin = self._queue.get()
+            try:
+                self._download(video_id, resolve(video_id), pin)
+            except Exception as e:
+                print(f"[AUDIO-CACHE] Download failed for {video_id}: {e}")
+            finally:
+                with self._lock:
+                    self._queued.discard(video_id)
+
+    def _download(self, video_id, url, pin):
+        name = f"{video_id}.{_extension_for(url)}"
+        path = os.path.join(self.root, name)
+        part = path + ".part"
+        os.makedirs(self.root, exist_ok=True)
+
+        try:
+            size = 0
+            with open(part, "wb") as f:
+                while True:
+                    resp = self._http.request(
+                        "GET",
+                        url,
+                        headers={"Range": f"bytes={size}-{size + CHUNK_SIZE - 1}"},
+                        preload_content=False,
+                        timeout=30,
+                    )
+                    try:
+                        if resp.status not in (200, 206):
+                            raise Exception(f"HTTP {resp.status}")
+                        start = size
+                        for block in resp.stream(256 * 1024):
+                            f.write(block)
+                            size += len(block)
+                        # "bytes 0-10485759/4123456"; a 200 is the whole file
+                        total = resp.headers.get("Content-Range", "").rpartition("/")[2]
+                        done = (
+                            resp.status == 200
+                            or size == start
+                            or not total.isdigit()
+                            or size >= int(total)
+                        )
+                    finally:
+                        resp.release_conn()
+                    if done:
+                        break
+        except Exception:
+            try:
+                os.remove(part)
+            except OSError:
+                pass
+            raise
+
+        os.replace(part, path)
+        with self._lock:
+            self._ensure_loaded()
+            self._index[video_id] = {
+                "file": name,
+                "size": size,
+                "accessed": time.time(),
+                "pinned": pin,
+            }
+            self._evict_locked()
+            self._save_soon_locked()
+        print(f"[AUDIO-CACHE] Stored {video_id} ({size // 1024} KB)")
+
+    def _remove_locked(self, video_id):
+        meta = self._index.pop(video_id, None)
+        if meta:
+            try:
+                os.remove(os.path.join(self.root, meta["file"]))
+            except OSError:
+                pass
+
+    def _evict_locked(self):
+        total = sum(m.get("size", 0) for m in self._index.values())
+        if total <= self.max_bytes:
+            return
+        candidates = sorted(
+            (m.get("accessed", 0), vid)
+            for vid, m in self._index.items()
+            if not m.get("pinned")
+        )
+        for _, video_id in candidates:
+            if total <= self.max_bytes:
+                break
+            total -= self._index[video_id].get("size", 0)
+            self._remove_locked(video_id)
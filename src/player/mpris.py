@@ -13,7 +13,6 @@ class MuseMprisAdapter(MprisAdapter):
     def __init__(self, player):
         super().__init__(name="Mixtapes")
         self.player = player
-        self._last_pos = 0
 
     # RootAdapter
     def can_quit(self) -> bool:
@@ -80,7 +79,6 @@ class MuseMprisAdapter(MprisAdapter):
 
     def seek(self, time: Position, track_id=None):
         # Position is in microseconds
-        self._last_pos = time
         self.player.seek(time / 1_000_000.0)
 
     def get_playstate(self) -> PlayState:
@@ -88,7 +86,7 @@ class MuseMprisAdapter(MprisAdapter):
             state = self.player.get_state_string()
             if state == "playing":
                 return PlayState.PLAYING
-            elif state == "loading":
+            elif state in ("loading", "buffering"):
                 # Reporting as PLAYING during loading for smoother UI transitions
                 return PlayState.PLAYING
             elif state == "paused":
@@ -100,17 +98,9 @@ class MuseMprisAdapter(MprisAdapter):
             return PlayState.STOPPED
 
     def get_current_position(self) -> Position:
-        # returns microseconds
-        try:
-            # Gst.Format.TIME is 3
-            ret, pos = self.player.player.query_position(Gst.Format.TIME)
-            if ret:
-                self._last_pos = pos // 1000
-                return self._last_pos
-        except Exception as e:
-            # Silently fail position query if player is busy/loading
-            pass
-        return self._last_pos
+        # returns microseconds; the player keeps this cached, so D-Bus
+        # queries never touch the pipeline
+        return int(self.player.get_position() * 1_000_000)
 
     def get_volume(self) -> Volume:
         try:
@@ -182,29 +172,12 @@ class MuseMprisAdapter(MprisAdapter):
 
             track = self.player.queue[self.player.current_queue_index]
 
-            # Artist normalization
-            artist = track.get("artist", "")
-            if not artist and "artists" in track:
-                artists_list = track.get("artists", [])
-                if isinstance(artists_list, list):
-                    artist = ", ".join(
-                        [a.get("name", "") for a in artists_list if "name" in a]
-                    )
-                elif isinstance(artists_list, str):
-                    artist = artists_list
-
-            if not artist:
-                artist = "Unknown Artist"
-
-            # Thumb normalization
-            thumb = track.get("thumb")
-            if not thumb and "thumbnails" in track:
-                thumbs = track.get("thumbnails", [])
-                if thumbs:
-                    thumb = thumbs[-1].get("url")
+            # Queue entries are normalised Track records
+            artist = track.artist or "Unknown Artist"
+            thumb = track.thumb
 
             # Sanitize videoId for D-Bus object path (hyphens -> underscores)
-            video_id = track.get("videoId", "unknown")
+            video_id = track.video_id or "unknown"
             # D-Bus path components must not start with a digit and only contain [A-Z, a-z, 0-9, _]
             safe_id = video_id.replace("-", "_").replace(".", "_")
             if safe_id[0].isdigit():
@@ -215,7 +188,7 @@ class MuseMprisAdapter(MprisAdapter):
                 "mpris:length": int(self.player.duration * 1_000_000)
                 if self.player.duration > 0
                 else 0,
-                "xesam:title": track.get("title", "Unknown Title"),
+                "xesam:title": track.title,
                 "xesam:artist": [artist],
             }
 
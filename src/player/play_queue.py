@@ -0,0 +1,234 @@
+import itertools
+from gi.repository import GObject
+
+
+class PlayQueue(GObject.Object):
+    """
+    The play queue: an ordered list of Track records plus the current position.
+
+    Each entry gets a stable uid when it is added, so views and pending
+    gapless transitions can follow an entry through edits. A videoId index
+    makes membership tests and lookups O(1). uid positions are kept up to
+    date on appends (the common streaming case) and rebuilt lazily after
+    other structural changes.
+
+    Edits are reported as deltas so views can patch their models in place:
+    inserted(position, n), removed(position, n), moved(old, new) and
+    current-changed(position), and updated(position) when an entry's record
+    is swapped for a corrected copy. "reset" means the whole order changed
+    (a new queue or a shuffle) and views should rebuild.
+
+    Reading works like a list: len(), indexing, slicing and iteration yield
+    the Track records.
+    """
+
+    __gsignals__ = {
+        "inserted": (GObject.SignalFlags.RUN_FIRST, None, (int, int)),
+        "removed": (GObject.SignalFlags.RUN_FIRST, None, (int, int)),
+        "moved": (GObject.SignalFlags.RUN_FIRST, None, (int, int)),
+        "current-changed": (GObject.SignalFlags.RUN_FIRST, None, (int,)),
+        "updated": (GObject.SignalFlags.RUN_FIRST, None, (int,)),
+        "reset": (GObject.SignalFlags.RUN_FIRST, None, ()),
+    }
+
+    def __init__(self):
+        super().__init__()
+        self._tracks = []
+        self._uids = []
+        self._by_uid = {}  # uid -> track
+        self._by_video = {}  # videoId -> [uid, ...] in insertion order
+        self._positions = None  # uid -> position, None when out of date
+        self._next_uid = itertools.count(1)
+        self._current = -1
+
+    # --- List protocol ---
+
+    def __len__(self):
+        return len(self._tracks)
+
+    def __bool__(self):
+        return bool(self._tracks)
+
+    def __getitem__(self, index):
+        return self._tracks[index]
+
+    def __iter__(self):
+        return iter(self._tracks)
+
+    # --- Lookups ---
+
+    @property
+    def current(self):
+        return self._current
+
+    def set_current(self, position):
+        """Moves the current marker. Emits current-changed if it moved."""
+        if position == self._current:
+            return
+        self._current = position
+        self.emit("current-changed", position)
+
+    def current_track(self):
+        if 0 <= self._current < len(self._tracks):
+            return self._tracks[self._current]
+        return None
+
+    def uid_at(self, position):
+        if 0 <= position < len(self._uids):
+            return self._uids[position]
+        return 0
+
+    def uids(self):
+        """The entries' uids in queue order."""
+        return list(self._uids)
+
+    def position_of(self, uid):
+        """Current position of the entry with this uid, or -1."""
+        if self._positions is None:
+            self._positions = {uid: i for i, uid in enumerate(self._uids)}
+        return self._positions.get(uid, -1)
+
+    def contains(self, video_id):
+        return video_id in self._by_video
+
+    def find(self, video_id):
+        """Position of the first entry for video_id, or -1."""
+        uids = self._by_video.get(video_id)
+        if not uids:
+            return -1
+        return min(self.position_of(uid) for uid in uids)
+
+    def tracks_for(self, video_id):
+        """All queued records for video_id (a track can be queued twice)."""
+        return [self._by_uid[uid] for uid in self._by_video.get(video_id, ())]
+
+    # --- Edits ---
+
+    def _add_entries(self, tracks):
+        uids = []
+        for track in tracks:
+            uid = next(self._next_uid)
+            uids.append(uid)
+            self._by_uid[uid] = track
+            video_id = track.video_id
+            if video_id:
+                self._by_video.setdefault(video_id, []).append(uid)
+        return uids
+
+    def _drop_entry(self, uid):
+        track = self._by_uid.pop(uid)
+        video_id = track.video_id
+        uids = self._by_video.get(video_id)
+        if uids:
+            uids.remove(uid)
+            if not uids:
+                del self._by_video[video_id]
+        return track
+
+    def update(self, video_id, **changes):
+        """
+        Replaces every entry for video_id with a copy carrying changes
+        (Track.replace). Returns True if anything changed.
+        """
+        changed = False
+        for uid in self._by_video.get(video_id, ()):
+            track = self._by_uid[uid]
+            if all(getattr(track, k) == v for k, v in changes.items()):
+                continue
+            track = track.replace(**changes)
+            self._by_uid[uid] = track
+            position = self.position_of(uid)
+            self._tracks[position] = track
+            changed = True
+            self.emit("updated", position)
+        return changed
+
+    def reset(self, tracks, current=-1):
+        """Replaces the whole queue."""
+        self._by_uid.clear()
+        self._by_video.clear()
+        self._tracks = list(tracks)
+        self._uids = self._add_entries(self._tracks)
+        self._positions = None
+        self._current = current
+        self.emit("reset")
+        self.emit("current-changed", current)
+
+    def reorder(self, uids, current=-1):
+        """
+        Puts the existing entries in the order given by uids, which must be a
+        permutation of uids(). Entries keep their uid and record.
+        """
+        self._uids = list(uids)
+        self._tracks = [self._by_uid[uid] for uid in self._uids]
+        self._positions = None
+        self._current = current
+        self.emit("reset")
+        self.emit("current-changed", current)
+
+    def clear(self):
+        self.reset([], -1)
+
+    def insert(self, position, tracks):
+        """Inserts tracks before position."""
+        tracks = list(tracks)
+        if not tracks:
+            return
+        position = max(0, min(position, len(self._tracks)))
+        uids = self._add_entries(tracks)
+        if position == len(self._tracks) and self._positions is not None:
+            # Appending shifts nothing; index just the new entries
+            for i, uid in enumerate(uids, position):
+                self._positions[uid] = i
+        else:
+            self._positions = None
+        self._tracks[position:position] = tracks
+        self._uids[position:position] = uids
+        self.emit("inserted", position, len(tracks))
+        if position <= self._current:
+            self.set_current(self._current + len(tracks))
+
+    def extend(self, tracks):
+        self.insert(len(self._tracks), tracks)
+
+    def pop(self, position):
+        """
+        Removes and returns the track at position. Removing the current entry
+        makes the one after it current (or -1 at the end of the queue).
+        """
+        if position < 0:
+            position += len(self._tracks)
+        track = self._tracks.pop(position)
+        uid = self._uids.pop(position)
+        self._drop_entry(uid)
+        if position == len(self._tracks) and self._positions is not None:
+            del self._positions[uid]
+        else:
+            self._positions = None
+        self.emit("removed", position, 1)
+        if position < self._current:
+            self.set_current(self._current - 1)
+        elif position == self._current:
+            if self._current >= len(self._tracks):
+                self._current = -1
+            # Same index, different entry: always notify
+            self.emit("current-changed", self._current)
+        return track
+
+    def move(self, old, new):
+        """Moves the entry at old so that it ends up at position new."""
+        if old == new:
+            return
+        self._tracks.insert(new, self._tracks.pop(old))
+        self._uids.insert(new, self._uids.pop(old))
+        self._positions = None
+        self.emit("moved", old, new)
+
+        current = self._current
+        if current == old:
+            current = new
+        elif old < current <= new:
+            current -= 1
+        elif new <= current < old:
+            current += 1
+        self.set_current(current)
@@ -5,12 +5,32 @@ import os
 
 gi.require_version("Gst", "1.0")
 from gi.repository import Gst, GObject, GLib, GdkPixbuf
-import urllib.request
-from yt_dlp import YoutubeDL
-from mprisify.server import Server
 from ui.utils import get_high_res_url, get_ytimg_fallbacks
-from player.mpris import MuseMprisAdapter, MuseEventAdapter
-from api.client import MusicClient
+from ui.image_loader import fetch_image_bytes
+from player.resolver import (
+    StreamCache,
+    ResolverPool,
+    ResolveCancelled,
+    build_format,
+    DEFAULT_MAX_ABR,
+    LOW_BANDWIDTH_ABR,
+)
+from player.audio_cache import AudioCache
+from player.play_queue import PlayQueue
+from api.client import MusicClient, Track, parse_track, parse_tracks
+import time
+import logger
+import startup_trace
+
+# Seconds of audio playbin buffers ahead on network streams
+DEFAULT_BUFFER_DURATION = 5
+# After an underrun, playback resumes once the buffer is this full (percent)
+DEFAULT_BUFFER_LOW_WATERMARK = 30
+# Buffering shorter than this (ms) is not reported as a state change
+BUFFERING_STATE_DELAY = 300
+# Progress rate (ms) while playing with no progress widget on screen; keeps
+# the cached position fresh for MPRIS
+IDLE_PROGRESS_INTERVAL = 1000
 
 
 class Player(GObject.Object):
@@ -35,6 +55,16 @@ class Player(GObject.Object):
             None,
             (float, bool),
         ),  # volume, muted
+        "buffering": (
+            GObject.SignalFlags.RUN_FIRST,
+            None,
+            (int,),
+        ),  # percent (100 when not buffering)
+        "stream-info-changed": (
+            GObject.SignalFlags.RUN_FIRST,
+            None,
+            (str, str, int, bool),
+        ),  # itag, codec, bitrate (kbps), is_local
     }
 
     def __init__(self):
@@ -42,8 +72,15 @@ class Player(GObject.Object):
         Gst.init(None)
         self.client = MusicClient()
         self.player = Gst.ElementFactory.make("playbin", "player")
+        # Format policy, see resolver.build_format
+        self.low_bandwidth = logger.get_setting("low_bandwidth", False)
+        self.max_audio_bitrate = logger.get_setting(
+            "max_audio_bitrate", DEFAULT_MAX_ABR
+        )
+        self.stream_info = {}  # itag/codec/bitrate of the playing stream
+
         self.ydl_opts = {
-            "format": "bestaudio/best",
+            "format": self._stream_format(),
             "quiet": True,
             "noplaylist": True,
             "extract_flat": False,
@@ -55,16 +92,48 @@ class Player(GObject.Object):
         self.bus.add_signal_watch()
         self.bus.connect("message", self.on_message)
 
+        # Gapless: queue the next resolved URI from playbin's streaming thread
+        # instead of tearing the pipeline down on EOS.
+        self.gapless_enabled = logger.get_setting("gapless_playback", True)
+        # (queue entry uid, videoId, stream entry) handed to playbin
+        self._gapless_pending = None
+        self.player.connect("about-to-finish", self._on_about_to_finish)
+
+        # Network buffering: playback pauses when playbin's queue underruns
+        # and resumes once it is refilled to the low watermark.
+        self._want_playing = False  # What the user asked for, buffering aside
+        self._is_buffering = False  # Paused by us waiting for data
+        self._buffer_underrun = False  # playbin reports < 100% since last full
+        self._buffering_visible = False  # Lasted long enough to report
+        self.buffer_percent = 100
+        self.apply_buffer_settings()
+
         self.current_video_id = None
 
+        # Resolved stream URLs for the current and upcoming tracks
+        self.stream_cache = StreamCache()
+        # Optional local copies of played/pinned tracks
+        self.audio_cache = AudioCache()
+        # yt-dlp runs in worker processes shared by playback and prefetch
+        self.resolver = ResolverPool(self.ydl_opts)
+        self.prefetch_count = 2  # Upcoming queue entries to resolve ahead
+        self._is_prefetching = False
+        self._resolving = {}  # videoId -> Event, coalesces concurrent extractions
+        self._resolving_lock = threading.Lock()
+
         # Queue State
-        self.queue = []  # List of dicts: {id, title, artist, thumb, ...}
-        self.current_queue_index = -1
+        self.queue = PlayQueue()  # api.client.Track records
         self.shuffle_mode = False
-        self.original_queue = []  # Backup for un-shuffle
+        self.original_queue = []  # Queue uids in unshuffled order
         self.load_generation = 0  # To handle race conditions in loading
         self.mpris_art_url = None
-        self.current_url = None
+        self.current_url = None  # Resolved stream URL handed to playbin
+        self.current_url_expire = None  # When current_url stops working
+        self._stream_refresh_timer = None
+        self._stream_refreshes = 0  # 403 recoveries for the current track
+        self._is_refreshing_stream = False
+        self._pending_seek = None  # (position, resume) applied on ASYNC_DONE
+        self._last_position = 0.0
         self.last_seek_time = 0.0
         self.duration = -1
         self._is_loading = False
@@ -76,23 +145,40 @@ class Player(GObject.Object):
         self.queue_is_infinite = False
         self._is_fetching_infinite = False
 
-        # Timer for progress
-        GObject.timeout_add(100, self.update_position)
+        # Progress updates: only run while playing, at the finest rate any
+        # visible widget asked for (see request_progress)
+        self._progress_subscribers = {}  # owner -> interval (ms)
+        self._progress_timer = None
+        self._progress_interval = None
+        self._progress_suspended = False
 
-        # MPRIS Setup
-        self.mpris_adapter = MuseMprisAdapter(self)
-        self.mpris_server = Server("Mixtapes", adapter=self.mpris_adapter)
-        self.mpris_events = MuseEventAdapter(
-            self.mpris_server.root, self.mpris_server.player
-        )
-        self.mpris_server.set_event_adapter(self.mpris_events)
-        self.mpris_server.loop(background=True)
+        # MPRIS is not needed for the first frame; set it up once the main
+        # loop is idle (after the window has been presented).
+        GLib.idle_add(self._setup_mpris)
+
+    def _setup_mpris(self):
+        from mprisify.server import Server
+        from player.mpris import MuseMprisAdapter, MuseEventAdapter
+
+        try:
+            self.mpris_adapter = MuseMprisAdapter(self)
+            self.mpris_server = Server("Mixtapes", adapter=self.mpris_adapter)
+            self.mpris_events = MuseEventAdapter(
+                self.mpris_server.root, self.mpris_server.player
+            )
+            self.mpris_server.set_event_adapter(self.mpris_events)
+            self.mpris_server.loop(background=True)
+        except Exception as e:
+            print(f"MPRIS setup failed: {e}")
+            return False
 
         # Connect signals for MPRIS updates
         self.connect("state-changed", self._on_mpris_state_changed)
         self.connect("metadata-changed", self._on_mpris_metadata_changed)
         self.connect("progression", self._on_mpris_progression)
         self.connect("volume-changed", self._on_mpris_volume_changed)
+        startup_trace.mark("mpris")
+        return False
 
     def _on_mpris_state_changed(self, obj, state):
         print(f"DEBUG-MPRIS-STATE-START: state={state}")
@@ -120,18 +206,22 @@ class Player(GObject.Object):
         pass
 
     def _on_mpris_volume_changed(self, obj, volume, muted):
-        self.mpris_events.on_volume()
+        if hasattr(self, "mpris_events"):
+            self.mpris_events.on_volume()
+
+    @property
+    def current_queue_index(self):
+        return self.queue.current
+
+    @current_queue_index.setter
+    def current_queue_index(self, index):
+        self.queue.set_current(index)
 
     def load_video(
         self, video_id, title="Loading...", artist="Unknown", thumbnail_url=None
     ):
         """Legacy/Single-track load. Clears queue and plays this one."""
-        track = {
-            "videoId": video_id,
-            "title": title,
-            "artist": artist,  # String or list, normalized later
-            "thumb": thumbnail_url,
-        }
+        track = Track(video_id, title, artist=artist, thumb=thumbnail_url)
         self.set_queue([track])
 
     def play_tracks(self, tracks):
@@ -143,38 +233,33 @@ class Player(GObject.Object):
     ):
         """
         Sets the global queue and plays the track at start_index.
-        tracks: list of dicts with videoId, title, artist, thumb
+        tracks: Track records (raw ytmusicapi dicts are parsed)
         """
         self.stop()
-        self.queue = list(tracks)  # Copy for playing
-        self.original_queue = list(tracks)  # Backup for un-shuffle
+        tracks = parse_tracks(tracks)  # Copy for playing
         self.shuffle_mode = shuffle  # Set mode based on request
         self.queue_source_id = source_id
         self.queue_is_infinite = is_infinite
         self._is_fetching_infinite = False
 
-        target_track = (
-            self.queue[start_index] if 0 <= start_index < len(self.queue) else None
-        )
-
         if shuffle:
-            import random
-
             # If start_index is valid, we want to play that track FIRST, then shuffle the rest.
-            if target_track:
-                # Remove target
-                self.queue.remove(target_track)
-                # Shuffle rest
-                random.shuffle(self.queue)
-                # Insert target at 0
-                self.queue.insert(0, target_track)
-                self.current_queue_index = 0
+            order = list(range(len(tracks)))
+            if 0 <= start_index < len(tracks):
+                order.pop(start_index)
+                random.shuffle(order)
+                order.insert(0, start_index)
             else:
-                random.shuffle(self.queue)
-                self.current_queue_index = 0
-            # Note: original_queue remains ordered as passed
+                random.shuffle(order)
+            self.queue.reset([tracks[i] for i in order], 0)
+            # original_queue stays ordered as passed
+            uids = self.queue.uids()
+            self.original_queue = [0] * len(uids)
+            for uid, i in zip(uids, order):
+                self.original_queue[i] = uid
         else:
-            self.current_queue_index = start_index
+            self.queue.reset(tracks, start_index)
+            self.original_queue = self.queue.uids()
 
         if self.current_queue_index >= 0 and self.current_queue_index < len(self.queue):
             self._play_current_index()
@@ -184,14 +269,16 @@ class Player(GObject.Object):
 
     def add_to_queue(self, track, next=False):
         """Adds a track to the queue. if next=True, inserts after current."""
+        track = parse_track(track)
         if next and self.current_queue_index >= 0:
-            self.queue.insert(self.current_queue_index + 1, track)
+            position = self.current_queue_index + 1
+            self.queue.insert(position, [track])
             self.original_queue.insert(
-                self.current_queue_index + 1, track
+                position, self.queue.uid_at(position)
             )  # Keep sync roughly
         else:
-            self.queue.append(track)
-            self.original_queue.append(track)
+            self.queue.extend([track])
+            self.original_queue.append(self.queue.uid_at(len(self.queue) - 1))
 
         # If nothing is playing, play this
         if self.current_queue_index == -1:
@@ -200,21 +287,19 @@ class Player(GObject.Object):
 
     def remove_from_queue(self, index):
         if 0 <= index < len(self.queue):
-            pop = self.queue.pop(index)
-            # Adjust current index
-            if index < self.current_queue_index:
-                self.current_queue_index -= 1
-            elif index == self.current_queue_index:
+            was_current = index == self.current_queue_index
+            uid = self.queue.uid_at(index)
+            # The queue shifts the current index itself
+            self.queue.pop(index)
+            if was_current:
                 # We removed the playing track. Play next?
-                if self.current_queue_index < len(self.queue):
+                if self.current_queue_index >= 0:
                     self._play_current_index()
                 else:
                     self.stop()
-                    self.current_queue_index = -1
 
-            # Remove from original if present (simplified)
-            if pop in self.original_queue:
-                self.original_queue.remove(pop)
+            if uid in self.original_queue:
+                self.original_queue.remove(uid)
 
     def move_queue_item(self, old_index, new_index):
         if 0 <= old_index < len(self.queue) and 0 <= new_index < len(self.queue):
@@ -224,18 +309,8 @@ class Player(GObject.Object):
             if old_index < new_index:
                 insert_index -= 1
 
-            item = self.queue.pop(old_index)
-            self.queue.insert(insert_index, item)
-
-            # Update current_queue_index
-            # This is tricky. Let's just re-find the playing track if possible, or simple math.
-            # The Simple math in question:
-            if self.current_queue_index == old_index:
-                self.current_queue_index = insert_index
-            elif old_index < self.current_queue_index <= insert_index:
-                self.current_queue_index -= 1
-            elif insert_index <= self.current_queue_index < old_index:
-                self.current_queue_index += 1
+            # Also keeps current_queue_index on the playing track
+            self.queue.move(old_index, insert_index)
 
             # Notify UI
             self.emit("state-changed", "queue-updated")
@@ -244,9 +319,8 @@ class Player(GObject.Object):
 
     def clear_queue(self):
         self.stop()
-        self.queue = []
+        self.queue.clear()
         self.original_queue = []
-        self.current_queue_index = -1
         self.current_video_id = None
         self.emit("state-changed", "stopped")
         self.emit("metadata-changed", "", "", "", "", "INDIFFERENT")
@@ -323,24 +397,16 @@ class Player(GObject.Object):
             # Enable Shuffle
             self.shuffle_mode = True
             if self.queue:
-                current = (
-                    self.queue[self.current_queue_index]
-                    if self.current_queue_index >= 0
-                    else None
-                )
+                current = self.queue.uid_at(self.current_queue_index)
 
                 # Shuffle the list
-                remaining = [
-                    t for i, t in enumerate(self.queue) if i != self.current_queue_index
-                ]
+                remaining = [uid for uid in self.queue.uids() if uid != current]
                 random.shuffle(remaining)
 
                 if current:
-                    self.queue = [current] + remaining
-                    self.current_queue_index = 0
+                    self.queue.reorder([current] + remaining, 0)
                 else:
-                    self.queue = remaining
-                    self.current_queue_index = -1
+                    self.queue.reorder(remaining, -1)
         else:
             # Disable Shuffle (Restore original order)
             self.shuffle_mode = False
@@ -348,15 +414,15 @@ class Player(GObject.Object):
             if self.current_queue_index >= 0 and self.current_queue_index < len(
                 self.queue
             ):
-                current = self.queue[self.current_queue_index]
-                self.queue = list(self.original_queue)
+                current = self.queue.uid_at(self.current_queue_index)
                 # Restore index
-                try:
-                    self.current_queue_index = self.queue.index(current)
-                except ValueError:
-                    self.current_queue_index = 0  # Fallback
+                index = next(
+                    (i for i, uid in enumerate(self.original_queue) if uid == current),
+                    0,  # Fallback
+                )
+                self.queue.reorder(self.original_queue, index)
             else:
-                self.queue = list(self.original_queue)
+                self.queue.reorder(self.original_queue, -1)
 
         # Emit signal to update UI
         self.emit("state-changed", "queue-updated")
@@ -368,52 +434,40 @@ class Player(GObject.Object):
             if hasattr(self, "mpris_events"):
                 self.mpris_events.on_options()
 
+    def _normalize_track(self, track):
+        """
+        Playback strings for a queue entry.
+        Returns (video_id, title, artist, thumb, like_status).
+        """
+        thumb = track.thumb or ""
+        if "ytimg.com" in thumb:
+            thumb = get_high_res_url(thumb)
+
+        return (
+            track.video_id or "",
+            track.title,
+            track.artist or "Unknown",
+            thumb,
+            track.like_status,
+        )
+
     def _play_current_index(self):
         if 0 <= self.current_queue_index < len(self.queue):
             track = self.queue[self.current_queue_index]
-            video_id = str(track.get("videoId") or "")
-            title = str(track.get("title") or "Unknown")
-            artist = track.get("artist", "")
-            thumb = track.get("thumb")
-            like_status = str(track.get("likeStatus") or "INDIFFERENT")
+            video_id, title, artist, thumb, like_status = self._normalize_track(track)
 
             print(
                 f"DEBUG-PLAY: index={self.current_queue_index} video_id={video_id}",
                 flush=True,
             )
 
-            # Metadata Normalization & Persistence
-            # Handle raw ytmusicapi data and ensure persistent strings in the queue
-            if not artist and track.get("artists"):
-                artist = ", ".join(
-                    [str(a.get("name", "")) for a in track.get("artists") if a]
-                )
-
-            if isinstance(artist, list):
-                artist = ", ".join([str(a.get("name", "")) for a in artist])
-
-            artist = str(artist or "Unknown")
-
-            if not thumb and track.get("thumbnails"):
-                thumbs = track.get("thumbnails")
-                if thumbs:
-                    thumb = thumbs[-1]["url"]
-
-            thumb = str(thumb or "")
-            if "ytimg.com" in thumb:
-                thumb = get_high_res_url(thumb)
-
-            # SAVE BACK TO QUEUE to ensure UI refreshes (like fallbacks) use normalized strings
-            track["artist"] = artist
-            track["title"] = title
-            track["thumb"] = thumb
-
             self._load_internal(video_id, title, artist, thumb, like_status)
 
     def _load_internal(
         self, video_id, title, artist, thumbnail_url, like_status="INDIFFERENT"
     ):
         self.current_video_id = video_id
+        self._gapless_pending = None
 
         self._is_loading = True
         try:
@@ -461,9 +515,7 @@ class Player(GObject.Object):
         """Appends new tracks to the queue (and original_queue)."""
         if not tracks:
             return
-
-        # Append to original queue always
-        self.original_queue.extend(tracks)
+        tracks = parse_tracks(tracks)
 
         if self.shuffle_mode:
             # Smart Shuffle: Mix new tracks with UPCOMING tracks
@@ -473,33 +525,43 @@ class Player(GObject.Object):
 
             # Assume valid index; fallback handling can be added if needed.
             if 0 <= current_idx < len(self.queue):
-                history_and_current = self.queue[: current_idx + 1]
-                upcoming = self.queue[current_idx + 1 :]
-
-                combined = upcoming + tracks
-                import random
-
-                random.shuffle(combined)
-
-                self.queue = history_and_current + combined
+                # Upcoming tracks are already in random order, so dropping
+                # each new track into a random upcoming slot keeps the whole
+                # tail uniformly shuffled without reordering what's there.
+                for track in tracks:
+                    pos = random.randint(current_idx + 1, len(self.queue))
+                    self.queue.insert(pos, [track])
+                    # Append to original queue always
+                    self.original_queue.append(self.queue.uid_at(pos))
                 # current_queue_index stays same
             else:
                 # Queue empty or invalid index, just shuffle all
+                start = len(self.queue)
                 self.queue.extend(tracks)
-                import random
-
-                random.shuffle(self.queue)
+                combined = self.queue.uids()
+                self.original_queue.extend(combined[start:])
+                random.shuffle(combined)
                 # If we were playing, index might be -1.
                 # If we were stopped, index -1.
-
-                if self.current_queue_index == -1 and self.queue:
-                    self.current_queue_index = 0
+                self.queue.reorder(combined, 0 if combined else -1)
 
         else:
+            start = len(self.queue)
             self.queue.extend(tracks)
+            self.original_queue.extend(
+                self.queue.uid_at(i) for i in range(start, len(self.queue))
+            )
 
         self.emit("state-changed", "queue-updated")
 
+    def _update_queue_track(self, video_id, **changes):
+        """
+        Swaps every queued record for video_id for a corrected copy
+        (PlayQueue.update). original_queue holds uids, so it needs no update.
+        Returns True if anything changed.
+        """
+        return self.queue.update(video_id, **changes)
+
     def update_track_thumbnail(self, video_id, working_url):
         """
         Updates the thumbnail URL for a track if a better/working one is found.
@@ -509,38 +571,21 @@ class Player(GObject.Object):
         if not video_id or not working_url:
             return
 
-        changed = False
-        # Update in current queue
-        for track in self.queue:
-            if track.get("videoId") == video_id:
-                if track.get("thumb") != working_url:
-                    track["thumb"] = working_url
-                    changed = True
-
-        # Update in original queue
-        for track in self.original_queue:
-            if track.get("videoId") == video_id:
-                track["thumb"] = working_url
-
-        if changed:
+        if self._update_queue_track(video_id, thumb=working_url):
             # If this is the currently playing track, re-emit metadata to update MPRIS
-            current_track = (
-                self.queue[self.current_queue_index]
-                if 0 <= self.current_queue_index < len(self.queue)
-                else None
-            )
-            if current_track and current_track.get("videoId") == video_id:
+            current_track = self.queue.current_track()
+            if current_track and current_track.video_id == video_id:
                 print(
                     f"[PLAYER] Updating working thumbnail for {video_id}: {working_url}"
                 )
                 # Re-emit metadata changed to trigger MPRIS update
                 self.emit(
                     "metadata-changed",
-                    current_track.get("title", ""),
-                    current_track.get("artist", ""),
+                    current_track.title,
+                    current_track.artist,
                     working_url,
                     video_id,
-                    current_track.get("likeStatus", "INDIFFERENT"),
+                    current_track.like_status,
                 )
                 self._sync_mpris_art(working_url, video_id)
 
@@ -550,7 +595,7 @@ class Player(GObject.Object):
 
         last_video_id = None
         if self.queue:
-            last_video_id = self.queue[-1].get("videoId")
+            last_video_id = self.queue[-1].video_id
 
         def fetch_job():
             try:
@@ -563,10 +608,9 @@ class Player(GObject.Object):
                 tracks = data.get("tracks", [])
 
                 # Filter out tracks already in our queue
-                existing_ids = {
-                    t.get("videoId") for t in self.queue if t.get("videoId")
-                }
-                new_tracks = [t for t in tracks if t.get("videoId") not in existing_ids]
+                new_tracks = [
+                    t for t in tracks if not self.queue.contains(t.get("videoId"))
+                ]
 
                 if new_tracks:
                     GObject.idle_add(self._on_infinite_fetch_complete, new_tracks)
@@ -584,32 +628,274 @@ class Player(GObject.Object):
         self.extend_queue(new_tracks)
         self._is_fetching_infinite = False
 
-    def _create_cookie_file(self, headers):
-        """Creates a temporary Netscape format cookie file from headers."""
-        import tempfile
-        import time
+    def _auth_headers(self):
+        """Returns the API auth headers for yt-dlp, or None when logged out."""
+        if self.client.is_authenticated() and self.client.api:
+            return self.client.api.headers
+        return None
+
+    def _resolve_stream(
+        self, video_id, priority=ResolverPool.PRIORITY_PLAY, is_current=None
+    ):
+        """
+        Returns a stream cache entry for video_id, running yt-dlp only on a miss.
+        Concurrent calls for the same videoId (e.g. prefetch + skip) share one extraction.
+        is_current() returning False cancels the extraction, or the wait on a
+        shared one (ResolveCancelled). A play joining a queued prefetch promotes it.
+        """
+        entry = self.stream_cache.get(video_id)
+        if entry:
+            return entry
+
+        with self._resolving_lock:
+            pending = self._resolving.get(video_id)
+            if pending is None:
+                pending = threading.Event()
+                self._resolving[video_id] = pending
+                is_owner = True
+            else:
+                is_owner = False
+
+        if not is_owner:
+            if priority == ResolverPool.PRIORITY_PLAY:
+                # Don't let a play wait behind prefetches queued before it
+                self.resolver.promote(video_id, priority)
+            deadline = time.monotonic() + 60
+            while not pending.wait(0.25):
+                if is_current is not None and not is_current():
+                    raise ResolveCancelled(video_id)
+                if time.monotonic() >= deadline:
+                    break
+            entry = self.stream_cache.get(video_id)
+            if entry:
+                return entry
+            # The other extraction failed; fall through and try ourselves.
+            return self._extract_stream(video_id, priority, is_current)
+
+        try:
+            return self._extract_stream(video_id, priority, is_current)
+        finally:
+            with self._resolving_lock:
+                self._resolving.pop(video_id, None)
+            pending.set()
+
+    def _extract_stream(
+        self, video_id, priority=ResolverPool.PRIORITY_PLAY, is_current=None
+    ):
+        info = self.resolver.extract(
+            video_id,
+            self._auth_headers(),
+            priority,
+            is_current=is_current,
+            fmt=self._stream_format(),
+        )
+        return self.stream_cache.put(
+            video_id,
+            info["url"],
+            title=info["title"],
+            uploader=info["uploader"],
+            thumbnail=info["thumbnail"],
+            format_id=info.get("format_id"),
+            acodec=info.get("acodec"),
+            abr=info.get("abr"),
+        )
+
+    def _prefetch_upcoming(self):
+        """Resolves stream URLs for the next few queue entries in the background."""
+        if self._is_prefetching or not self.queue or self.prefetch_count <= 0:
+            return False
+
+        video_ids = []
+        n = len(self.queue)
+        for offset in range(1, self.prefetch_count + 1):
+            idx = self.current_queue_index + offset
+            if idx >= n:
+                if self.repeat_mode != "all":
+                    break
+                idx %= n
+            vid = self.queue[idx].video_id
+            if (
+                vid
+                and vid != self.current_video_id
+                and vid not in self.stream_cache
+                and not self.audio_cache.lookup(vid)
+            ):
+                video_ids.append(vid)
+
+        if not video_ids:
+            return False
 
-        cookie_str = headers.get("Cookie", "")
-        if not cookie_str:
+        def prefetch_job():
+            try:
+                for vid in video_ids:
+                    try:
+                        self._resolve_stream(
+                            vid, priority=ResolverPool.PRIORITY_PREFETCH
+                        )
+                        print(f"[PLAYER] Prefetched stream for {vid}")
+                    except Exception as e:
+                        print(f"[PLAYER] Prefetch failed for {vid}: {e}")
+            finally:
+                self._is_prefetching = False
+
+        self._is_prefetching = True
+        thread = threading.Thread(target=prefetch_job, daemon=True)
+        thread.start()
+        return False
+
+    def _local_entry(self, video_id):
+        """Returns a stream entry for the cached/offline copy of video_id, or None."""
+        path = self.audio_cache.lookup(video_id)
+        if not path:
             return None
+        ext = os.path.splitext(path)[1]
+        return {
+            "url": GLib.filename_to_uri(path, None),
+            "expire": None,
+            "acodec": {".webm": "opus", ".m4a": "mp4a"}.get(ext, ""),
+            "local": True,
+        }
+
+    def _stream_format(self):
+        max_abr = self.max_audio_bitrate
+        if self.low_bandwidth:
+            max_abr = min(max_abr or LOW_BANDWIDTH_ABR, LOW_BANDWIDTH_ABR)
+        return build_format(max_abr)
+
+    def set_low_bandwidth(self, enabled):
+        self.low_bandwidth = bool(enabled)
+        logger.set_setting("low_bandwidth", self.low_bandwidth)
+        self.ydl_opts["format"] = self._stream_format()
+        # Resolved URLs were chosen under the old policy
+        self.stream_cache.clear()
+
+    def _set_stream_info(self, entry):
+        """Publishes the format of the stream now playing (main thread)."""
+        entry = entry or {}
+        codec = entry.get("acodec") or ""
+        if codec.startswith("mp4a"):
+            codec = "aac"
+        self.stream_info = {
+            "itag": entry.get("format_id") or "",
+            "codec": codec,
+            "bitrate": int(entry.get("abr") or 0),
+            "local": bool(entry.get("local")),
+        }
+        self.emit(
+            "stream-info-changed",
+            self.stream_info["itag"],
+            self.stream_info["codec"],
+            self.stream_info["bitrate"],
+            self.stream_info["local"],
+        )
+
+    def _resolve_stream_url(self, video_id):
+        return self._resolve_stream(video_id, priority=ResolverPool.PRIORITY_PREFETCH)[
+            "url"
+        ]
+
+    def set_audio_cache(self, enabled):
+        self.audio_cache.enabled = bool(enabled)
+        logger.set_setting("audio_cache", self.audio_cache.enabled)
+
+    def download_tracks(self, video_ids):
+        """Pins tracks for offline playback, downloading the missing ones in the background."""
+        for video_id in video_ids:
+            self.audio_cache.request(video_id, self._resolve_stream_url, pin=True)
+
+    def remove_downloads(self, video_ids):
+        self.audio_cache.unpin(video_ids)
+
+    def set_gapless(self, enabled):
+        self.gapless_enabled = bool(enabled)
+        logger.set_setting("gapless_playback", self.gapless_enabled)
+
+    def _next_gapless_index(self):
+        """Returns the queue index that should follow the current track, or -1."""
+        if not self.queue or self.current_queue_index < 0:
+            return -1
+        if self.repeat_mode == "track":
+            return self.current_queue_index
+        idx = self.current_queue_index + 1
+        if idx < len(self.queue):
+            return idx
+        if self.repeat_mode == "all":
+            return 0
+        return -1
+
+    def _on_about_to_finish(self, playbin):
+        """
+        Runs on a GStreamer streaming thread shortly before the current stream ends.
+        Setting `uri` here makes playbin continue into the next track without an EOS.
+        Only already-resolved URLs are used; otherwise we fall back to the EOS path.
+        """
+        if not self.gapless_enabled:
+            return
+
+        idx = self._next_gapless_index()
+        if idx < 0:
+            return
+
+        try:
+            video_id = self.queue[idx].video_id
+        except IndexError:
+            return
+
+        entry = self._local_entry(video_id) or self.stream_cache.get(video_id)
+        if not entry:
+            print(f"[PLAYER] Gapless: {video_id} not resolved yet, waiting for EOS")
+            return
+
+        self._gapless_pending = (self.queue.uid_at(idx), video_id, entry)
+        playbin.set_property("uri", entry["url"])
+        print(f"[PLAYER] Gapless: queued {video_id} (index {idx})")
+
+    def _advance_gapless(self):
+        """Main-thread bookkeeping once playbin has started the queued stream."""
+        pending = self._gapless_pending
+        self._gapless_pending = None
+        if not pending:
+            return False
+
+        uid, video_id, entry = pending
+        if entry.get("local"):
+            self.audio_cache.mark_played(video_id)
+        self._set_current_stream(entry["url"], entry["expire"])
+        self._set_stream_info(entry)
+        self._stream_refreshes = 0
+        self._last_position = 0.0
+        # The queue may have been edited while the next stream was pre-rolling
+        idx = self.queue.position_of(uid)
+        if idx < 0:
+            idx = self.queue.find(video_id)
+            if idx < 0:
+                return False
+
+        self.current_queue_index = idx
+        video_id, title, artist, thumb, like_status = self._normalize_track(
+            self.queue[idx]
+        )
 
-        fd, path = tempfile.mkstemp(suffix=".txt", text=True)
-        with os.fdopen(fd, "w") as f:
-            f.write("# Netscape HTTP Cookie File\n")
-            f.write("# This file is generated by Mixtapes\n\n")
+        # No fetch is in flight for gapless transitions, but bump the
+        # generation so any stale one can't replace the new stream.
+        self.load_generation += 1
+        self.current_video_id = video_id
+        self.duration = -1
 
-            now = int(time.time()) + 3600 * 24 * 365  # 1 year validity
+        self.emit("metadata-changed", title, artist, thumb, video_id, like_status)
+        if thumb:
+            self._sync_mpris_art(thumb, video_id)
 
-            # Simple parsing of "key=value; key2=value2"
-            parts = cookie_str.split(";")
-            for part in parts:
-                if "=" in part:
-                    key, value = part.strip().split("=", 1)
-                    # domain flag path secure expiration name value
-                    f.write(f".youtube.com\tTRUE\t/\tTRUE\t{now}\t{key}\t{value}\n")
-                    f.write(f".google.com\tTRUE\t/\tTRUE\t{now}\t{key}\t{value}\n")
+        if self.queue_is_infinite and self.queue_source_id and self.client:
+            if (
+                not self._is_fetching_infinite
+                and self.current_queue_index >= len(self.queue) // 2
+            ):
+                self._start_infinite_fetch()
 
-        return path
+        self.emit("state-changed", "queue-updated")
+        self._prefetch_upcoming()
+        return False
 
     def _fetch_and_play(
         self,
@@ -625,154 +911,346 @@ class Player(GObject.Object):
                 f"Stale load generation {generation} (current {self.load_generation}). Aborting."
             )
             return
-        import os
 
-        url = f"https://www.youtube.com/watch?v={video_id}"
-
-        # Use a local copy of options to prevent race conditions
-        opts = self.ydl_opts.copy()
-        cookie_file = None
         try:
-            # Inject headers/cookies if authenticated
-            if self.client.is_authenticated() and self.client.api:
-                # Create Netscape cookie file
-                cookie_file = self._create_cookie_file(self.client.api.headers)
-                if cookie_file:
-                    opts["cookiefile"] = cookie_file
-
-                # Still pass User-Agent and Authorization if available
-                http_headers = {}
-                if "User-Agent" in self.client.api.headers:
-                    http_headers["User-Agent"] = self.client.api.headers["User-Agent"]
-                if "Authorization" in self.client.api.headers:
-                    http_headers["Authorization"] = self.client.api.headers[
-                        "Authorization"
-                    ]
-
-                if http_headers:
-                    opts["http_headers"] = http_headers
-            else:
-                pass
+            # Cached/offline copies skip stream resolution entirely
+            entry = self._local_entry(video_id)
+            if not entry:
+                entry = self._resolve_stream(
+                    video_id, is_current=lambda: generation == self.load_generation
+                )
+            stream_url = entry["url"]
 
-            with YoutubeDL(opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                stream_url = info["url"]
+            # Extract only what we need from the resolved entry
+            fetched_title = entry.get("title") or "Unknown"
+            fetched_artist = entry.get("uploader") or "Unknown"
+            fetched_thumb = entry.get("thumbnail")
 
-                # Extract only what we need, then drop the large info dict
-                fetched_title = info.get("title", "Unknown")
-                fetched_artist = info.get("uploader", "Unknown")
-                fetched_thumb = info.get("thumbnail")
-                del info  # Free 100KB+ of format/subtitle data
+            # If hints are placeholders, try to get better metadata from ytmusicapi
+            if (not title_hint or title_hint == "Loading...") or (
+                not artist_hint or artist_hint == "Unknown"
+            ):
+                try:
+                    song_details = self.client.get_song(video_id)
+                    if song_details:
+                        v_details = song_details.get("videoDetails", {})
+                        if "title" in v_details:
+                            fetched_title = v_details["title"]
+                        if "author" in v_details:
+                            fetched_artist = v_details["author"]
+
+                        # Use high-res thumbnail from get_song if available
+                        if (
+                            not thumb_hint
+                            and "thumbnail" in v_details
+                            and "thumbnails" in v_details["thumbnail"]
+                        ):
+                            thumbs = v_details["thumbnail"]["thumbnails"]
+                            if thumbs:
+                                fetched_thumb = thumbs[-1]["url"]
+
+                except Exception as e:
+                    print(f"Error fetching metadata from ytmusicapi: {e}")
+
+            final_title = (
+                title_hint
+                if title_hint and title_hint != "Loading..."
+                else fetched_title
+            )
+            final_artist = (
+                artist_hint
+                if artist_hint and artist_hint != "Unknown"
+                else fetched_artist
+            )
 
-                # If hints are placeholders, try to get better metadata from ytmusicapi
-                if (not title_hint or title_hint == "Loading...") or (
-                    not artist_hint or artist_hint == "Unknown"
-                ):
-                    try:
-                        song_details = self.client.get_song(video_id)
-                        if song_details:
-                            v_details = song_details.get("videoDetails", {})
-                            if "title" in v_details:
-                                fetched_title = v_details["title"]
-                            if "author" in v_details:
-                                fetched_artist = v_details["author"]
-
-                            # Use high-res thumbnail from get_song if available
-                            if (
-                                not thumb_hint
-                                and "thumbnail" in v_details
-                                and "thumbnails" in v_details["thumbnail"]
-                            ):
-                                thumbs = v_details["thumbnail"]["thumbnails"]
-                                if thumbs:
-                                    fetched_thumb = thumbs[-1]["url"]
+            print(f"Playing: {final_title} by {final_artist}")
 
-                    except Exception as e:
-                        print(f"Error fetching metadata from ytmusicapi: {e}")
+            final_thumb = thumb_hint or fetched_thumb or ""
+            if "ytimg.com" in final_thumb:
+                final_thumb = get_high_res_url(final_thumb)
 
-                final_title = (
-                    title_hint
-                    if title_hint and title_hint != "Loading..."
-                    else fetched_title
-                )
-                final_artist = (
-                    artist_hint
-                    if artist_hint and artist_hint != "Unknown"
-                    else fetched_artist
+            # Update the queue track if possible so subsequent refreshes find it
+            def update_queue_track():
+                self._update_queue_track(
+                    video_id, title=final_title, artist=final_artist, thumb=final_thumb
                 )
+                return False
 
-                print(f"Playing: {final_title} by {final_artist}")
+            GLib.idle_add(update_queue_track)
 
-                final_thumb = thumb_hint or fetched_thumb or ""
-                if "ytimg.com" in final_thumb:
-                    final_thumb = get_high_res_url(final_thumb)
-
-                # Update the queue track if possible so subsequent refreshes find it
-                if 0 <= self.current_queue_index < len(self.queue):
-                    track = self.queue[self.current_queue_index]
-                    if track.get("videoId") == video_id:
-                        track["title"] = final_title
-                        track["artist"] = final_artist
-                        track["thumb"] = final_thumb
-
-                # Check generation again before playing
-                if generation != self.load_generation:
-                    print(
-                        f"Stale load generation {generation} before playbin set. Aborting."
-                    )
-                    if cookie_file and os.path.exists(cookie_file):
-                        os.remove(cookie_file)
-                    return
+            # Check generation again before playing
+            if generation != self.load_generation:
+                print(
+                    f"Stale load generation {generation} before playbin set. Aborting."
+                )
+                return
 
-                GObject.idle_add(self._start_playback, stream_url)
+            GObject.idle_add(self._start_playback, stream_url, entry["expire"], entry)
 
-                GObject.idle_add(
-                    self.emit,
-                    "metadata-changed",
-                    final_title,
-                    final_artist,
-                    final_thumb,
-                    video_id,
-                    like_status_hint,
-                )
+            GObject.idle_add(
+                self.emit,
+                "metadata-changed",
+                final_title,
+                final_artist,
+                final_thumb,
+                video_id,
+                like_status_hint,
+            )
+        except ResolveCancelled:
+            print(f"Stale load generation {generation} while resolving. Aborting.")
         except Exception as e:
             print(f"Error fetching URL: {e}")
-        finally:
-            if cookie_file and os.path.exists(cookie_file):
-                try:
-                    os.remove(cookie_file)
-                except:
-                    pass
 
-    def _start_playback(self, uri, cookie_file=None):
+    def _start_playback(self, uri, expire=None, entry=None):
         self.player.set_state(Gst.State.NULL)
+        self._want_playing = True
+        self._reset_buffering()
+        self._pending_seek = None
+        self._stream_refreshes = 0
+        self._last_position = 0.0
+        self._set_current_stream(uri, expire)
+        self._set_stream_info(entry)
         self.player.set_property("uri", uri)
         self.player.set_state(Gst.State.PLAYING)
 
-        # Direct URLs typically work without explicit cookies. Stale URLs are handled in _load_internal.
+        # Keep a local copy of streamed tracks when the audio cache is on
+        if uri.startswith("file://"):
+            self.audio_cache.mark_played(self.current_video_id)
+        elif self.audio_cache.enabled:
+            self.audio_cache.request(self.current_video_id, self._resolve_stream_url)
+
+        # Direct URLs typically work without explicit cookies. Expired URLs are
+        # swapped by _refresh_stream. Resolve the next tracks while this one
+        # plays so skips start instantly.
+        self._prefetch_upcoming()
+        return False
+
+    def _set_current_stream(self, url, expire):
+        """Tracks the URL playbin is using and schedules a refresh before it expires."""
+        self.current_url = url
+        self.current_url_expire = expire
+        if self._stream_refresh_timer:
+            GLib.source_remove(self._stream_refresh_timer)
+            self._stream_refresh_timer = None
+        if url and expire:
+            delay = int(expire - self.stream_cache.safety_margin - time.time())
+            self._stream_refresh_timer = GLib.timeout_add_seconds(
+                max(delay, 1), self._on_stream_refresh_due
+            )
+
+    def _stream_expiring(self):
+        expire = self.current_url_expire
+        return (
+            expire is not None
+            and expire - self.stream_cache.safety_margin <= time.time()
+        )
+
+    def _on_stream_refresh_due(self):
+        self._stream_refresh_timer = None
+        video_id = self.current_video_id
+        state = self.player.get_state(0)[1]
+        if not video_id or self._is_loading:
+            return False
+
+        if state == Gst.State.PAUSED:
+            # Swap now so resuming later starts instantly
+            self._refresh_stream(self._last_position, resume=False)
+        elif state == Gst.State.PLAYING:
+            # The open connection keeps playing; have a fresh URL ready for seeks
+            def job():
+                try:
+                    self._fresh_stream(video_id)
+                except Exception as e:
+                    print(f"[PLAYER] Background stream refresh failed: {e}")
+
+            threading.Thread(target=job, daemon=True).start()
+        return False
+
+    def _fresh_stream(self, video_id, is_current=None):
+        """Resolves video_id again unless the cache already holds a newer URL than current_url."""
+        entry = self.stream_cache.get(video_id)
+        if entry and entry["url"] != self.current_url:
+            return entry
+        self.stream_cache.invalidate(video_id)
+        return self._resolve_stream(video_id, is_current=is_current)
+
+    def _refresh_stream(self, position, resume):
+        """
+        Re-resolves the current track and continues at `position` on the new
+        URL, without going through the _load_internal metadata flow.
+        """
+        self._pending_seek = (position, resume)
+        video_id = self.current_video_id
+        if not video_id or self._is_refreshing_stream:
+            return
+
+        self._is_refreshing_stream = True
+        self._is_loading = True
+        generation = self.load_generation
+
+        def job():
+            try:
+                entry = self._fresh_stream(
+                    video_id, is_current=lambda: generation == self.load_generation
+                )
+            except Exception as e:
+                print(f"[PLAYER] Stream refresh failed for {video_id}: {e}")
+                entry = None
+            GLib.idle_add(self._swap_stream, entry, generation)
+
+        threading.Thread(target=job, daemon=True).start()
+
+    def _swap_stream(self, entry, generation):
+        self._is_refreshing_stream = False
+        if generation != self.load_generation:
+            return False
+
+        self.player.set_state(Gst.State.NULL)
+        if not entry:
+            self._pending_seek = None
+            self._is_loading = False
+            self._set_current_stream(None, None)
+            self._update_logical_state()
+            return False
+
+        print(f"[PLAYER] Refreshed stream URL for {self.current_video_id}")
+        self._reset_buffering()
+        self._set_current_stream(entry["url"], entry["expire"])
+        self._set_stream_info(entry)
+        self.player.set_property("uri", entry["url"])
+        # Preroll paused; ASYNC_DONE seeks to _pending_seek and resumes
+        self.player.set_state(Gst.State.PAUSED)
+        return False
+
+    def _apply_pending_seek(self):
+        position, resume = self._pending_seek
+        self._pending_seek = None
+        self._is_loading = False
+        if position > 0:
+            self.last_seek_time = time.time()
+            self.player.seek_simple(
+                Gst.Format.TIME,
+                Gst.SeekFlags.FLUSH | Gst.SeekFlags.ACCURATE,
+                int(position * Gst.SECOND),
+            )
+        self._want_playing = resume
+        if resume and not self._is_buffering:
+            self.player.set_state(Gst.State.PLAYING)
+        self._update_logical_state()
+
+    def apply_buffer_settings(self):
+        """Applies the buffer_* settings to playbin."""
+        self.buffer_duration = logger.get_setting(
+            "buffer_duration", DEFAULT_BUFFER_DURATION
+        )
+        size_kb = logger.get_setting("buffer_size_kb", 0)
+        self.buffer_low_watermark = logger.get_setting(
+            "buffer_low_watermark", DEFAULT_BUFFER_LOW_WATERMARK
+        )
+        self.player.set_property(
+            "buffer-duration", int(self.buffer_duration * Gst.SECOND)
+        )
+        # -1 lets playbin pick its default size
+        self.player.set_property("buffer-size", int(size_kb) * 1024 or -1)
+
+    def set_buffer_settings(self, duration=None, size_kb=None, low_watermark=None):
+        if duration is not None:
+            logger.set_setting("buffer_duration", float(duration))
+        if size_kb is not None:
+            logger.set_setting("buffer_size_kb", int(size_kb))
+        if low_watermark is not None:
+            logger.set_setting("buffer_low_watermark", int(low_watermark))
+        self.apply_buffer_settings()
+
+    def _on_buffering(self, percent):
+        self.buffer_percent = percent
+        self.emit("buffering", percent)
+
+        if percent < 100:
+            if not self._buffer_underrun:
+                self._buffer_underrun = True
+                state = self.player.get_state(0)
+                if self._want_playing and Gst.State.PLAYING in (state[1], state[2]):
+                    self._is_buffering = True
+                    self.player.set_state(Gst.State.PAUSED)
+                    # Only report "buffering" if it lasts, so short refills
+                    # don't flash the spinner
+                    GLib.timeout_add(BUFFERING_STATE_DELAY, self._show_buffering_state)
+            elif self._is_buffering and percent >= self.buffer_low_watermark:
+                self._end_buffering()
+        else:
+            self._buffer_underrun = False
+            if self._is_buffering:
+                self._end_buffering()
+
+    def _show_buffering_state(self):
+        if self._is_buffering:
+            self._buffering_visible = True
+            self._update_logical_state()
         return False
 
+    def _end_buffering(self):
+        self._is_buffering = False
+        self._buffering_visible = False
+        if self._want_playing and self._pending_seek is None:
+            self.player.set_state(Gst.State.PLAYING)
+        self._update_logical_state()
+
+    def _reset_buffering(self):
+        self._is_buffering = False
+        self._buffering_visible = False
+        self._buffer_underrun = False
+        if self.buffer_percent != 100:
+            self.buffer_percent = 100
+            self.emit("buffering", 100)
+
     def play(self):
+        self._want_playing = True
+        if self._pending_seek is not None:
+            self._pending_seek = (self._pending_seek[0], True)
+            return
+        if self._stream_expiring():
+            self._refresh_stream(self._last_position, resume=True)
+            return
+        if self._is_buffering:
+            # Resumes by itself once the buffer is refilled
+            self._update_logical_state()
+            return
         self.player.set_state(Gst.State.PLAYING)
         self._update_logical_state()
 
     def pause(self):
+        self._want_playing = False
+        if self._pending_seek is not None:
+            self._pending_seek = (self._pending_seek[0], False)
         self.player.set_state(Gst.State.PAUSED)
         self._update_logical_state()
 
     def stop(self):
         self.player.set_state(Gst.State.NULL)
+        self._want_playing = False
+        self._reset_buffering()
+        self._gapless_pending = None
+        self._pending_seek = None
+        self._set_current_stream(None, None)
+        self._set_stream_info(None)
         self._is_loading = False
         # Force stopped state immediately
         if self._current_logical_state != "stopped":
             self._current_logical_state = "stopped"
             self.emit("state-changed", "stopped")
+            self._reschedule_progress()
 
     def _update_logical_state(self):
         new_state = "stopped"
         if self.player:
             state = self.player.get_state(0)[1]
-            if state == Gst.State.PLAYING:
+            if self._buffering_visible and self._want_playing:
+                new_state = "buffering"
+            elif self._is_buffering and self._want_playing:
+                # Briefly refilling: keep reporting "playing"
+                new_state = self._current_logical_state
+            elif state == Gst.State.PLAYING:
                 new_state = "playing"
             elif state == Gst.State.PAUSED:
                 new_state = "paused"
@@ -781,9 +1259,58 @@ class Player(GObject.Object):
             self._current_logical_state = new_state
             try:
                 GLib.idle_add(self.emit, "state-changed", new_state)
+                GLib.idle_add(self._reschedule_progress)
             except Exception as e:
                 pass
 
+    def request_progress(self, owner, interval_ms):
+        """
+        Asks for `progression` updates at least every interval_ms while
+        playing. Widgets call this when mapped and release_progress() when
+        unmapped.
+        """
+        self._progress_subscribers[owner] = interval_ms
+        self._reschedule_progress()
+        # Bring a newly shown widget up to date right away
+        GLib.idle_add(self._update_position_once)
+
+    def release_progress(self, owner):
+        self._progress_subscribers.pop(owner, None)
+        self._reschedule_progress()
+
+    def set_progress_suspended(self, suspended):
+        """Drops to the idle rate while the window is not visible (e.g. minimised)."""
+        self._progress_suspended = bool(suspended)
+        self._reschedule_progress()
+
+    def _reschedule_progress(self):
+        interval = None
+        if self._current_logical_state in ("playing", "buffering"):
+            interval = IDLE_PROGRESS_INTERVAL
+            if self._progress_subscribers and not self._progress_suspended:
+                interval = min(self._progress_subscribers.values())
+
+        if interval == self._progress_interval:
+            return False
+        if self._progress_timer:
+            GLib.source_remove(self._progress_timer)
+            self._progress_timer = None
+        self._progress_interval = interval
+        if interval:
+            self._progress_timer = GLib.timeout_add(interval, self.update_position)
+        else:
+            # Leave the UI and cached position on the final value
+            self._update_position_once()
+        return False
+
+    def _update_position_once(self):
+        self.update_position()
+        return False
+
+    def get_position(self):
+        """Last known playback position in seconds (cached; no pipeline query)."""
+        return self._last_position
+
     def on_message(self, bus, message):
         t = message.type
         if t == Gst.MessageType.EOS:
@@ -793,13 +1320,32 @@ class Player(GObject.Object):
                 GObject.idle_add(self._play_current_index)
             else:
                 GObject.idle_add(self.next)
+        elif t == Gst.MessageType.STREAM_START:
+            # Fired for every new stream; only gapless transitions need handling
+            if self._gapless_pending:
+                self._advance_gapless()
         elif t == Gst.MessageType.ASYNC_DONE:
             # The stream is actually loaded and ready
+            if self._pending_seek is not None and not self._is_refreshing_stream:
+                self._apply_pending_seek()
             if hasattr(self, "mpris_events"):
                 self.mpris_events.on_player_all()  # Refresh duration and status
         elif t == Gst.MessageType.ERROR:
             err, debug = message.parse_error()
             print(f"Error: {err}, {debug}")
+            # A prefetched URL may have been rejected; don't hand it out again.
+            self.stream_cache.invalidate(self.current_video_id)
+            # An expired googlevideo URL fails with 403 from souphttpsrc:
+            # resolve it again and continue where we were.
+            if (
+                self._is_forbidden_error(err, debug)
+                and self.current_video_id
+                and self._stream_refreshes < 2
+            ):
+                self._stream_refreshes += 1
+                print("[PLAYER] Stream URL rejected, refreshing")
+                self._refresh_stream(self._last_position, resume=True)
+                return
             self.player.set_state(Gst.State.NULL)
             self._is_loading = False
             self._update_logical_state()
@@ -809,9 +1355,12 @@ class Player(GObject.Object):
                 if new == Gst.State.PLAYING:
                     self._is_loading = False
                 self._update_logical_state()
-        # BUFFERING messages are intentionally ignored — playbin manages
-        # stream buffering internally and briefly pauses the pipeline,
-        # which would cause the spinner to flash unnecessarily.
+        elif t == Gst.MessageType.BUFFERING:
+            self._on_buffering(message.parse_buffering())
+
+    def _is_forbidden_error(self, err, debug):
+        text = f"{err.message if err else ''} {debug or ''}"
+        return "403" in text or "Forbidden" in text
 
     def get_state_string(self):
         """Returns the current logical player state."""
@@ -837,12 +1386,8 @@ class Player(GObject.Object):
                 else:
                     fetch_url = current_url
 
-                headers = {
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-                }
-                req = urllib.request.Request(fetch_url, headers=headers)
-                with urllib.request.urlopen(req, timeout=10) as resp:
-                    data = resp.read()
+                # Shares the on-disk artwork cache with the UI image loaders
+                data = fetch_image_bytes(fetch_url, timeout=10)
 
                 # 2. Load and Crop
                 loader = GdkPixbuf.PixbufLoader()
@@ -908,10 +1453,7 @@ class Player(GObject.Object):
             success_pos, pos_nanos = self.player.query_position(Gst.Format.TIME)
             if success_pos:
                 current_time = pos_nanos / Gst.SECOND
-
-                # Update the Adapter's cache immediately
-                if hasattr(self, "mpris_adapter"):
-                    self.mpris_adapter._last_pos = pos_nanos // 1000
+                self._last_position = current_time
 
                 # 4. Emit progression for local UI
                 # We use float(d) to ensure the UI progress bar has a max value
@@ -922,7 +1464,17 @@ class Player(GObject.Object):
 
     def seek(self, position, flush=True):
         """Seek to position in seconds"""
-        if self.player.get_state(0)[1] == Gst.State.NULL:
+        if self._pending_seek is not None:
+            # A stream refresh is in progress; seek once it has prerolled
+            self._pending_seek = (position, self._pending_seek[1])
+            return
+
+        state = self.player.get_state(0)[1]
+        if state == Gst.State.NULL:
+            return
+
+        if self._stream_expiring():
+            self._refresh_stream(position, resume=state == Gst.State.PLAYING)
             return
 
         import time
@@ -938,6 +1490,10 @@ class Player(GObject.Object):
             flags,
             int(position * Gst.SECOND),
         )
+        self._last_position = position
+        # update_position ignores the pipeline right after a seek; refresh
+        # once it has settled in case the timer is stopped (paused)
+        GLib.timeout_add(900, self._update_position_once)
 
         if hasattr(self, "mpris_events"):
             self.mpris_events.on_seek(int(position * 1_000_000))
@@ -0,0 +1,426 @@
+import atexit
+import hashlib
+import itertools
+import json
+import os
+import queue
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlparse, parse_qs
+
+# googlevideo URLs normally carry an `expire` timestamp. When it is missing
+# we assume a conservative lifetime instead of trusting the URL forever.
+DEFAULT_STREAM_TTL = 3600
+
+# Format policy: audio bitrate caps in kbps
+DEFAULT_MAX_ABR = 160
+LOW_BANDWIDTH_ABR = 64
+
+
+def build_format(max_abr=DEFAULT_MAX_ABR):
+    """
+    Returns a yt-dlp format selector that prefers Opus, then M4A, within the
+    bitrate cap. Only audio-only formats are ever selected ("bestaudio" and
+    "worstaudio" never match muxed video); if nothing fits under the cap the
+    smallest audio stream is used.
+    """
+    cap = f"[abr<=?{max_abr}]" if max_abr else ""
+    return "/".join(
+        [
+            f"bestaudio[acodec=opus]{cap}",
+            f"bestaudio[ext=m4a]{cap}",
+            f"bestaudio{cap}",
+            "worstaudio",
+        ]
+    )
+
+
+def parse_stream_expiry(url, default_ttl=DEFAULT_STREAM_TTL):
+    """Returns the unix timestamp at which a resolved stream URL stops working."""
+    try:
+        expire = parse_qs(urlparse(url).query).get("expire")
+        if expire:
+            return float(expire[0])
+    except (ValueError, TypeError):
+        pass
+    return time.time() + default_ttl
+
+
+class StreamCache:
+    """
+    Bounded, expiry-aware cache of resolved stream URLs keyed by videoId.
+    Entries are dicts with at least `url` and `expire`; extra metadata from
+    the extractor (title, uploader, thumbnail) is stored alongside.
+    """
+
+    def __init__(self, max_entries=32, safety_margin=300):
+        self.max_entries = max_entries
+        # Treat URLs as expired a bit early so playback never starts on a
+        # URL that lapses a few seconds later.
+        self.safety_margin = safety_margin
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, video_id):
+        if not video_id:
+            return None
+        with self._lock:
+            entry = self._entries.get(video_id)
+            if entry is None:
+                return None
+            if entry["expire"] - self.safety_margin <= time.time():
+                del self._entries[video_id]
+                return None
+            self._entries.move_to_end(video_id)
+            return dict(entry)
+
+    def put(self, video_id, url, **meta):
+        if not video_id or not url:
+            return None
+        entry = dict(meta)
+        entry["url"] = url
+        entry["expire"] = parse_stream_expiry(url)
+        with self._lock:
+            self._entries[video_id] = entry
+            self._entries.move_to_end(video_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return dict(entry)
+
+    def invalidate(self, video_id):
+        with self._lock:
+            self._entries.pop(video_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, video_id):
+        return self.get(video_id) is not None
+
+
+def write_cookie_file(cookie_str, path):
+    """Writes a "key=value; key2=value2" Cookie header as a Netscape cookie file."""
+    expires = int(time.time()) + 3600 * 24 * 365  # 1 year validity
+    with open(path, "w") as f:
+        f.write("# Netscape HTTP Cookie File\n")
+        f.write("# This file is generated by Mixtapes\n\n")
+        for part in cookie_str.split(";"):
+            if "=" in part:
+                key, value = part.strip().split("=", 1)
+                # domain flag path secure expiration name value
+                f.write(f".youtube.com\tTRUE\t/\tTRUE\t{expires}\t{key}\t{value}\n")
+                f.write(f".google.com\tTRUE\t/\tTRUE\t{expires}\t{key}\t{value}\n")
+
+
+class StreamExtractor:
+    """
+    Long-lived yt-dlp extractor.
+
+    One YoutubeDL instance is kept across tracks so its player JS, signature
+    and EJS caches are reused. The Netscape cookie file is written once and
+    only rebuilt (together with the YoutubeDL instance) when the auth headers
+    change. YoutubeDL is not thread-safe: use an instance from one thread only.
+    """
+
+    def __init__(self, base_opts):
+        self.base_opts = dict(base_opts)
+        self._ydl = None
+        self._auth_key = None
+        self._cookie_file = None
+
+    @staticmethod
+    def _key_for(headers, fmt):
+        parts = [fmt or ""]
+        if headers:
+            parts += [
+                headers.get(k, "") for k in ("Cookie", "User-Agent", "Authorization")
+            ]
+        return hashlib.sha1("\0".join(parts).encode("utf-8")).hexdigest()
+
+    def _ensure(self, headers, fmt=None):
+        key = self._key_for(headers, fmt)
+        if self._ydl is not None and key == self._auth_key:
+            return self._ydl
+
+        # yt_dlp takes a noticeable time to import; only pay for it on first use
+        from yt_dlp import YoutubeDL
+
+        self.close()
+        opts = dict(self.base_opts)
+        if fmt:
+            opts["format"] = fmt
+        if headers:
+            cookie_str = headers.get("Cookie", "")
+            if cookie_str:
+                fd, self._cookie_file = tempfile.mkstemp(suffix=".txt", text=True)
+                os.close(fd)
+                write_cookie_file(cookie_str, self._cookie_file)
+                opts["cookiefile"] = self._cookie_file
+
+            # Still pass User-Agent and Authorization if available
+            http_headers = {
+                k: headers[k] for k in ("User-Agent", "Authorization") if k in headers
+            }
+            if http_headers:
+                opts["http_headers"] = http_headers
+
+        self._ydl = YoutubeDL(opts)
+        self._auth_key = key
+        return self._ydl
+
+    def extract(self, video_id, headers=None, fmt=None):
+        """
+        Returns {url, title, uploader, thumbnail, format_id, acodec, abr, ext}
+        for video_id, using format selector fmt if given. Raises on failure.
+        """
+        ydl = self._ensure(headers, fmt)
+        info = ydl.extract_info(
+            f"https://www.youtube.com/watch?v={video_id}", download=False
+        )
+        return {
+            "url": info["url"],
+            "title": info.get("title", "Unknown"),
+            "uploader": info.get("uploader", "Unknown"),
+            "thumbnail": info.get("thumbnail"),
+            "format_id": info.get("format_id"),
+            "acodec": info.get("acodec"),
+            "abr": info.get("abr"),
+            "ext": info.get("ext"),
+        }
+
+    def close(self):
+        if self._ydl is not None:
+            try:
+                self._ydl.close()
+            except Exception:
+                pass
+            self._ydl = None
+        self._auth_key = None
+        if self._cookie_file:
+            try:
+                os.remove(self._cookie_file)
+            except OSError:
+                pass
+            self._cookie_file = None
+
+
+class ResolveCancelled(Exception):
+    """Raised when a resolve request was abandoned by its caller."""
+
+
+class _ResolveJob:
+    __slots__ = (
+        "video_id",
+        "headers",
+        "fmt",
+        "priority",
+        "started",
+        "done",
+        "result",
+        "error",
+        "cancelled",
+        "process",
+        "lock",
+    )
+
+    def __init__(self, video_id, headers, fmt, priority):
+        self.video_id = video_id
+        self.headers = headers
+        self.fmt = fmt
+        self.priority = priority
+        self.started = False  # taken by a worker; later queue entries are stale
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.cancelled = False
+        self.process = None  # worker process currently running the job
+        self.lock = threading.Lock()
+
+
+class _WorkerProcess:
+    """One resolver_worker.py child speaking JSON lines over stdin/stdout."""
+
+    SCRIPT = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "resolver_worker.py"
+    )
+
+    def __init__(self, base_opts):
+        self._seq = itertools.count(1)
+        self.proc = subprocess.Popen(
+            [sys.executable, self.SCRIPT, json.dumps(base_opts)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+
+    def alive(self):
+        return self.proc.poll() is None
+
+    def call(self, video_id, headers, fmt=None):
+        request_id = next(self._seq)
+        request = {
+            "id": request_id,
+            "video_id": video_id,
+            "headers": headers,
+            "format": fmt,
+        }
+        self.proc.stdin.write(json.dumps(request) + "\n")
+        self.proc.stdin.flush()
+        line = self.proc.stdout.readline()
+        if not line:
+            raise RuntimeError("Resolver worker exited")
+        response = json.loads(line)
+        if response.get("id") != request_id:
+            raise RuntimeError("Resolver worker protocol mismatch")
+        if not response.get("ok"):
+            raise RuntimeError(response.get("error") or "Extraction failed")
+        return response["result"]
+
+    def kill(self):
+        try:
+            self.proc.kill()
+        except Exception:
+            pass
+
+
+class ResolverPool:
+    """
+    Resolves stream URLs in a small pool of worker processes.
+
+    yt-dlp's signature deciphering is CPU-heavy; running it in child
+    processes keeps it off the GIL shared with the GTK main loop. Each worker
+    keeps a long-lived StreamExtractor, and only the URL, expiry and basic
+    metadata come back over the pipe.
+
+    extract() blocks the calling (background) thread. Lower priority values
+    run first, and promote() lets a waiting request jump ahead. A request
+    can time out, or be cancelled through its is_current() callback; a
+    worker still busy with an abandoned request is killed and respawned on
+    next use.
+    """
+
+    PRIORITY_PLAY = 0
+    PRIORITY_PREFETCH = 1
+
+    def __init__(self, base_opts, workers=2):
+        self.base_opts = dict(base_opts)
+        self.workers = workers
+        self._queue = queue.PriorityQueue()
+        self._seq = itertools.count()
+        self._threads = []
+        self._processes = [None] * workers
+        self._lock = threading.Lock()
+        self._waiting = {}  # video_id -> queued _ResolveJob not yet started
+        atexit.register(self.shutdown)
+
+    def _ensure_workers(self):
+        with self._lock:
+            if self._threads:
+                return
+            for slot in range(self.workers):
+                t = threading.Thread(
+                    target=self._dispatch,
+                    args=(slot,),
+                    name=f"resolver-{slot}",
+                    daemon=True,
+                )
+                t.start()
+                self._threads.append(t)
+
+    def extract(
+        self,
+        video_id,
+        headers=None,
+        priority=PRIORITY_PLAY,
+        timeout=60,
+        is_current=None,
+        fmt=None,
+    ):
+        """
+        Returns {url, expire, title, uploader, thumbnail, format_id, acodec,
+        abr, ext}. Raises on failure.
+        """
+        self._ensure_workers()
+        job = _ResolveJob(video_id, dict(headers) if headers else None, fmt, priority)
+        with self._lock:
+            self._waiting[video_id] = job
+            self._queue.put((priority, next(self._seq), job))
+
+        deadline = time.monotonic() + timeout
+        while not job.done.wait(0.25):
+            if is_current is not None and not is_current():
+                self._abort(job)
+                raise ResolveCancelled(video_id)
+            if time.monotonic() >= deadline:
+                self._abort(job)
+                raise TimeoutError(f"Stream extraction for {video_id} timed out")
+
+        if job.error is not None:
+            raise job.error
+        return job.result
+
+    def promote(self, video_id, priority):
+        """
+        Moves a queued request for video_id up to priority, e.g. when the user
+        plays a track a prefetch is still waiting on. No-op once it started.
+        """
+        with self._lock:
+            job = self._waiting.get(video_id)
+            if job is None or priority >= job.priority:
+                return
+            job.priority = priority
+            # The old entry stays queued and is skipped once the job started
+            self._queue.put((priority, next(self._seq), job))
+
+    def _forget(self, job):
+        with self._lock:
+            if self._waiting.get(job.video_id) is job:
+                del self._waiting[job.video_id]
+
+    def _abort(self, job):
+        self._forget(job)
+        with job.lock:
+            job.cancelled = True
+            if job.process is not None:
+                job.process.kill()
+
+    def _dispatch(self, slot):
+        while True:
+            _, _, job = self._queue.get()
+            with job.lock:
+                if job.cancelled or job.started:
+                    continue
+                job.started = True
+                self._forget(job)
+                try:
+                    proc = self._processes[slot]
+                    if proc is None or not proc.alive():
+                        proc = _WorkerProcess(self.base_opts)
+                        self._processes[slot] = proc
+                except Exception as e:
+                    job.error = e
+                    job.done.set()
+                    continue
+                job.process = proc
+
+            try:
+                job.result = proc.call(job.video_id, job.headers, job.fmt)
+            except Exception as e:
+                job.error = e
+                if not proc.alive():
+                    self._processes[slot] = None
+            finally:
+                with job.lock:
+                    job.process = None
+                job.done.set()
+
+    def shutdown(self):
+        for proc in self._processes:
+            if proc is not None:
+                proc.kill()
@@ -0,0 +1,66 @@
+"""
+Stream resolver worker process.
+
+Spawned by resolver.ResolverPool. Reads one JSON request per line on stdin:
+
+    {"id": 1, "video_id": "...", "headers": {...} | null, "format": "..." | null}
+
+and writes one JSON response per line on stdout:
+
+    {"id": 1, "ok": true, "result": {"url", "expire", "title", "uploader", "thumbnail",
+                                     "format_id", "acodec", "abr", "ext"}}
+    {"id": 1, "ok": false, "error": "..."}
+
+The yt-dlp info dict never leaves this process. The base YoutubeDL options
+are passed as JSON in argv[1].
+"""
+
+import json
+import os
+import sys
+
+# Run as a script, sys.path[0] is src/player, where player.py would shadow
+# the player package; point it at src/ instead.
+sys.path[0] = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+from player.resolver import StreamExtractor, parse_stream_expiry
+
+
+def main():
+    base_opts = json.loads(sys.argv[1]) if len(sys.argv) > 1 else {}
+    extractor = StreamExtractor(base_opts)
+
+    # stdout carries the protocol; anything yt-dlp prints goes to stderr
+    out = sys.stdout
+    sys.stdout = sys.stderr
+
+    try:
+        for line in sys.stdin:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                request = json.loads(line)
+            except ValueError:
+                continue
+
+            response = {"id": request.get("id")}
+            try:
+                result = extractor.extract(
+                    request["video_id"], request.get("headers"), request.get("format")
+                )
+                result["expire"] = parse_stream_expiry(result["url"])
+                response["ok"] = True
+                response["result"] = result
+            except Exception as e:
+                response["ok"] = False
+                response["error"] = str(e)
+
+            out.write(json.dumps(response) + "\n")
+            out.flush()
+    finally:
+        extractor.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import os
+import time
+
+# Opt-in startup profiling: MUSE_STARTUP_TRACE=1 prints how long each startup
+# phase took up to the first painted frame. MUSE_STARTUP_BUDGET_MS (default
+# 1000) prints a warning when time-to-first-frame goes over budget.
+ENABLED = os.environ.get("MUSE_STARTUP_TRACE", "") not in ("", "0")
+BUDGET_MS = float(os.environ.get("MUSE_STARTUP_BUDGET_MS", "1000"))
+
+_T0 = time.perf_counter()
+_marks = []
+_reported = False
+
+
+def mark(phase):
+    """Records the end of a startup phase. Marks after the first frame are printed directly."""
+    if not ENABLED:
+        return
+    now = time.perf_counter()
+    if _reported:
+        print(f"[STARTUP] {phase}: +{(now - _T0) * 1000:.1f} ms (after first frame)")
+        return
+    _marks.append((phase, now))
+
+
+def report():
+    global _reported
+    if not ENABLED or _reported:
+        return
+    _reported = True
+
+    print("[STARTUP] Phase timings:")
+    prev = _T0
+    for phase, t in _marks:
+        print(
+            f"[STARTUP]   {phase:<24} {(t - prev) * 1000:8.1f} ms"
+            f"  (total {(t - _T0) * 1000:8.1f} ms)"
+        )
+        prev = t
+
+    total = (prev - _T0) * 1000
+    if total > BUDGET_MS:
+        print(
+            f"[STARTUP] WARNING: time to first frame {total:.1f} ms exceeds budget of {BUDGET_MS:.0f} ms"
+        )
+
+
+def watch_first_frame(widget):
+    """Marks the first frame painted for widget and prints the report."""
+    if not ENABLED:
+        return
+
+    def on_after_paint(clock):
+        clock.disconnect(handler_ids.pop())
+        mark("first frame")
+        report()
+
+    def on_realize(w):
+        clock = w.get_frame_clock()
+        if clock is None or _reported or handler_ids:
+            return
+        handler_ids.append(clock.connect("after-paint", on_after_paint))
+
+    handler_ids = []
+    if widget.get_realized():
+        on_realize(widget)
+    else:
+        widget.connect("realize", on_realize)
@@ -50,7 +50,9 @@ class ExpandedPlayer(Gtk.Box):
         header_box.set_margin_bottom(8)
         main_box.append(header_box)
 
-        self.covers = []
+        self.covers = []  # One carousel page per queue entry, in queue order
+        self._loaded_covers = set()  # Pages around the current one with art
+        self._carousel_sync_pending = False
         self.cover_img = self._make_cover()  # fallback center
 
         self.carousel = Adw.Carousel()
@@ -76,6 +78,7 @@ class ExpandedPlayer(Gtk.Box):
         self._ignore_page_change = False
         self.carousel.connect("notify::position", self._on_carousel_position_changed)
         self.connect("map", self._on_map)
+        self.connect("unmap", self._on_unmap)
 
         main_box.append(cover_frame)
 
@@ -130,15 +133,18 @@ class ExpandedPlayer(Gtk.Box):
         self.pos_label.add_css_class("caption")
         self.pos_label.add_css_class("numeric")
 
-        dur_spacer = Gtk.Box()
-        dur_spacer.set_hexpand(True)
+        # Codec/bitrate of the playing stream, centered between the timings
+        self.stream_info_label = Gtk.Label(label="")
+        self.stream_info_label.add_css_class("caption")
+        self.stream_info_label.add_css_class("dim-label")
+        self.stream_info_label.set_hexpand(True)
 
         self.dur_label = Gtk.Label(label="0:00")
         self.dur_label.add_css_class("caption")
         self.dur_label.add_css_class("numeric")
 
         timings_box.append(self.pos_label)
-        timings_box.append(dur_spacer)
+        timings_box.append(self.stream_info_label)
         timings_box.append(self.dur_label)
         progress_box.append(timings_box)
         main_box.append(progress_box)
@@ -257,6 +263,18 @@ class ExpandedPlayer(Gtk.Box):
         self.player.connect("progression", self.on_progression)
         self.player.connect("state-changed", self.on_state_changed)
         self.player.connect("volume-changed", self.on_volume_changed)
+        self.player.connect("stream-info-changed", self.on_stream_info_changed)
+        self.player.connect("buffering", self.on_buffering)
+
+        # Keep one carousel page per queue entry by applying queue deltas
+        queue = self.player.queue
+        queue.connect("inserted", self._on_queue_inserted)
+        queue.connect("removed", self._on_queue_removed)
+        queue.connect("moved", self._on_queue_moved)
+        queue.connect("reset", self._on_queue_reset)
+        queue.connect("updated", lambda *_: self._schedule_carousel_sync())
+        queue.connect("current-changed", lambda *_: self._schedule_carousel_sync())
+        self._on_queue_reset(queue)
 
         # Initial state sync
         self._is_buffering_spinner = False
@@ -264,6 +282,11 @@ class ExpandedPlayer(Gtk.Box):
 
     def _on_map(self, widget):
         GLib.idle_add(self._center_carousel)
+        # Smooth seek bar while visible
+        self.player.request_progress(self, 100)
+
+    def _on_unmap(self, widget):
+        self.player.release_progress(self)
 
     def _center_carousel(self):
         self._ignore_page_change = True
@@ -272,6 +295,24 @@ class ExpandedPlayer(Gtk.Box):
         return False
 
     # --- SIGNAL HANDLERS ---
+    def on_stream_info_changed(self, player, itag, codec, bitrate, is_local):
+        parts = []
+        if is_local:
+            parts.append("Offline")
+        if codec:
+            parts.append(codec.upper())
+        if bitrate:
+            parts.append(f"{bitrate} kbps")
+        self._stream_info_text = " · ".join(parts)
+        self.stream_info_label.set_label(self._stream_info_text)
+        self.stream_info_label.set_tooltip_text(f"itag {itag}" if itag else None)
+
+    def on_buffering(self, player, percent):
+        if percent < 100:
+            self.stream_info_label.set_label(f"Buffering… {percent}%")
+        else:
+            self.stream_info_label.set_label(getattr(self, "_stream_info_text", ""))
+
     def on_metadata_changed(
         self, player, title, artist, thumbnail_url, video_id, like_status
     ):
@@ -304,29 +345,35 @@ class ExpandedPlayer(Gtk.Box):
         """Get a thumbnail URL for a track at the given queue index."""
         if index < 0 or index >= len(self.player.queue):
             return None
-        track = self.player.queue[index]
-        thumb = track.get("thumb")
-        if not thumb and "thumbnails" in track:
-            thumbs = track.get("thumbnails", [])
-            if thumbs:
-                thumb = thumbs[-1]["url"]
-        if thumb:
-            return thumb
-        return None
-
-    def _sync_carousel_queue(self):
-        """Sync carousel sizing to match queue and lazy-load neighbors."""
-        queue_len = len(self.player.queue)
-        idx = self.player.current_queue_index
-
-        if queue_len == 0:
-            return
-
-        self._ignore_page_change = True
+        return self.player.queue[index].thumb
 
-        # Adjust covers array to match exact queue length
+    def _on_queue_inserted(self, queue, position, n):
+        for i in range(position, position + n):
+            cover = self._make_cover()
+            self.covers.insert(i, cover)
+            self.carousel.insert(cover, i)
+        self._schedule_carousel_sync()
+
+    def _on_queue_removed(self, queue, position, n):
+        for cover in self.covers[position : position + n]:
+            self._loaded_covers.discard(cover)
+            self.carousel.remove(cover)
+        del self.covers[position : position + n]
+        self._schedule_carousel_sync()
+
+    def _on_queue_moved(self, queue, old, new):
+        cover = self.covers.pop(old)
+        self.covers.insert(new, cover)
+        self.carousel.reorder(cover, new)
+        self._schedule_carousel_sync()
+
+    def _on_queue_reset(self, queue):
+        queue_len = len(queue)
+
+        # Pages are positional, so reuse them and only fix the count
         while len(self.covers) > queue_len:
             cover = self.covers.pop()
+            self._loaded_covers.discard(cover)
             if cover.get_parent() == self.carousel:
                 self.carousel.remove(cover)
 
@@ -335,47 +382,64 @@ class ExpandedPlayer(Gtk.Box):
             self.covers.append(cover)
             self.carousel.append(cover)
 
-        if 0 <= idx < len(self.covers):
-            self.cover_img = self.covers[idx]
+        self._schedule_carousel_sync()
 
-        if 0 <= idx < len(self.covers):
-            self.cover_img = self.covers[idx]
+    def _schedule_carousel_sync(self):
+        if not self._carousel_sync_pending:
+            self._carousel_sync_pending = True
+            GLib.idle_add(self._sync_carousel_queue)
+
+    def _sync_carousel_queue(self):
+        """Center the carousel on the current track and lazy-load its neighbors."""
+        self._carousel_sync_pending = False
+        idx = self.player.current_queue_index
 
-        self._last_lazy_idx = -1  # Force full reload on queue sync
+        if not 0 <= idx < len(self.covers):
+            return False
+
+        self._ignore_page_change = True
+
+        self.cover_img = self.covers[idx]
+
+        self._last_lazy_idx = -1  # Force reload, entries may have shifted
         self._lazy_load_covers_around(idx)
 
-        if 0 <= idx < len(self.covers):
-            self.carousel.scroll_to(self.covers[idx], animate=False)
+        self.carousel.scroll_to(self.covers[idx], animate=False)
 
         GLib.timeout_add(200, self._allow_page_change)
+        return False
 
     def _lazy_load_covers_around(self, center_idx):
         if center_idx == getattr(self, "_last_lazy_idx", -1):
             return
         self._last_lazy_idx = center_idx
 
-        # Lazy load +/- 5 covers around the visual center
-        for i, cover in enumerate(self.covers):
-            in_range = abs(i - center_idx) <= 5
-
-            if in_range:
-                thumb = self._get_track_thumb(i)
-                if thumb:
-                    if not cover.get_visible():
-                        cover.set_visible(True)
-
-                    if cover.url != thumb:
-                        cover.video_id = self.player.queue[i].get("videoId")
-                        cover.load_url(thumb)
-                else:
-                    if cover.get_visible():
-                        cover.set_visible(False)
-                    cover.video_id = None
-                    if cover.url is not None:
-                        cover.load_url(None)
-            else:
+        # Lazy load +/- 5 covers around the visual center; only pages that
+        # enter or leave that window are touched.
+        lo = max(0, center_idx - 5)
+        hi = min(len(self.covers), center_idx + 6)
+        window = self.covers[lo:hi]
+
+        for cover in self._loaded_covers.difference(window):
+            if not cover.get_visible():
+                cover.set_visible(True)
+            cover.video_id = None
+            if cover.url is not None:
+                cover.load_url(None)
+        self._loaded_covers = set(window)
+
+        for i, cover in enumerate(window, lo):
+            thumb = self._get_track_thumb(i)
+            if thumb:
                 if not cover.get_visible():
                     cover.set_visible(True)
+
+                if cover.url != thumb:
+                    cover.video_id = self.player.queue[i].video_id
+                    cover.load_url(thumb)
+            else:
+                if cover.get_visible():
+                    cover.set_visible(False)
                 cover.video_id = None
                 if cover.url is not None:
                     cover.load_url(None)
@@ -411,14 +475,14 @@ class ExpandedPlayer(Gtk.Box):
         return f"{m}:{s:02d}"
 
     def on_play_clicked(self, btn):
-        if self.player.get_state_string() == "playing":
+        if self.player.get_state_string() in ("playing", "buffering"):
             self.player.pause()
         else:
             self.player.play()
 
     def on_state_changed(self, player, state):
         if state == "queue-updated":
-            self._sync_carousel_queue()
+            # Pages follow the queue's own signals
             return
 
         if state == "loading":
@@ -427,6 +491,12 @@ class ExpandedPlayer(Gtk.Box):
             self._is_buffering_spinner = True
             return
 
+        if state == "buffering":
+            # Stalled on the network; keep the button usable so it can pause
+            self.play_btn_stack.set_visible_child_name("spinner")
+            self.play_btn.set_sensitive(True)
+            return
+
         if state == "playing" and self.player.duration <= 0:
             # We are playing but buffering stream—keep spinner active until duration > 0
             self.play_btn_stack.set_visible_child_name("spinner")
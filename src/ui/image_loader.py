@@ -0,0 +1,443 @@
+import hashlib
+import heapq
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+import urllib3
+from gi.repository import GLib
+
+# Artwork URLs are effectively immutable (a new cover gets a new URL), so
+# server TTLs (ytimg sends ~2h) are floored to keep relaunches off the network.
+MIN_IMAGE_TTL = 7 * 24 * 3600
+MAX_DISK_CACHE_BYTES = 256 * 1024 * 1024
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+
+# Keep-alive connections per image host (i.ytimg.com, lh3.googleusercontent.com,
+# yt3.ggpht.com, ...). Matches the fetch pool size so workers never wait on a
+# socket, and never opens more than that per host.
+HOST_CONNECTIONS = 6
+
+# urllib3's PoolManager is thread-safe and keeps one connection pool per host.
+HTTP = urllib3.PoolManager(
+    num_pools=16,
+    maxsize=HOST_CONNECTIONS,
+    block=True,
+    headers=DEFAULT_HEADERS,
+    retries=urllib3.Retry(total=2, backoff_factor=0.2),
+)
+
+
+def _parse_expiry(headers, now):
+    """Returns the absolute expiry time from Cache-Control/Expires headers."""
+    ttl = None
+    cache_control = headers.get("Cache-Control") or ""
+    for part in cache_control.split(","):
+        part = part.strip().lower()
+        if part.startswith("max-age="):
+            try:
+                ttl = int(part[len("max-age=") :])
+            except ValueError:
+                pass
+
+    if ttl is None and headers.get("Expires"):
+        try:
+            ttl = parsedate_to_datetime(headers["Expires"]).timestamp() - now
+        except (TypeError, ValueError):
+            pass
+
+    return now + max(ttl or 0, MIN_IMAGE_TTL)
+
+
+class ImageDiskCache:
+    """
+    Content-addressed on-disk image cache.
+
+    blobs/<sha256 of bytes>  - raw image data, shared by URLs with identical content
+    meta/<sha1 of url>.json  - {url, blob, size, etag, last_modified, expires, accessed}
+
+    Entries are evicted least-recently-used first once the blob total exceeds max_bytes.
+    The lock only guards the in-memory index; file reads, writes and removals
+    happen outside it so fetch workers don't queue behind each other's disk I/O.
+    A blob removed under a concurrent reader just reads as a miss.
+    """
+
+    def __init__(self, root=None, max_bytes=MAX_DISK_CACHE_BYTES):
+        self.root = root or os.path.join(
+            GLib.get_user_cache_dir(), "mixtapes", "images"
+        )
+        self.blob_dir = os.path.join(self.root, "blobs")
+        self.meta_dir = os.path.join(self.root, "meta")
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index = None  # url key -> meta dict, least recently used first
+        self._blob_sizes = {}  # blob name -> size
+        self._blob_refs = {}  # blob name -> number of index entries using it
+        self._total = 0  # sum of _blob_sizes
+
+    def _url_key(self, url):
+        return hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+    def _ensure_loaded(self):
+        if self._index is not None:
+            return
+        self._index = OrderedDict()
+        entries = []
+        try:
+            os.makedirs(self.blob_dir, exist_ok=True)
+            os.makedirs(self.meta_dir, exist_ok=True)
+            for name in os.listdir(self.meta_dir):
+                if not name.endswith(".json"):
+                    continue
+                try:
+                    with open(os.path.join(self.meta_dir, name), "r") as f:
+                        meta = json.load(f)
+                    blob_path = os.path.join(self.blob_dir, meta["blob"])
+                    if not os.path.exists(blob_path):
+                        os.remove(os.path.join(self.meta_dir, name))
+                        continue
+                    entries.append((name[:-5], meta))
+                except Exception:
+                    continue
+        except Exception as e:
+            print(f"[IMAGE-CACHE] Failed to load index: {e}")
+
+        entries.sort(key=lambda kv: kv[1].get("accessed", 0))
+        for key, meta in entries:
+            self._add_locked(key, meta)
+
+    def _add_locked(self, key, meta):
+        """Indexes meta under key, replacing (and unreferencing) any old entry."""
+        self._remove_locked(key)
+        self._index[key] = meta
+        blob = meta["blob"]
+        if blob not in self._blob_sizes:
+            self._blob_sizes[blob] = meta.get("size", 0)
+            self._total += self._blob_sizes[blob]
+        self._blob_refs[blob] = self._blob_refs.get(blob, 0) + 1
+
+    def _remove_locked(self, key):
+        """Drops key from the index. Returns its blob if nothing else uses it."""
+        meta = self._index.pop(key, None)
+        if meta is None:
+            return None
+        blob = meta["blob"]
+        refs = self._blob_refs.get(blob, 0) - 1
+        if refs > 0:
+            self._blob_refs[blob] = refs
+            return None
+        self._blob_refs.pop(blob, None)
+        self._total -= self._blob_sizes.pop(blob, 0)
+        return blob
+
+    def _write_meta(self, key, meta):
+        path = os.path.join(self.meta_dir, key + ".json")
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp, path)
+
+    def _remove_files(self, keys, blobs):
+        for key in keys:
+            try:
+                os.remove(os.path.join(self.meta_dir, key + ".json"))
+            except OSError:
+                pass
+        for blob in blobs:
+            try:
+                os.remove(os.path.join(self.blob_dir, blob))
+            except OSError:
+                pass
+
+    def lookup(self, url):
+        """Returns a copy of the metadata for url, or None."""
+        with self._lock:
+            self._ensure_loaded()
+            meta = self._index.get(self._url_key(url))
+            return dict(meta) if meta else None
+
+    def read(self, url):
+        """Returns cached bytes for url (regardless of freshness), or None."""
+        key = self._url_key(url)
+        now = time.time()
+        with self._lock:
+            self._ensure_loaded()
+            meta = self._index.get(key)
+            if not meta:
+                return None
+            self._index.move_to_end(key)
+            # Persist access times coarsely so LRU order survives restarts
+            # without a metadata write on every scroll.
+            persist = now - meta.get("accessed", 0) > 3600
+            meta["accessed"] = now
+            snapshot = dict(meta) if persist else None
+
+        try:
+            with open(os.path.join(self.blob_dir, meta["blob"]), "rb") as f:
+                data = f.read()
+        except OSError:
+            with self._lock:
+                if self._index.get(key) is meta:
+                    self._remove_locked(key)
+            return None
+
+        if snapshot:
+            try:
+                self._write_meta(key, snapshot)
+            except Exception:
+                pass
+        return data
+
+    def store(self, url, data, etag=None, last_modified=None, expires=None):
+        blob = hashlib.sha256(data).hexdigest()
+        blob_path = os.path.join(self.blob_dir, blob)
+        key = self._url_key(url)
+        now = time.time()
+        meta = {
+            "url": url,
+            "blob": blob,
+            "size": len(data),
+            "etag": etag,
+            "last_modified": last_modified,
+            "expires": expires or now + MIN_IMAGE_TTL,
+            "accessed": now,
+        }
+        try:
+            with self._lock:
+                self._ensure_loaded()
+                written = blob in self._blob_sizes
+            if not written:
+                tmp = f"{blob_path}.{threading.get_ident()}.tmp"
+                with open(tmp, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, blob_path)
+
+            with self._lock:
+                self._add_locked(key, meta)
+                evicted_keys, evicted_blobs = self._evict_locked()
+
+            self._write_meta(key, meta)
+            self._remove_files(evicted_keys, evicted_blobs)
+        except Exception as e:
+            print(f"[IMAGE-CACHE] Failed to store {url}: {e}")
+
+    def refresh(self, url, expires):
+        """Extends the freshness of an entry after a 304 Not Modified."""
+        key = self._url_key(url)
+        with self._lock:
+            self._ensure_loaded()
+            meta = self._index.get(key)
+            if not meta:
+                return
+            meta["expires"] = expires
+            meta["accessed"] = time.time()
+            self._index.move_to_end(key)
+            snapshot = dict(meta)
+        try:
+            self._write_meta(key, snapshot)
+        except Exception:
+            pass
+
+    def _evict_locked(self):
+        """Unindexes the least recently used entries; returns the files to remove."""
+        keys = []
+        blobs = []
+        while self._total > self.max_bytes and self._index:
+            key = next(iter(self._index))
+            keys.append(key)
+            blob = self._remove_locked(key)
+            if blob:
+                blobs.append(blob)
+        return keys, blobs
+
+
+DISK_CACHE = ImageDiskCache()
+
+
+def fetch_image_bytes(url, timeout=10, headers=None):
+    """
+    Returns the raw bytes for an image URL, going through the disk cache.
+    Fresh entries are served without touching the network; stale ones are
+    revalidated with If-None-Match/If-Modified-Since. Raises on failure.
+    """
+    meta = DISK_CACHE.lookup(url)
+    now = time.time()
+
+    if meta and meta.get("expires", 0) > now:
+        data = DISK_CACHE.read(url)
+        if data:
+            return data
+        meta = None
+
+    req_headers = dict(DEFAULT_HEADERS)
+    if headers:
+        req_headers.update(headers)
+    if meta:
+        if meta.get("etag"):
+            req_headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            req_headers["If-Modified-Since"] = meta["last_modified"]
+
+    try:
+        resp = HTTP.request("GET", url, headers=req_headers, timeout=timeout)
+    except Exception:
+        # Offline: a stale copy beats no artwork at all
+        if meta:
+            data = DISK_CACHE.read(url)
+            if data:
+                return data
+        raise
+
+    if resp.status == 304 and meta:
+        DISK_CACHE.refresh(url, _parse_expiry(resp.headers, now))
+        data = DISK_CACHE.read(url)
+        if data:
+            return data
+    if resp.status != 200:
+        raise Exception(f"HTTP {resp.status}")
+
+    data = resp.data
+    DISK_CACHE.store(
+        url,
+        data,
+        etag=resp.headers.get("ETag"),
+        last_modified=resp.headers.get("Last-Modified"),
+        expires=_parse_expiry(resp.headers, now),
+    )
+    return data
+
+
+class _FetchJob:
+    __slots__ = ("key", "work", "waiters", "started")
+
+    def __init__(self, key, work):
+        self.key = key
+        self.work = work
+        self.waiters = []  # [(owner, callback)]
+        self.started = False
+
+
+class ImageFetchPool:
+    """
+    Fixed-size worker pool for artwork loading.
+
+    - One in-flight job per key (normally the URL); later requests for the same
+      key just add a waiter.
+    - Newest requests run first, so rows that were just bound (the visible
+      ones) are served before rows that scrolled past.
+    - cancel(owner) drops an owner's waiters; jobs left without waiters are
+      discarded before they start.
+
+    Callbacks run on the worker thread as callback(result, error); use
+    GLib.idle_add to touch widgets.
+    """
+
+    def __init__(self, workers=HOST_CONNECTIONS):
+        self.workers = workers
+        self._cond = threading.Condition()
+        self._heap = []  # (-seq, key)
+        self._jobs = {}  # key -> _FetchJob
+        self._owner_keys = {}  # owner -> keys it waits on, so cancel is O(own jobs)
+        self._seq = 0
+        self._threads = []
+
+    def _ensure_workers(self):
+        if self._threads:
+            return
+        for i in range(self.workers):
+            t = threading.Thread(
+                target=self._worker, name=f"image-fetch-{i}", daemon=True
+            )
+            t.start()
+            self._threads.append(t)
+
+    def submit(self, key, work, callback, owner=None):
+        with self._cond:
+            self._ensure_workers()
+            job = self._jobs.get(key)
+            if job is None:
+                job = _FetchJob(key, work)
+                self._jobs[key] = job
+            job.waiters.append((owner, callback))
+            if owner is not None:
+                self._owner_keys.setdefault(owner, set()).add(key)
+            if not job.started:
+                # (Re)push with a newer sequence number to bump its priority;
+                # older heap entries for the same key are skipped when popped.
+                self._seq += 1
+                heapq.heappush(self._heap, (-self._seq, key))
+                self._cond.notify()
+
+    def fetch(self, url, callback, owner=None, fallbacks=None):
+        """
+        Fetches image bytes for url, trying fallbacks in order on failure.
+        The callback receives ((data, working_url), None) or (None, error).
+        """
+        chain = [url] + list(fallbacks or [])
+
+        def work():
+            error = None
+            for candidate in chain:
+                try:
+                    return fetch_image_bytes(candidate), candidate
+                except Exception as e:
+                    error = e
+            raise error
+
+        self.submit(url, work, callback, owner)
+
+    def cancel(self, owner):
+        if owner is None:
+            return
+        with self._cond:
+            for key in self._owner_keys.pop(owner, ()):
+                job = self._jobs.get(key)
+                if job is None:
+                    continue
+                job.waiters = [w for w in job.waiters if w[0] is not owner]
+                if not job.waiters and not job.started:
+                    del self._jobs[key]
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                job = None
+                while job is None:
+                    while not self._heap:
+                        self._cond.wait()
+                    _, key = heapq.heappop(self._heap)
+                    candidate = self._jobs.get(key)
+                    if candidate is not None and not candidate.started:
+                        candidate.started = True
+                        job = candidate
+
+            result, error = None, None
+            try:
+                result = job.work()
+            except Exception as e:
+                error = e
+
+            with self._cond:
+                if self._jobs.get(job.key) is job:
+                    del self._jobs[job.key]
+                waiters = list(job.waiters)
+                for owner, _ in waiters:
+                    keys = self._owner_keys.get(owner)
+                    if keys is not None:
+                        keys.discard(job.key)
+                        if not keys:
+                            del self._owner_keys[owner]
+
+            for _, callback in waiters:
+                try:
+                    callback(result, error)
+                except Exception as e:
+                    print(f"[IMAGE-POOL] Callback error: {e}")
+
+
+IMAGE_POOL = ImageFetchPool()
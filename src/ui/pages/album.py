@@ -78,15 +78,11 @@ class AlbumPage(BasePlaylistPage):
             song_text = "song" if track_count == 1 else "songs"
             meta2 = f"{track_count} {song_text}"
 
-            # High-Res Cover art hack
+            # High-Res Cover art hack (tracks already fall back to the cover)
             if thumbnails:
                 for t in thumbnails:
                     if "url" in t:
                         t["url"] = re.sub(r"w\d+-h\d+", "w544-h544", t["url"])
-                # Propagate cover to tracks
-                for t in tracks:
-                    if not t.get("thumbnails"):
-                        t["thumbnails"] = thumbnails
 
             GObject.idle_add(
                 self.update_ui, title, description, meta1, meta2, thumbnails, tracks
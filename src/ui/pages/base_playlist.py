@@ -1,8 +1,8 @@
 from gi.repository import Gtk, Adw, GObject, GLib, Pango, Gdk, Gio
 import threading
 import re
-from api.client import MusicClient
-from ui.utils import AsyncImage, LikeButton, get_yt_music_link
+from api.client import MusicClient, fold_text
+from ui.utils import AsyncImage, LikeButton, get_yt_music_link, filter_change
 from ui.models.song import SongItem
 from ui.widgets.song_row import SongRowWidget
 
@@ -187,6 +187,7 @@ class BasePlaylistPage(Adw.Bin):
         self.filter_model = Gtk.FilterListModel(model=self.store)
         self.custom_filter = Gtk.CustomFilter.new(self._filter_func)
         self.filter_model.set_filter(self.custom_filter)
+        self.filter_model.set_incremental(True)
 
         self.sort_model = Gtk.SortListModel(model=self.filter_model)
         # We'll set the sorter in subclasses or on sort change
@@ -267,14 +268,15 @@ class BasePlaylistPage(Adw.Bin):
             widget.stop_handlers()
 
     def _filter_func(self, item):
-        if not self.current_filter_text:
-            return True
-        text = self.current_filter_text.lower()
-        return text in item.title.lower() or text in item.artist.lower()
+        return self.current_filter_text in item.search_key
 
     def filter_content(self, text):
-        self.current_filter_text = text.strip()
-        self.custom_filter.changed(Gtk.FilterChange.DIFFERENT)
+        text = fold_text(text)
+        if text == self.current_filter_text:
+            return
+        change = filter_change(self.current_filter_text, text)
+        self.current_filter_text = text
+        self.custom_filter.changed(change)
 
     def _on_scroll(self, vadjust):
         val = vadjust.get_value()
@@ -390,10 +392,10 @@ class BasePlaylistPage(Adw.Bin):
 
         if append:
             self.store.splice(self.store.get_n_items(), 0, new_items)
-            self.current_tracks.extend(tracks[start_idx:])
+            self.current_tracks.extend(item.track_data for item in new_items)
         else:
             self.store.splice(0, self.store.get_n_items(), new_items)
-            self.current_tracks = list(tracks)
+            self.current_tracks = [item.track_data for item in new_items]
 
     def _update_playing_indicator(self, *args):
         current_id = self.player.current_video_id
@@ -478,36 +480,23 @@ class BasePlaylistPage(Adw.Bin):
             else:
                 return
         elif sort_type == 1:
-            self.current_tracks.sort(key=lambda x: x.get("title", "").lower())
+            self.current_tracks.sort(key=lambda x: x.title.lower())
         elif sort_type == 2:
             self.current_tracks.sort(
                 key=lambda x: (
-                    x.get("artists", [{}])[0].get("name", "").lower()
-                    if x.get("artists")
-                    else "",
-                    x.get("title", "").lower(),
+                    (x.artists[0][0] or "").lower() if x.artists else "",
+                    x.title.lower(),
                 )
             )
         elif sort_type == 3:
             self.current_tracks.sort(
-                key=lambda x: (
-                    x.get("album", {}).get("name", "").lower()
-                    if isinstance(x.get("album"), dict)
-                    else str(x.get("album") or "").lower(),
-                    x.get("title", "").lower(),
-                )
+                key=lambda x: ((x.album or "").lower(), x.title.lower())
             )
         elif sort_type == 4:  # Duration
-            self.current_tracks.sort(key=lambda x: x.get("duration_seconds", 0))
+            self.current_tracks.sort(key=lambda x: x.duration_seconds or 0)
         elif sort_type == 5:  # Year
-            self.current_tracks.sort(
-                key=lambda x: (
-                    str(x.get("year", "0"))
-                    if "year" in x
-                    else str(x.get("album", {}).get("year", "0"))
-                ),
-                reverse=True,
-            )
+            # Track records carry no per-track year; keep the album order
+            return
 
         self.store.remove_all()
         new_items = []
@@ -2,10 +2,37 @@ import threading
 import os
 import tempfile
 from gi.repository import Gtk, Adw, GObject, GLib, Pango, Gdk, Gio, GdkPixbuf
-from api.client import MusicClient
-from ui.utils import AsyncImage, LikeButton, get_yt_music_link
+from api.client import MusicClient, parse_track, track_search_key, fold_text
+from ui.utils import AsyncImage, LikeButton, get_yt_music_link, filter_change
 from ui.crop_dialog import ImageCropDialog
 
+# Rows added to the track list per main-loop iteration
+ROW_BATCH = 200
+
+# Sort dropdown index -> TrackItem properties to sort by, in order.
+# Index 0 ("Default") is the playlist order and has no sorter.
+SORT_KEYS = {
+    1: ("title",),
+    2: ("artist", "title"),
+    3: ("album", "title"),
+    4: ("duration",),
+}
+
+
+def _make_sorter(sort_type):
+    keys = SORT_KEYS.get(sort_type)
+    if not keys:
+        return None
+    sorter = Gtk.MultiSorter()
+    for key in keys:
+        expression = Gtk.PropertyExpression.new(TrackItem, None, key)
+        if key == "duration":
+            sorter.append(Gtk.NumericSorter.new(expression))
+        else:
+            sorter.append(Gtk.StringSorter.new(expression))
+    return sorter
+
+
 # ── GObject Models ────────────────────────────────────────────────────────────
 
 
@@ -19,9 +46,24 @@ class HeaderItem(GObject.Object):
 class TrackItem(GObject.Object):
     __gtype_name__ = "TrackItem"
 
-    def __init__(self, data: dict):
-        super().__init__()
+    # Sort keys, read by the Gtk sorters through property expressions. The
+    # sorters build their collation keys from these once per item.
+    title = GObject.Property(type=str, default="")
+    artist = GObject.Property(type=str, default="")
+    album = GObject.Property(type=str, default="")
+    duration = GObject.Property(type=int, default=0)
+
+    def __init__(self, data):
+        data = parse_track(data)
+        super().__init__(
+            title=data.title or "",
+            artist=(data.artists[0][0] if data.artists else None) or "",
+            album=data.album or "",
+            duration=data.duration_seconds or 0,
+        )
         self.data = data
+        # Built once here so filtering never touches the strings again
+        self.search_key = track_search_key(self.data)
 
 
 # ── Page ──────────────────────────────────────────────────────────────────────
@@ -180,6 +222,14 @@ class PlaylistPage(Adw.Bin):
         action_delete.connect("activate", self.on_delete_clicked)
         self.action_group.add_action(action_delete)
 
+        action_download = Gio.SimpleAction.new("download_offline", None)
+        action_download.connect("activate", self._on_download_offline)
+        self.action_group.add_action(action_download)
+
+        action_remove_download = Gio.SimpleAction.new("remove_offline", None)
+        action_remove_download.connect("activate", self._on_remove_offline)
+        self.action_group.add_action(action_remove_download)
+
         # We need to track visibility of edit/delete in the menu
         # Gio.MenuItem doesn't have set_visible, so we might need to refresh the menu
 
@@ -221,8 +271,18 @@ class PlaylistPage(Adw.Bin):
         self.header_store.append(HeaderItem())
 
         self.track_store = Gio.ListStore(item_type=TrackItem)
+        self._pending_rows = []  # Tracks waiting to be spliced into track_store
+        self._rows_flush_id = 0
+        self._stream_token = None  # identifies the page's running stream
+        self._queue_stream_token = None  # stream still extending the queue
+        # track_store stays in playlist order; sorting happens in this layer,
+        # so appended pages are merged into a sorted view, not re-sorted.
+        self.sort_model = Gtk.SortListModel.new(self.track_store, None)
+        self.sort_model.set_incremental(True)
         self.track_filter = Gtk.CustomFilter.new(self._track_filter_func, None)
-        self.filter_model = Gtk.FilterListModel.new(self.track_store, self.track_filter)
+        self.filter_model = Gtk.FilterListModel.new(self.sort_model, self.track_filter)
+        # Filter in batches across frames so typing never waits for a full pass
+        self.filter_model.set_incremental(True)
 
         self.master_store = Gio.ListStore(item_type=Gio.ListModel)
         self.master_store.append(self.header_store)
@@ -289,7 +349,7 @@ class PlaylistPage(Adw.Bin):
         self.set_child(self.stack)
 
         self.current_tracks = []
-        self.current_limit = 50
+        self._continuation = None  # Token for the next page of tracks
         self.is_loading_more = False
         self.current_filter_text = ""
 
@@ -412,15 +472,13 @@ class PlaylistPage(Adw.Bin):
         row = bin_widget._lv_track_ui
         t = item.data
 
-        title = t.get("title", "Unknown")
-        artist_list = t.get("artists", [])
-        artist = ", ".join(a.get("name", "") for a in artist_list)
+        title = t.title
+        artist = t.artist
 
         row._title_label.set_label(title)
         row._subtitle_label.set_label(artist)
 
-        thumbnails = t.get("thumbnails", [])
-        thumb_url = thumbnails[-1]["url"] if thumbnails else None
+        thumb_url = t.thumb
 
         # Album view: show track number instead of thumbnail
         is_album = getattr(self, "_is_album_view", False)
@@ -436,7 +494,7 @@ class PlaylistPage(Adw.Bin):
             row._lv_track_num.set_visible(False)
             row._lv_img.set_visible(True)
             if thumb_url:
-                row._lv_img.video_id = t.get("videoId")
+                row._lv_img.video_id = t.video_id
                 if row._lv_img.url != thumb_url:
                     row._lv_img.load_url(thumb_url)
             else:
@@ -444,39 +502,33 @@ class PlaylistPage(Adw.Bin):
                 row._lv_img.set_from_icon_name("media-optical-symbolic")
                 row._lv_img.url = None
 
-        dur_sec = t.get("duration_seconds")
-        dur_text = (
-            f"{dur_sec // 60}:{dur_sec % 60:02d}" if dur_sec else t.get("duration", "")
-        )
-        row._lv_dur_lbl.set_label(dur_text or "")
+        dur_text = t.duration
+        row._lv_dur_lbl.set_label(dur_text)
         row._lv_dur_lbl.set_visible(bool(dur_text))
 
-        is_explicit = t.get("isExplicit") or t.get("explicit", False)
-        row._lv_explicit_badge.set_visible(bool(is_explicit))
+        row._lv_explicit_badge.set_visible(t.explicit)
 
         _clear_box(row._lv_like_box)
-        if t.get("videoId"):
-            like_btn = LikeButton(
-                self.client, t["videoId"], t.get("likeStatus", "INDIFFERENT")
-            )
+        if t.video_id:
+            like_btn = LikeButton(self.client, t.video_id, t.like_status)
             row._lv_like_box.append(like_btn)
 
-        has_id = bool(t.get("videoId"))
+        has_id = bool(t.video_id)
         list_item.set_activatable(has_id)
         list_item.set_selectable(has_id)
         row.set_sensitive(has_id)
 
         row._lv_video_data = {
-            "id": t.get("videoId"),
+            "id": t.video_id,
             "title": title,
             "artist": artist,
             "thumb": thumb_url,
-            "setVideoId": t.get("setVideoId") or t.get("playlistId"),
+            "setVideoId": t.set_video_id,
         }
         row._lv_full_track = t
 
         # Playing indicator: check if this track is currently playing
-        video_id = t.get("videoId")
+        video_id = t.video_id
         is_playing = bool(video_id and video_id == self.player.current_video_id)
         if is_playing:
             row.add_css_class("playing")
@@ -518,8 +570,9 @@ class PlaylistPage(Adw.Bin):
 
         row._title_label.set_label("")
         row._subtitle_label.set_label("")
+        # Cancel the pending cover fetch so recycled rows don't queue stale work
+        row._lv_img.cancel()
         row._lv_img.set_paintable(None)
-        row._lv_img.url = None
         row._lv_dur_lbl.set_label("")
         row._lv_dur_lbl.set_visible(False)
         row.remove_css_class("playing")
@@ -551,23 +604,43 @@ class PlaylistPage(Adw.Bin):
     # ── Filter ────────────────────────────────────────────────────────────────
 
     def _track_filter_func(self, item, _user_data):
-        if not self.current_filter_text:
-            return True
-        t = item.data
-        title = t.get("title", "").lower()
-        artist = ", ".join(a.get("name", "") for a in t.get("artists", [])).lower()
-        return self.current_filter_text in title or self.current_filter_text in artist
+        return self.current_filter_text in item.search_key
 
     def filter_content(self, text):
-        self.current_filter_text = text.lower().strip()
-        self.track_filter.changed(Gtk.FilterChange.DIFFERENT)
+        text = fold_text(text)
+        if text == self.current_filter_text:
+            return
+        change = filter_change(self.current_filter_text, text)
+        self.current_filter_text = text
+        self.track_filter.changed(change)
 
     # ── Store helpers ─────────────────────────────────────────────────────────
 
-    def _add_track_row(self, t):
-        self.track_store.append(TrackItem(t))
+    def _add_track_rows(self, tracks):
+        """
+        Adds rows in batches: the first ROW_BATCH right away, the rest from
+        idle callbacks so long lists never block a frame.
+        """
+        self._pending_rows.extend(tracks)
+        if not self._rows_flush_id and self._flush_track_rows():
+            self._rows_flush_id = GLib.idle_add(self._flush_track_rows)
+
+    def _flush_track_rows(self):
+        batch = self._pending_rows[:ROW_BATCH]
+        del self._pending_rows[:ROW_BATCH]
+        self.track_store.splice(
+            self.track_store.get_n_items(), 0, [TrackItem(t) for t in batch]
+        )
+        if self._pending_rows:
+            return True
+        self._rows_flush_id = 0
+        return False
 
     def _clear_track_store(self):
+        self._pending_rows.clear()
+        if self._rows_flush_id:
+            GLib.source_remove(self._rows_flush_id)
+            self._rows_flush_id = 0
         self.track_store.remove_all()
 
     # ── Scroll / lazy load ────────────────────────────────────────────────────
@@ -602,12 +675,7 @@ class PlaylistPage(Adw.Bin):
                 end_index = min(start_index + 50, len(self.original_tracks))
                 new_tracks = self.original_tracks[start_index:end_index]
                 self.current_tracks.extend(new_tracks)
-
-                if self.sort_dropdown.get_selected() != 0:
-                    self.reorder_playlist(self.sort_dropdown.get_selected())
-                else:
-                    for t in new_tracks:
-                        self._add_track_row(t)
+                self._add_track_rows(new_tracks)
 
                 self.load_more_spinner.set_visible(False)
                 self.is_loading_more = False
@@ -616,17 +684,47 @@ class PlaylistPage(Adw.Bin):
         if getattr(self, "is_fully_loaded", False):
             return
 
+        # The streaming fetch is already bringing in the remaining pages
+        if getattr(self, "_is_background_fetching", False):
+            return
+
+        if not self._continuation:
+            self.is_fully_loaded = True
+            return
+
         self.is_loading_more = True
         self.load_more_spinner.set_visible(True)
-        self.current_limit = len(self.current_tracks) + 50
-        print(f"Loading more... Limit now {self.current_limit}")
+        print(f"Loading more... ({len(self.current_tracks)} tracks so far)")
 
         thread = threading.Thread(
-            target=self._fetch_playlist_details, args=(self.playlist_id, True)
+            target=self._fetch_next_page,
+            args=(self.playlist_id, self._continuation),
         )
         thread.daemon = True
         thread.start()
 
+    def _fetch_next_page(self, playlist_id, continuation):
+        try:
+            data = self.client.get_playlist_page(
+                playlist_id,
+                continuation=continuation,
+                is_collaborative=getattr(self, "_is_collaborative", False),
+            )
+            tracks = data.get("tracks", []) if data else []
+            next_token = data.get("continuation") if data else None
+            GObject.idle_add(self._append_page, playlist_id, tracks, next_token)
+        except Exception as e:
+            print(f"Error fetching next page: {e}")
+            self.is_loading_more = False
+            GObject.idle_add(self.load_more_spinner.set_visible, False)
+
+    def _append_page(self, playlist_id, tracks, continuation):
+        # The user may have navigated to another playlist meanwhile
+        if playlist_id != self.playlist_id:
+            return False
+        self._append_tracks(tracks, continuation)
+        return False
+
     def _on_map(self, widget):
         if hasattr(self, "vadjust"):
             if self.vadjust.get_value() > 50:
@@ -652,7 +750,11 @@ class PlaylistPage(Adw.Bin):
         # 2. Copy Link (Always shown)
         self.more_menu_model.append("Copy Link", "page.copy_link")
 
-        # 3. Edit/Delete (Only if owned/editable)
+        # 3. Offline copies
+        self.more_menu_model.append("Download for Offline", "page.download_offline")
+        self.more_menu_model.append("Remove Offline Download", "page.remove_offline")
+
+        # 4. Edit/Delete (Only if owned/editable)
         if is_owned:
             self.more_menu_model.append("Edit Playlist", "page.edit")
             self.more_menu_model.append("Delete Playlist", "page.delete")
@@ -675,6 +777,29 @@ class PlaylistPage(Adw.Bin):
 
         threading.Thread(target=thread_func, daemon=True).start()
 
+    def _offline_video_ids(self):
+        # Prefer the complete list once the background fetch has it
+        tracks = self.current_tracks
+        if getattr(self, "is_fully_fetched", False) and getattr(
+            self, "original_tracks", None
+        ):
+            tracks = self.original_tracks
+        return [t.get("videoId") for t in tracks if t.get("videoId")]
+
+    def _on_download_offline(self, action, param):
+        video_ids = self._offline_video_ids()
+        if not video_ids:
+            return
+        self.player.download_tracks(video_ids)
+        self._show_toast(f"Downloading {len(video_ids)} tracks for offline use")
+
+    def _on_remove_offline(self, action, param):
+        video_ids = self._offline_video_ids()
+        if not video_ids:
+            return
+        self.player.remove_downloads(video_ids)
+        self._show_toast("Offline download removed")
+
     def _show_toast(self, message):
         root = self.get_root()
         if hasattr(root, "add_toast"):
@@ -689,7 +814,12 @@ class PlaylistPage(Adw.Bin):
         if self.playlist_id != playlist_id:
             self.playlist_id = playlist_id
             self.playlist_title_text = ""
-            self.current_limit = 50
+            self._continuation = None
+            # Any running stream keeps feeding the player queue, not this page
+            stream_token = self._stream_token
+            self._stream_token = None
+            self._stop_stream(stream_token)
+            self._is_background_fetching = False
             self.emit("header-title-changed", "")
             self.current_tracks = []
             self._is_previewing_cover = False
@@ -718,21 +848,6 @@ class PlaylistPage(Adw.Bin):
             self.stack.set_visible_child_name("content")
             self.content_spinner.set_visible(True)
         else:
-            cached_tracks = self.client.get_cached_playlist_tracks(self.playlist_id)
-            if cached_tracks is not None:
-                print(
-                    f"Loading playlist {playlist_id} from cache ({len(cached_tracks)} tracks)"
-                )
-                self.is_fully_loaded = True
-                self.original_tracks = list(cached_tracks)
-                self.current_tracks = list(cached_tracks)
-                thread = threading.Thread(
-                    target=self._fetch_playlist_details, args=(playlist_id,)
-                )
-                thread.daemon = True
-                thread.start()
-                return
-
             if self.stack.get_visible_child_name() != "content":
                 self.stack.set_visible_child_name("loading")
                 self.playlist_name_label.set_label("Loading...")
@@ -745,14 +860,48 @@ class PlaylistPage(Adw.Bin):
                 self.content_spinner.set_visible(False)
 
         thread = threading.Thread(
-            target=self._fetch_playlist_details, args=(playlist_id,)
+            target=self._load_cached_or_fetch, args=(playlist_id,)
         )
         thread.daemon = True
         thread.start()
 
     # ── Fetch ─────────────────────────────────────────────────────────────────
 
-    def _fetch_playlist_details(self, playlist_id, is_incremental=False):
+    def _load_cached_or_fetch(self, playlist_id):
+        """Renders a stored copy first, then hits the network only if it is stale."""
+        cached = self.client.get_cached_playlist(playlist_id)
+        if cached is not None and cached[1]:
+            tracks, meta, is_stale = cached
+            self._showing_cached = True
+            print(
+                f"Loading playlist {playlist_id} from cache ({len(tracks)} tracks, stale={is_stale})"
+            )
+            GObject.idle_add(self._render_cached, playlist_id, tracks, meta)
+            if not is_stale:
+                return
+
+        self._fetch_playlist_details(playlist_id)
+
+    def _render_cached(self, playlist_id, tracks, meta):
+        if playlist_id != self.playlist_id:
+            return False
+        self._showing_cached = True
+        self.update_ui(
+            meta.get("title", ""),
+            meta.get("description", ""),
+            meta.get("meta1", ""),
+            meta.get("meta2", ""),
+            meta.get("thumbnails", []),
+            list(tracks),
+            False,
+            meta.get("total_tracks"),
+            meta.get("is_owned", False),
+            None,
+            from_cache=True,
+        )
+        return False
+
+    def _fetch_playlist_details(self, playlist_id):
         try:
             if playlist_id.startswith("OLAK"):
                 try:
@@ -763,11 +912,15 @@ class PlaylistPage(Adw.Bin):
                 except Exception as e:
                     print(f"Error converting OLAK to browseId: {e}")
 
+            # Read before fetching so an edit made meanwhile isn't cached over
+            generation = self.client.playlist_generation(playlist_id)
             count_str = None
             album_type = None
+            continuation = None
 
             if playlist_id == "LM":
-                data = self.client.get_liked_songs(limit=self.current_limit)
+                data = self.client.get_playlist_page("LM") or {}
+                continuation = data.get("continuation")
                 title = "Your Likes"
                 description = "Your liked songs from YouTube Music."
                 tracks = data.get("tracks", []) if isinstance(data, dict) else data
@@ -833,13 +986,8 @@ class PlaylistPage(Adw.Bin):
                     else:
                         author = GLib.markup_escape_text(str(artist_data))
 
-                    if thumbnails:
-                        for t in thumbnails:
-                            if "url" in t:
-                                pass  # Systematic upgrade handled by utils.py
-                        for track in tracks:
-                            if not track.get("thumbnails"):
-                                track["thumbnails"] = thumbnails
+                    # Tracks already fall back to the cover (see client.get_album);
+                    # its systematic upgrade is handled by utils.py
                     is_owned = self.client.is_own_playlist(
                         data, playlist_id=playlist_id
                     )
@@ -848,17 +996,13 @@ class PlaylistPage(Adw.Bin):
                     return
             else:
                 try:
-                    print(
-                        f"Fetching playlist: {playlist_id} (Limit: {self.current_limit})"
-                    )
+                    print(f"Fetching playlist: {playlist_id} (first page)")
 
                     # retry for brand new playlists (eventual consistency)
                     data = None
                     for attempt in range(3):
                         try:
-                            data = self.client.get_playlist(
-                                playlist_id, limit=self.current_limit
-                            )
+                            data = self.client.get_playlist_page(playlist_id)
                             if data and data.get("title"):
                                 break
                         except Exception as e:
@@ -872,6 +1016,8 @@ class PlaylistPage(Adw.Bin):
                     if not data:
                         raise Exception("Failed to fetch playlist after retries")
 
+                    continuation = data.get("continuation")
+                    self._is_collaborative = "collaborators" in data
                     title = (
                         data.get("title")
                         or self.playlist_title_text
@@ -1004,20 +1150,33 @@ class PlaylistPage(Adw.Bin):
                 meta2,
                 thumbnails,
                 tracks,
-                is_incremental,
+                False,
                 track_count,
                 is_owned,
+                continuation,
             )
 
-            if (
-                not is_incremental
-                and track_count is not None
-                and len(tracks) < track_count
-            ):
-                if not self.playlist_id.startswith(
-                    "MPRE"
-                ) and not self.playlist_id.startswith("OLAK"):
-                    self._start_background_full_fetch()
+            if continuation and track_count is not None and len(tracks) < track_count:
+                if not playlist_id.startswith("MPRE") and not playlist_id.startswith(
+                    "OLAK"
+                ):
+                    header_meta = self._make_header_meta(
+                        title,
+                        description,
+                        meta1,
+                        meta2,
+                        thumbnails,
+                        track_count,
+                        is_owned,
+                    )
+                    GObject.idle_add(
+                        self._start_streaming_fetch,
+                        playlist_id,
+                        tracks,
+                        continuation,
+                        header_meta,
+                        generation,
+                    )
 
         except Exception as e:
             print(f"Critical error fetching playlist: {e}")
@@ -1037,7 +1196,14 @@ class PlaylistPage(Adw.Bin):
         append=False,
         total_tracks=None,
         is_owned=False,
+        continuation=None,
+        from_cache=False,
     ):
+        """
+        Renders playlist header and tracks. With append=True, `tracks` is only
+        the newly fetched page, which is added after the existing rows.
+        from_cache marks data that came from the track store rather than the network.
+        """
         self.stack.set_visible_child_name("content")
         self.content_spinner.set_visible(False)
 
@@ -1080,45 +1246,40 @@ class PlaylistPage(Adw.Bin):
                 self.cover_img.set_from_icon_name("media-playlist-audio-symbolic")
                 self.cover_img.url = None
 
-        if append:
-            start_index = len(self.current_tracks)
-            new_tracks = tracks[start_index:]
-
-            if not new_tracks:
-                print("No new tracks found. Playlist fully loaded.")
-                self.is_fully_loaded = True
-                self.load_more_spinner.set_visible(False)
-                self.is_loading_more = False
-                return
-
-            print(f"Appending {len(new_tracks)} new tracks (Total: {len(tracks)})")
-            self.current_tracks.extend(new_tracks)
-            if hasattr(self, "original_tracks"):
-                self.original_tracks.extend(new_tracks)
-
-            if self.sort_dropdown.get_selected() != 0:
-                self.reorder_playlist(self.sort_dropdown.get_selected())
-            else:
-                for t in new_tracks:
-                    self._add_track_row(t)
-
-            self.load_more_spinner.set_visible(False)
-            self.is_loading_more = False
+        if not append:
+            # Everything needed to render this page again from the track store
+            self._header_meta = self._make_header_meta(
+                title, description, meta1, meta2, thumbnails, total_tracks, is_owned
+            )
 
-            if len(tracks) < self.current_limit:
-                print(
-                    f"Playlist fully loaded ({len(tracks)} < limit {self.current_limit})"
-                )
-                self.is_fully_loaded = True
-            elif total_tracks is not None and len(tracks) >= total_tracks:
-                print(f"Playlist fully loaded ({len(tracks)} >= total {total_tracks})")
-                self.is_fully_loaded = True
+        if append:
+            self._append_tracks(tracks, continuation, total_tracks)
+        elif (
+            not from_cache
+            and getattr(self, "_showing_cached", False)
+            and continuation is not None
+            and self._is_prefix_of_current(tracks)
+        ):
+            # Revalidating a cached render: the first page still matches, so keep
+            # the full cached list on screen and let the background fetch confirm it.
+            print("Cached playlist still matches first page; keeping it.")
         else:
+            if getattr(self, "_showing_cached", False) and not from_cache:
+                # The cached copy is outdated; start over from the fresh first page
+                self.is_fully_fetched = False
+                self.original_tracks = []
+            self._showing_cached = from_cache
+            self._continuation = continuation
             self.is_fully_loaded = False
-            if total_tracks is not None and len(tracks) >= total_tracks:
+            if continuation is None or (
+                total_tracks is not None and len(tracks) >= total_tracks
+            ):
                 self.is_fully_loaded = True
                 self.is_fully_fetched = True
-                self.client.set_cached_playlist_tracks(self.playlist_id, tracks)
+                if not from_cache:
+                    self.client.set_cached_playlist_tracks(
+                        self.playlist_id, tracks, self._header_meta
+                    )
 
             self.current_tracks = list(tracks)
             if not hasattr(self, "original_tracks") or not self.original_tracks:
@@ -1126,54 +1287,189 @@ class PlaylistPage(Adw.Bin):
             self.sort_dropdown.set_selected(0)
 
             self._clear_track_store()
-            for t in tracks:
-                self._add_track_row(t)
+            self._add_track_rows(tracks)
 
         if len(self.current_tracks) > 0 and len(self.current_tracks) == len(
             getattr(self, "original_tracks", [])
         ):
             self.is_fully_fetched = True
 
-    # ── Background fetch ──────────────────────────────────────────────────────
+    @staticmethod
+    def _make_header_meta(
+        title, description, meta1, meta2, thumbnails, total_tracks, is_owned
+    ):
+        return {
+            "title": title,
+            "description": description,
+            "meta1": meta1,
+            "meta2": meta2,
+            "thumbnails": thumbnails,
+            "total_tracks": total_tracks,
+            "is_owned": is_owned,
+        }
 
-    def _start_background_full_fetch(self):
-        if getattr(self, "is_fully_fetched", False):
+    def _is_prefix_of_current(self, tracks):
+        if len(tracks) > len(self.current_tracks):
+            return False
+        return all(
+            a.get("videoId") == b.get("videoId")
+            for a, b in zip(tracks, self.current_tracks)
+        )
+
+    def _append_tracks(self, new_tracks, continuation, total_tracks=None):
+        """Appends one fetched page of tracks; only the delta is touched."""
+        self._continuation = continuation
+        self.load_more_spinner.set_visible(False)
+        self.is_loading_more = False
+
+        if not new_tracks:
+            print("No new tracks found. Playlist fully loaded.")
+            self.is_fully_loaded = True
             return
-        print(f"Starting background fetch for full playlist: {self.playlist_id}")
 
-        def fetch_job():
+        # Keep original_tracks in step unless the background full fetch
+        # has already replaced it with the complete list.
+        original = getattr(self, "original_tracks", None)
+        if original is not None and len(original) == len(self.current_tracks):
+            original.extend(new_tracks)
+        self.current_tracks.extend(new_tracks)
+        print(
+            f"Appending {len(new_tracks)} new tracks (Total: {len(self.current_tracks)})"
+        )
+
+        self._add_track_rows(new_tracks)
+
+        if continuation is None:
+            print(f"Playlist fully loaded ({len(self.current_tracks)} tracks)")
+            self.is_fully_loaded = True
+        elif total_tracks is not None and len(self.current_tracks) >= total_tracks:
+            print(
+                f"Playlist fully loaded ({len(self.current_tracks)} >= total {total_tracks})"
+            )
+            self.is_fully_loaded = True
+
+        if self.is_fully_loaded and len(self.current_tracks) == len(
+            getattr(self, "original_tracks", [])
+        ):
+            self.is_fully_fetched = True
+
+    # ── Background fetch ──────────────────────────────────────────────────────
+
+    def _start_streaming_fetch(
+        self, playlist_id, first_tracks, continuation, header_meta, generation
+    ):
+        """
+        Fetches the remaining pages one request at a time. Each page is
+        appended to the list (and to the player queue, if it is playing this
+        playlist) as soon as it arrives, so nothing waits for the full list.
+        A cached render on screen is only compared once the stream is done.
+
+        Runs on the main thread. The worker only sees what is passed in here;
+        the token (an Event) is set from the main thread once neither the page
+        nor the player queue needs more pages.
+        """
+        if playlist_id != self.playlist_id:
+            return False
+        print(f"Streaming remaining pages of playlist: {playlist_id}")
+
+        self._stop_stream(self._stream_token)
+        token = threading.Event()
+        token.playlist_id = playlist_id
+        self._stream_token = token
+        self._is_background_fetching = True
+        is_collaborative = getattr(self, "_is_collaborative", False)
+
+        def stream_job():
+            fetched = list(first_tracks)
+            pages = self.client.iter_playlist_pages(
+                playlist_id, continuation, is_collaborative=is_collaborative
+            )
             try:
-                data = self.client.get_playlist(self.playlist_id, limit=5000)
-                tracks = data.get("tracks", [])
-                if tracks:
-                    print(f"Background fetch complete. Fetched {len(tracks)} tracks.")
-                    self.original_tracks = tracks
-                    self.client.set_cached_playlist_tracks(self.playlist_id, tracks)
-                    GObject.idle_add(self._on_background_fetch_complete)
+                for tracks, next_token in pages:
+                    if token.is_set():
+                        pages.close()
+                        return
+                    fetched.extend(tracks)
+                    GObject.idle_add(
+                        self._on_stream_page, token, playlist_id, tracks, next_token
+                    )
             except Exception as e:
-                print(f"Error in background fetch: {e}")
+                print(f"Error streaming playlist: {e}")
+                GObject.idle_add(self._on_stream_complete, token, None)
+                return
 
-        self._is_background_fetching = True
-        self._pending_queue_append = False
-        thread = threading.Thread(target=fetch_job)
+            print(f"Streaming complete. Fetched {len(fetched)} tracks.")
+            self.client.set_cached_playlist_tracks(
+                playlist_id, fetched, header_meta, generation
+            )
+            GObject.idle_add(self._on_stream_complete, token, fetched)
+
+        thread = threading.Thread(target=stream_job)
         thread.daemon = True
         thread.start()
+        return False
 
-    def _on_background_fetch_complete(self):
-        self.is_fully_fetched = True
+    def _stream_wanted(self, token):
+        return token is self._stream_token or (
+            token is self._queue_stream_token
+            and self.player.queue_source_id == token.playlist_id
+        )
+
+    def _stop_stream(self, token):
+        """Tells a stream's worker to stop if nothing needs its pages anymore."""
+        if token is not None and not self._stream_wanted(token):
+            token.set()
+
+    def _on_stream_page(self, token, playlist_id, tracks, continuation):
+        if token is self._stream_token and not getattr(self, "_showing_cached", False):
+            self._append_tracks(tracks, continuation)
+
+        if (
+            token is self._queue_stream_token
+            and self.player.queue_source_id == playlist_id
+        ):
+            self.player.extend_queue(tracks)
+        self._stop_stream(token)
+        return False
+
+    def _on_stream_complete(self, token, fetched):
+        if token is self._queue_stream_token:
+            self._queue_stream_token = None
+        if token is not self._stream_token:
+            return False
         self._is_background_fetching = False
+        if fetched is None:
+            # Failed part way; scrolling can pick up from the last page
+            self._showing_cached = False
+            return False
 
-        if self.sort_dropdown.get_selected() != 0:
-            self.current_tracks = list(self.original_tracks)
-            self.reorder_playlist(self.sort_dropdown.get_selected())
+        self.is_fully_fetched = True
+        self.original_tracks = fetched
+
+        if getattr(self, "_showing_cached", False):
+            # A cached list was kept on screen while revalidating; swap in the
+            # fresh one only if it actually changed.
+            self._showing_cached = False
+            fresh_ids = [t.video_id for t in fetched]
+            shown_ids = [t.video_id for t in self.current_tracks]
+            if fresh_ids != shown_ids:
+                print("Cached playlist was outdated; refreshing tracks.")
+                self.current_tracks = list(fetched)
+                self._clear_track_store()
+                self._add_track_rows(self.current_tracks)
+        return False
 
-        if getattr(self, "_pending_queue_append", False):
-            print("Background fetch complete, extending player queue.")
-            start_index = len(self.current_tracks)
-            new_tracks = self.original_tracks[start_index:]
-            if new_tracks:
-                self.player.extend_queue(new_tracks)
-            self._pending_queue_append = False
+    def _follow_stream_with_queue(self):
+        """Lets the running stream keep extending the queue just started here."""
+        previous = self._queue_stream_token
+        if getattr(self, "_is_background_fetching", False) and not getattr(
+            self, "_showing_cached", False
+        ):
+            self._queue_stream_token = self._stream_token
+        else:
+            self._queue_stream_token = None
+        if previous is not self._queue_stream_token:
+            self._stop_stream(previous)
 
     # ── Song activation ───────────────────────────────────────────────────────
 
@@ -1215,8 +1511,7 @@ class PlaylistPage(Adw.Bin):
             source_id=self.playlist_id,
             is_infinite=self._is_inf(),
         )
-        if getattr(self, "_is_background_fetching", False):
-            self._pending_queue_append = True
+        self._follow_stream_with_queue()
 
     # ── Sort ──────────────────────────────────────────────────────────────────
 
@@ -1224,40 +1519,28 @@ class PlaylistPage(Adw.Bin):
         self.reorder_playlist(dropdown.get_selected())
 
     def reorder_playlist(self, sort_type):
-        if not self.current_tracks:
-            return
-
-        if sort_type == 0:
-            if hasattr(self, "original_tracks") and self.original_tracks:
-                self.current_tracks = list(self.original_tracks)
-            else:
-                return
-        elif sort_type == 1:
-            self.current_tracks.sort(key=lambda x: x.get("title", "").lower())
-        elif sort_type == 2:
-            self.current_tracks.sort(
-                key=lambda x: (
-                    x.get("artists", [{}])[0].get("name", "").lower()
-                    if x.get("artists")
-                    else "",
-                    x.get("title", "").lower(),
-                )
-            )
-        elif sort_type == 3:
-            self.current_tracks.sort(
-                key=lambda x: (
-                    x.get("album", {}).get("name", "").lower()
-                    if isinstance(x.get("album"), dict)
-                    else str(x.get("album") or "").lower(),
-                    x.get("title", "").lower(),
-                )
-            )
-        elif sort_type == 4:  # Duration
-            self.current_tracks.sort(key=lambda x: x.get("duration_seconds", 0))
-
-        self._clear_track_store()
-        for t in self.current_tracks:
-            self._add_track_row(t)
+        # Only the sort layer changes; track_store and its rows are untouched
+        self.sort_model.set_sorter(_make_sorter(sort_type))
+
+    def _sorted_tracks(self):
+        """
+        Tracks in the order the sorted list shows them. Rows still waiting to
+        be added are added now, and an incremental sort in progress is
+        finished first, so the result is complete and fully sorted.
+        """
+        if self._rows_flush_id:
+            GLib.source_remove(self._rows_flush_id)
+            self._rows_flush_id = 0
+        while self._pending_rows:
+            self._flush_track_rows()
+        if self.sort_model.get_pending():
+            # Leaving incremental mode completes the sort synchronously
+            self.sort_model.set_incremental(False)
+            self.sort_model.set_incremental(True)
+        return [
+            self.sort_model.get_item(i).data
+            for i in range(self.sort_model.get_n_items())
+        ]
 
     # ── Right-click ───────────────────────────────────────────────────────────
 
@@ -1407,8 +1690,7 @@ class PlaylistPage(Adw.Bin):
             source_id=self.playlist_id,
             is_infinite=self._is_inf(),
         )
-        if getattr(self, "_is_background_fetching", False):
-            self._pending_queue_append = True
+        self._follow_stream_with_queue()
 
     def on_shuffle_clicked(self, btn):
         if not self.current_tracks:
@@ -1423,8 +1705,7 @@ class PlaylistPage(Adw.Bin):
             source_id=self.playlist_id,
             is_infinite=self._is_inf(),
         )
-        if getattr(self, "_is_background_fetching", False):
-            self._pending_queue_append = True
+        self._follow_stream_with_queue()
 
     def _best_queue(self):
         if (
@@ -1433,6 +1714,8 @@ class PlaylistPage(Adw.Bin):
             and self.sort_dropdown.get_selected() == 0
         ):
             return self.original_tracks
+        if self.sort_dropdown.get_selected() != 0:
+            return self._sorted_tracks()
         return self.current_tracks
 
     def _is_inf(self):
@@ -1706,9 +1989,7 @@ class PlaylistPage(Adw.Bin):
 
                     # Refresh
                     # Clear cache and then reload
-                    if hasattr(self.client, "_playlist_cache"):
-                        if self.playlist_id in self.client._playlist_cache:
-                            del self.client._playlist_cache[self.playlist_id]
+                    self.client.invalidate_playlist_cache(self.playlist_id)
 
                     GLib.idle_add(self.load_playlist, self.playlist_id)
 
@@ -1730,44 +2011,6 @@ class PlaylistPage(Adw.Bin):
         save_btn.connect("clicked", on_save_clicked)
         dialog.present(self.get_native())
 
-    def _fetch_remaining_for_queue(self):
-        if getattr(self, "is_fully_fetched", False):
-            return
-        print("Fetching remaining tracks for queue...")
-
-        def fetch_job():
-            try:
-                existing_count = len(self.current_tracks)
-                data = self.client.get_playlist(self.playlist_id, limit=5000)
-                tracks = data.get("tracks", [])
-                if len(tracks) > existing_count:
-                    new_raw = tracks[existing_count:]
-                    normalized = []
-                    for t in new_raw:
-                        artist = ", ".join(
-                            a.get("name", "") for a in t.get("artists", [])
-                        )
-                        normalized.append(
-                            {
-                                "videoId": t.get("videoId"),
-                                "title": t.get("title"),
-                                "artist": artist,
-                                "thumb": t.get("thumbnails", [])[-1]["url"]
-                                if t.get("thumbnails")
-                                else None,
-                            }
-                        )
-                    if normalized:
-                        GObject.idle_add(self.player.extend_queue, normalized)
-                else:
-                    print("DEBUG: No new tracks found.")
-            except Exception as e:
-                print(f"Error fetching remaining tracks: {e}")
-
-        thread = threading.Thread(target=fetch_job)
-        thread.daemon = True
-        thread.start()
-
     # ── Compact mode ──────────────────────────────────────────────────────────
 
     def set_compact_mode(self, compact):
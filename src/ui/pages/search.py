@@ -1,14 +1,30 @@
 from gi.repository import Gtk, Adw, GObject, GLib, Pango, Gio, Gdk
 import threading
 from api.client import MusicClient
+from api.search_service import SearchService
+from api.suggestions import SuggestionProvider
 from ui.utils import AsyncPicture, LikeButton, parse_item_metadata
 
 
+class SearchResultItem(GObject.Object):
+    """One search result; section holds the dicts of its whole section."""
+
+    __gtype_name__ = "SearchResultItem"
+
+    def __init__(self, data, title, section):
+        super().__init__()
+        self.data = data
+        self.title = title
+        self.section = section
+
+
 class SearchPage(Adw.Bin):
     def __init__(self, player, open_playlist_callback, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.player = player
         self.client = MusicClient()
+        self.search_service = SearchService(self.client)
+        self.suggestions = SuggestionProvider(self.client)
         self.open_playlist_callback = open_playlist_callback
 
         # Layout
@@ -23,18 +39,38 @@ class SearchPage(Adw.Bin):
         self.stack.set_vexpand(True)
 
         # 1. Results View
+        # One ListView with recycled rows; each section is a ListStore in a
+        # FlattenListModel, which also gives the ListView its section headers.
+        self.result_sections = Gio.ListStore(item_type=Gio.ListModel)
+        results_model = Gtk.FlattenListModel.new(self.result_sections)
+
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._setup_result_item)
+        factory.connect("bind", self._bind_result_item)
+        factory.connect("unbind", self._unbind_result_item)
+
+        header_factory = Gtk.SignalListItemFactory()
+        header_factory.connect("setup", self._setup_result_header)
+        header_factory.connect("bind", self._bind_result_header)
+
+        self.results_list = Gtk.ListView.new(
+            Gtk.NoSelection.new(results_model), factory
+        )
+        self.results_list.set_header_factory(header_factory)
+        self.results_list.set_single_click_activate(True)
+        self.results_list.add_css_class("playlist-view")
+        self.results_list.connect("activate", self.on_result_activated)
+        self.results_list.set_margin_start(12)
+        self.results_list.set_margin_end(12)
+        self.results_list.set_margin_bottom(24)
+
         results_scrolled = Gtk.ScrolledWindow()
         results_scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
 
-        results_clamp = Adw.Clamp()
-
-        self.results_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=24)
-        self.results_box.set_margin_top(24)
-        self.results_box.set_margin_bottom(24)
-        self.results_box.set_margin_start(12)
-        self.results_box.set_margin_end(12)
-
-        results_clamp.set_child(self.results_box)
+        results_clamp = (
+            Adw.ClampScrollable() if hasattr(Adw, "ClampScrollable") else Adw.Clamp()
+        )
+        results_clamp.set_child(self.results_list)
         results_scrolled.set_child(results_clamp)
 
         self.stack.add_named(results_scrolled, "results")
@@ -77,6 +113,7 @@ class SearchPage(Adw.Bin):
 
         self.set_child(box)
         self.search_timer = None
+        self._last_query = ""
 
         # Show explore initially
         self.stack.set_visible_child_name("explore")
@@ -231,6 +268,40 @@ class SearchPage(Adw.Bin):
                     nav_title = data.get("title", "Category")
                     root.open_category(data["params"], nav_title)
 
+    @staticmethod
+    def _result_subtitle(item):
+        subtitle = ""
+
+        # Special handling for Artist results to avoid redundant name
+        if item.get("resultType") == "artist":
+            if "subscribers" in item:
+                count = item.get("subscribers", "")
+                if (
+                    count
+                    and count[-1].isdigit() is False
+                    and "listeners" not in count
+                    and "subscribers" not in count
+                ):
+                    subtitle = f"{count} monthly listeners"
+                else:
+                    subtitle = count
+        elif "artists" in item:
+            artists = item.get("artists", [])
+            subtitle = ", ".join([a["name"] for a in artists])
+
+            # Check for Album type
+            if "type" in item:
+                subtitle += f" • {item['type']}"
+        elif "subscribers" in item:
+            subtitle = item.get("subscribers", "")
+        elif "itemCount" in item and item["itemCount"]:
+            count = str(item["itemCount"])
+            if "songs" not in count:
+                subtitle = f"{count} views"
+            else:
+                subtitle = count
+        return subtitle
+
     def add_section(self, parent_box, title, items):
         if not items:
             return
@@ -255,37 +326,7 @@ class SearchPage(Adw.Bin):
             box.add_css_class("song-row")
             row.set_child(box)
 
-            # Subtitle
-            subtitle = ""
-
-            # Special handling for Artist results to avoid redundant name
-            if item.get("resultType") == "artist":
-                if "subscribers" in item:
-                    count = item.get("subscribers", "")
-                    if (
-                        count
-                        and count[-1].isdigit() is False
-                        and "listeners" not in count
-                        and "subscribers" not in count
-                    ):
-                        subtitle = f"{count} monthly listeners"
-                    else:
-                        subtitle = count
-            elif "artists" in item:
-                artists = item.get("artists", [])
-                subtitle = ", ".join([a["name"] for a in artists])
-
-                # Check for Album type
-                if "type" in item:
-                    subtitle += f" • {item['type']}"
-            elif "subscribers" in item:
-                subtitle = item.get("subscribers", "")
-            elif "itemCount" in item and item["itemCount"]:
-                count = str(item["itemCount"])
-                if "songs" not in count:
-                    subtitle = f"{count} views"
-                else:
-                    subtitle = count
+            subtitle = self._result_subtitle(item)
 
             # Cover Art
             thumbnails = item.get("thumbnails", [])
@@ -367,44 +408,49 @@ class SearchPage(Adw.Bin):
         if self.search_timer:
             GObject.source_remove(self.search_timer)
 
+        self.search_timer = None
+
         if len(text) > 2:
-            self.search_timer = GObject.timeout_add(600, self.perform_search, text)
-        elif len(text) == 0:
-            self.stack.set_visible_child_name("explore")
+            if self.search_service.cached(text) is not None:
+                # Already known (e.g. after a backspace), no need to debounce
+                self.perform_search(text)
+            else:
+                self.search_timer = GObject.timeout_add(600, self.perform_search, text)
+        else:
+            # Whatever is still in flight is for a query that is gone now
+            self.search_service.cancel()
+            if len(text) == 0:
+                self.stack.set_visible_child_name("explore")
 
     def on_search_changed(self, entry):
         # Deprecated local handler
         pass
 
+    def search_now(self, query):
+        """Searches right away, skipping the typing debounce. Counts as committed."""
+        if self.search_timer:
+            GObject.source_remove(self.search_timer)
+        self.suggestions.add_query(query)
+        self.perform_search(query)
+
     def perform_search(self, query):
         self.search_timer = None
+        self._last_query = query
 
         # Show loading
         self.stack.set_visible_child_name("loading")
         # self.spinner.start()
 
-        thread = threading.Thread(target=self._search_thread, args=(query,))
-        thread.daemon = True
-        thread.start()
+        # Cache hits call update_results right away, replacing the spinner
+        self.search_service.search(query, self.update_results)
         return False
 
-    def _search_thread(self, query):
-        results = self.client.search(query)
-        GObject.idle_add(self.update_results, results)
-
     def update_results(self, results):
         # self.spinner.stop()
         self.stack.set_visible_child_name("results")
 
-        # Clear existing results
-        # Removing children from Box
-        child = self.results_box.get_first_child()
-        while child:
-            next_child = child.get_next_sibling()
-            self.results_box.remove(child)
-            child = next_child
-
         if not results:
+            self.result_sections.remove_all()
             return
 
         # Group Results
@@ -446,16 +492,144 @@ class SearchPage(Adw.Bin):
             elif r_type == "playlist" or category == "Community playlists":
                 playlists.append(r)
 
-        # Display Top Result first
-        if top_result:
-            self.add_section(self.results_box, "Top Result", [top_result])
+        # Display Top Result first, then the user specified order:
+        # Artists > Songs > Albums > Videos > Playlists
+        sections = [
+            ("Top Result", [top_result] if top_result else []),
+            ("Artists", artists),
+            ("Songs", songs),
+            ("Albums", albums),
+            ("Videos", videos),
+            ("Community Playlists", playlists),
+        ]
+
+        stores = []
+        for title, items in sections:
+            if not items:
+                continue
+            store = Gio.ListStore(item_type=SearchResultItem)
+            store.splice(0, 0, [SearchResultItem(i, title, items) for i in items])
+            stores.append(store)
+
+        # One items-changed for the whole page; visible rows rebind in place
+        self.result_sections.splice(0, self.result_sections.get_n_items(), stores)
+        self.results_list.scroll_to(0, Gtk.ListScrollFlags.NONE, None)
 
-        # Allow user specified order: Artists > Songs > Albums > Videos > Playlists
-        self.add_section(self.results_box, "Artists", artists)
-        self.add_section(self.results_box, "Songs", songs)
-        self.add_section(self.results_box, "Albums", albums)
-        self.add_section(self.results_box, "Videos", videos)
-        self.add_section(self.results_box, "Community Playlists", playlists)
+    # ── Result list factory ──
+
+    def _setup_result_header(self, factory, header):
+        label = Gtk.Label()
+        label.add_css_class("heading")
+        label.set_halign(Gtk.Align.START)
+        label.set_margin_top(18)
+        label.set_margin_bottom(6)
+        header.set_child(label)
+
+    def _bind_result_header(self, factory, header):
+        item = header.get_item()
+        header.get_child().set_label(item.title if item else "")
+
+    def _setup_result_item(self, factory, list_item):
+        box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
+        box.add_css_class("song-row")
+
+        img = AsyncPicture(target_size=44, crop_to_square=True, player=self.player)
+        img.add_css_class("song-img")
+        box.append(img)
+        box._img = img
+
+        vbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
+        vbox.set_valign(Gtk.Align.CENTER)
+        vbox.set_hexpand(True)
+
+        title_label = Gtk.Label()
+        title_label.set_halign(Gtk.Align.START)
+        title_label.set_ellipsize(Pango.EllipsizeMode.END)
+        title_label.set_lines(1)
+        box._title_label = title_label
+
+        subtitle_label = Gtk.Label()
+        subtitle_label.set_halign(Gtk.Align.START)
+        subtitle_label.set_ellipsize(Pango.EllipsizeMode.END)
+        subtitle_label.set_lines(1)
+        subtitle_label.add_css_class("dim-label")
+        subtitle_label.add_css_class("caption")
+        box._subtitle_label = subtitle_label
+
+        title_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
+        title_box.append(title_label)
+
+        explicit_badge = Gtk.Label(label="E")
+        explicit_badge.add_css_class("explicit-badge")
+        explicit_badge.set_valign(Gtk.Align.CENTER)
+        explicit_badge.set_visible(False)
+        title_box.append(explicit_badge)
+        box._explicit_badge = explicit_badge
+
+        vbox.append(title_box)
+        vbox.append(subtitle_label)
+        box.append(vbox)
+
+        # Rebound with set_data; hidden on rows without a videoId
+        like_btn = LikeButton(self.client, None)
+        like_btn.set_visible(False)
+        box.append(like_btn)
+        box._like_btn = like_btn
+
+        # Context Menu (Right Click)
+        gesture = Gtk.GestureClick()
+        gesture.set_button(3)  # Right click
+        gesture.connect("released", self.on_row_right_click, box)
+        box.add_controller(gesture)
+
+        # Long Press for touch
+        lp = Gtk.GestureLongPress()
+        lp.connect(
+            "pressed", lambda g, x, y, r=box: self.on_row_right_click(g, 1, x, y, r)
+        )
+        box.add_controller(lp)
+
+        list_item.set_child(box)
+
+    def _bind_result_item(self, factory, list_item):
+        box = list_item.get_child()
+        item = list_item.get_item().data
+
+        box._title_label.set_label(item.get("title", "Unknown"))
+        box._subtitle_label.set_label(self._result_subtitle(item) or "")
+
+        thumbnails = item.get("thumbnails", [])
+        thumb_url = thumbnails[-1]["url"] if thumbnails else None
+        box._img.video_id = item.get("videoId")
+        if thumb_url:
+            if box._img.url != thumb_url:
+                box._img.load_url(thumb_url)
+        else:
+            box._img.set_from_icon_name("media-optical-symbolic")
+            box._img.url = None
+
+        box._explicit_badge.set_visible(parse_item_metadata(item)["is_explicit"])
+
+        box._like_btn.set_data(
+            item.get("videoId"), item.get("likeStatus", "INDIFFERENT")
+        )
+
+        box.item_data = item
+
+    def _unbind_result_item(self, factory, list_item):
+        box = list_item.get_child()
+        # Cancel the pending cover fetch so recycled rows don't queue stale work
+        box._img.cancel()
+        box._img.set_paintable(None)
+        box._img.url = None
+        box.item_data = None
+
+    def on_result_activated(self, list_view, position):
+        item = list_view.get_model().get_item(position)
+        if item:
+            # Opening a result commits the query that found it
+            self.suggestions.add_query(self._last_query)
+            self._activate_item(item.data, item.section)
 
     def on_player_state_changed(self, player, state):
         if state == "playing" or state == "rec-started":
@@ -496,150 +670,153 @@ class SearchPage(Adw.Bin):
             self.open_playlist_callback(data["browseId"], initial_data)
 
         elif hasattr(row, "item_data"):
-            data = row.item_data
-            title = data.get("title", "Unknown")
-            res_type = data.get("resultType")
-
-            # Helper to open playlist/album
-            def open_pid(pid):
-                initial_data = {
-                    "title": title,
-                    "thumb": data["thumbnails"][-1]["url"]
-                    if data.get("thumbnails")
-                    else None,
-                    "author": ", ".join(
-                        [a.get("name", "") for a in data.get("artists", [])]
-                    )
-                    if "artists" in data
-                    else data.get("count", ""),
-                }
-                self.open_playlist_callback(pid, initial_data)
-
-            # 1. Check resultType first (Robust for Search Results)
-            if res_type in ["song", "video"]:
-                if "videoId" in data:
-                    # Build queue from the listbox (siblings)
-                    queue_tracks = []
-                    start_index = 0
-
-                    # listbox is passed as argument
-                    child = listbox.get_first_child()
-                    idx = 0
-                    while child:
-                        if hasattr(child, "item_data"):
-                            s_data = child.item_data
-                            if "videoId" in s_data:
-                                # Normalize
-                                s_title = s_data.get("title", "Unknown")
-
-                                s_thumb = ""
-                                if s_data.get("thumbnails"):
-                                    s_thumb = s_data["thumbnails"][-1]["url"]
-
-                                s_artist = ""
-                                if "artists" in s_data:
-                                    s_artist = ", ".join(
-                                        [a.get("name", "") for a in s_data["artists"]]
-                                    )
-                                elif "artist" in s_data:
-                                    s_artist = s_data["artist"]
-
-                                queue_tracks.append(
-                                    {
-                                        "videoId": s_data["videoId"],
-                                        "title": s_title,
-                                        "artist": s_artist,
-                                        "thumb": s_thumb,
-                                    }
-                                )
-
-                                if s_data.get("videoId") == data.get("videoId"):
-                                    start_index = idx
-                                idx += 1
-
-                        child = child.get_next_sibling()
-
-                    if queue_tracks:
-                        self.player.set_queue(queue_tracks, start_index)
-                    else:
-                        # Fallback to single (shouldn't happen if we are here)
-                        thumb_url = (
-                            data.get("thumbnails", [])[-1]["url"]
-                            if data.get("thumbnails")
-                            else None
-                        )
-                        artist_name = (
-                            ", ".join(
-                                [a.get("name", "") for a in data.get("artists", [])]
+            # The rest of the section becomes the queue for songs and videos
+            siblings = []
+            child = listbox.get_first_child()
+            while child:
+                if hasattr(child, "item_data"):
+                    siblings.append(child.item_data)
+                child = child.get_next_sibling()
+            self._activate_item(row.item_data, siblings)
+
+    def _activate_item(self, data, siblings):
+        title = data.get("title", "Unknown")
+        res_type = data.get("resultType")
+
+        # Helper to open playlist/album
+        def open_pid(pid):
+            initial_data = {
+                "title": title,
+                "thumb": data["thumbnails"][-1]["url"]
+                if data.get("thumbnails")
+                else None,
+                "author": ", ".join(
+                    [a.get("name", "") for a in data.get("artists", [])]
+                )
+                if "artists" in data
+                else data.get("count", ""),
+            }
+            self.open_playlist_callback(pid, initial_data)
+
+        # 1. Check resultType first (Robust for Search Results)
+        if res_type in ["song", "video"]:
+            if "videoId" in data:
+                # Build queue from the rest of the section (siblings)
+                queue_tracks = []
+                start_index = 0
+
+                idx = 0
+                for s_data in siblings:
+                    if "videoId" in s_data:
+                        # Normalize
+                        s_title = s_data.get("title", "Unknown")
+
+                        s_thumb = ""
+                        if s_data.get("thumbnails"):
+                            s_thumb = s_data["thumbnails"][-1]["url"]
+
+                        s_artist = ""
+                        if "artists" in s_data:
+                            s_artist = ", ".join(
+                                [a.get("name", "") for a in s_data["artists"]]
                             )
-                            if "artists" in data
-                            else data.get("artist", "")
-                        )
-                        self.player.load_video(
-                            data["videoId"], title, artist_name, thumb_url
+                        elif "artist" in s_data:
+                            s_artist = s_data["artist"]
+
+                        queue_tracks.append(
+                            {
+                                "videoId": s_data["videoId"],
+                                "title": s_title,
+                                "artist": s_artist,
+                                "thumb": s_thumb,
+                            }
                         )
-                    return
-
-            elif res_type in ["album", "single", "ep"]:
-                # Prefer browseId (MPRE) or audioPlaylistId (OLAK)
-                if "browseId" in data and data["browseId"].startswith("MPRE"):
-                    open_pid(data["browseId"])
-                    return
-                elif "audioPlaylistId" in data:
-                    open_pid(data["audioPlaylistId"])  # conversion will handle it
-                    return
-                elif "browseId" in data:
-                    open_pid(data["browseId"])
-                    return
-
-            elif res_type == "playlist":
-                if "playlistId" in data:
-                    open_pid(data["playlistId"])
-                    return
-                elif "browseId" in data:
-                    open_pid(data["browseId"])
-                    return
-
-            # 2. Fallback to Key-Based logic (for items without explicit resultType)
-            if "videoId" in data and res_type not in [
-                "album",
-                "single",
-                "ep",
-                "playlist",
-                "artist",
-            ]:
-                thumb_url = ""
-                thumbnails = data.get("thumbnails", [])
-                if thumbnails:
-                    thumb_url = thumbnails[-1]["url"]
-
-                artists_list = data.get("artists", [])
-                if isinstance(artists_list, list):
-                    artist_name = ", ".join([a.get("name", "") for a in artists_list])
-                else:
-                    artist_name = data.get("artist", "")
 
-                self.player.load_video(data["videoId"], title, artist_name, thumb_url)
+                        if s_data.get("videoId") == data.get("videoId"):
+                            start_index = idx
+                        idx += 1
 
+                if queue_tracks:
+                    self.player.set_queue(queue_tracks, start_index)
+                else:
+                    # Fallback to single (shouldn't happen if we are here)
+                    thumb_url = (
+                        data.get("thumbnails", [])[-1]["url"]
+                        if data.get("thumbnails")
+                        else None
+                    )
+                    artist_name = (
+                        ", ".join(
+                            [a.get("name", "") for a in data.get("artists", [])]
+                        )
+                        if "artists" in data
+                        else data.get("artist", "")
+                    )
+                    self.player.load_video(
+                        data["videoId"], title, artist_name, thumb_url
+                    )
+                return
+
+        elif res_type in ["album", "single", "ep"]:
+            # Prefer browseId (MPRE) or audioPlaylistId (OLAK)
+            if "browseId" in data and data["browseId"].startswith("MPRE"):
+                open_pid(data["browseId"])
+                return
             elif "audioPlaylistId" in data:
-                open_pid(data["audioPlaylistId"])
-            elif "playlistId" in data:
+                open_pid(data["audioPlaylistId"])  # conversion will handle it
+                return
+            elif "browseId" in data:
+                open_pid(data["browseId"])
+                return
+
+        elif res_type == "playlist":
+            if "playlistId" in data:
                 open_pid(data["playlistId"])
+                return
             elif "browseId" in data:
-                # Check if it's a playlist or artist
-                if res_type in ["playlist", "album"] or data["browseId"].startswith(
-                    ("VL", "PL", "RD", "OL", "MPRE")
-                ):
-                    open_pid(data["browseId"])
-                else:
-                    print(f"Open BrowseID (Artist?): {data['browseId']}")
-                    # Check if we can navigate
-                    root = self.get_root()
-                    if hasattr(root, "open_artist"):
-                        root.open_artist(data["browseId"], title)
+                open_pid(data["browseId"])
+                return
+
+        # 2. Fallback to Key-Based logic (for items without explicit resultType)
+        if "videoId" in data and res_type not in [
+            "album",
+            "single",
+            "ep",
+            "playlist",
+            "artist",
+        ]:
+            thumb_url = ""
+            thumbnails = data.get("thumbnails", [])
+            if thumbnails:
+                thumb_url = thumbnails[-1]["url"]
+
+            artists_list = data.get("artists", [])
+            if isinstance(artists_list, list):
+                artist_name = ", ".join([a.get("name", "") for a in artists_list])
+            else:
+                artist_name = data.get("artist", "")
+
+            self.player.load_video(data["videoId"], title, artist_name, thumb_url)
+
+        elif "audioPlaylistId" in data:
+            open_pid(data["audioPlaylistId"])
+        elif "playlistId" in data:
+            open_pid(data["playlistId"])
+        elif "browseId" in data:
+            # Check if it's a playlist or artist
+            if res_type in ["playlist", "album"] or data["browseId"].startswith(
+                ("VL", "PL", "RD", "OL", "MPRE")
+            ):
+                open_pid(data["browseId"])
+            else:
+                print(f"Open BrowseID (Artist?): {data['browseId']}")
+                # Check if we can navigate
+                root = self.get_root()
+                if hasattr(root, "open_artist"):
+                    root.open_artist(data["browseId"], title)
 
     def on_row_right_click(self, gesture, n_press, x, y, row):
-        if not hasattr(row, "item_data"):
+        if getattr(row, "item_data", None) is None:
             return
 
         data = row.item_data
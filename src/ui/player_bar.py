@@ -200,6 +200,11 @@ class PlayerBar(Gtk.Box):
         self.player.connect("progression", self.on_progression)
         self.player.connect("metadata-changed", self.on_metadata_changed)
         self.player.connect("volume-changed", self.on_volume_changed)
+        self.player.connect("buffering", self.on_buffering)
+
+        # Progress ticks only while the bar is on screen
+        self.connect("map", lambda w: self.player.request_progress(self, 250))
+        self.connect("unmap", lambda w: self.player.release_progress(self))
 
         # Initial state sync
         self._is_buffering_spinner = False
@@ -377,11 +382,16 @@ class PlayerBar(Gtk.Box):
             self.play_btn.set_sensitive(False)
 
     def on_play_clicked(self, btn):
-        if self.player.get_state_string() == "playing":
+        if self.player.get_state_string() in ("playing", "buffering"):
             self.player.pause()
         else:
             self.player.play()
 
+    def on_buffering(self, player, percent):
+        self.play_btn.set_tooltip_text(
+            f"Buffering… {percent}%" if percent < 100 else None
+        )
+
     def on_state_changed(self, player, state):
         if state == "loading":
             self.scale.set_value(0)
@@ -403,6 +413,10 @@ class PlayerBar(Gtk.Box):
                 self._play_icon.set_from_icon_name("media-playback-pause-symbolic")
                 self._play_stack.set_visible_child_name("icon")
                 self.play_btn.set_sensitive(True)
+        elif state == "buffering":
+            # Stalled on the network; keep the button usable so it can pause
+            self._play_stack.set_visible_child_name("spinner")
+            self.play_btn.set_sensitive(True)
         elif state in ("paused", "stopped"):
             if self._is_buffering_spinner and self.player.duration <= 0:
                 # Still buffering—keep spinner visible
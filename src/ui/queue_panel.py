@@ -25,10 +25,10 @@ class QueueItem(GObject.Object):
     def is_paused(self, value):
         self._is_paused = value
 
-    def __init__(self, track, index, is_playing, is_paused=False):
+    def __init__(self, track, uid, is_playing=False, is_paused=False):
         super().__init__()
         self.track = track
-        self.index = index
+        self.uid = uid  # PlayQueue entry id
         self._is_playing = is_playing
         self._is_paused = is_paused
 
@@ -40,6 +40,7 @@ class QueueRowWidget(Gtk.Box):
 
         self.model_item = None  # QueueItem
         self.panel = None  # QueuePanel reference
+        self.list_item = None  # Gtk.ListItem, knows the row's current position
 
         # Drag Handle
         self.handle = Gtk.Image.new_from_icon_name("list-drag-handle-symbolic")
@@ -92,7 +93,11 @@ class QueueRowWidget(Gtk.Box):
         drop_target.connect("drop", self.on_drop)
         self.add_controller(drop_target)
 
-    def bind(self, item, panel):
+    @property
+    def position(self):
+        return self.list_item.get_position() if self.list_item else -1
+
+    def bind(self, item, panel, list_item):
         if self.model_item:
             try:
                 self.model_item.disconnect_by_func(self._on_item_property_changed)
@@ -101,6 +106,10 @@ class QueueRowWidget(Gtk.Box):
 
         self.model_item = item
         self.panel = panel
+        if self.list_item is not list_item:
+            # Rows shift when entries are inserted or removed above them
+            self.list_item = list_item
+            list_item.connect("notify::position", self._on_position_changed)
 
         item.connect("notify::is-playing", self._on_item_property_changed)
         item.connect("notify::is-paused", self._on_item_property_changed)
@@ -109,24 +118,18 @@ class QueueRowWidget(Gtk.Box):
     def _on_item_property_changed(self, item, pspec):
         self._update_playing_ui()
 
+    def _on_position_changed(self, list_item, pspec):
+        if self.model_item and not self.model_item.is_playing:
+            self.indicator_lbl.set_label(str(self.position + 1))
+
     def _update_playing_ui(self):
         item = self.model_item
         if not item:
             return
 
         track = item.track
-        self.title_lbl.set_label(track.get("title", "Unknown"))
-
-        artist_txt = track.get("artist")
-        if isinstance(artist_txt, list):
-            artist_txt = ", ".join([a.get("name", "") for a in artist_txt])
-        elif not artist_txt and "artists" in track:
-            artist_txt = ", ".join(
-                [a.get("name", "") for a in track.get("artists", [])]
-            )
-        if not artist_txt:
-            artist_txt = "Unknown"
-        self.artist_lbl.set_label(artist_txt)
+        self.title_lbl.set_label(track.title)
+        self.artist_lbl.set_label(track.artist or "Unknown")
 
         if item.is_playing:
             self.add_css_class("playing")
@@ -138,12 +141,12 @@ class QueueRowWidget(Gtk.Box):
         else:
             self.remove_css_class("playing")
             # For non-playing items, we just show the index
-            self.indicator_lbl.set_label(str(item.index + 1))
+            self.indicator_lbl.set_label(str(self.position + 1))
             self.indicator_stack.set_visible_child_name("index")
 
     def on_drag_prepare(self, source, x, y):
         if self.model_item:
-            value = GObject.Value(str, str(self.model_item.index))
+            value = GObject.Value(str, str(self.position))
             return Gdk.ContentProvider.new_for_value(value)
         return None
 
@@ -154,9 +157,9 @@ class QueueRowWidget(Gtk.Box):
     def on_drop(self, target, value, x, y):
         try:
             source_index = int(value)
-            if self.model_item and source_index != self.model_item.index:
+            if self.model_item and source_index != self.position:
                 if self.panel:
-                    self.panel._on_row_move(source_index, self.model_item.index)
+                    self.panel._on_row_move(source_index, self.position)
             return True
         except ValueError:
             return False
@@ -240,10 +243,19 @@ class QueuePanel(Gtk.Box):
 
         # Signals
         self.player.connect("state-changed", self._on_player_update)
-        self.player.connect("metadata-changed", self._on_player_update)
         self.connect("map", self._on_map)  # Refresh when visible
 
+        # The store mirrors player.queue by applying its deltas
+        queue = self.player.queue
+        queue.connect("inserted", self._on_queue_inserted)
+        queue.connect("removed", self._on_queue_removed)
+        queue.connect("moved", self._on_queue_moved)
+        queue.connect("reset", lambda q: self._populate())
+        queue.connect("current-changed", self._on_current_changed)
+        queue.connect("updated", self._on_queue_updated)
+
         self._programmatic_update = False
+        self._playing_item = None  # QueueItem marked as playing
 
         # Initial Populate
         self._populate()
@@ -262,7 +274,7 @@ class QueuePanel(Gtk.Box):
 
     def _on_add_all_to_playlist(self, action, param):
         playlist_id = param.get_string()
-        video_ids = [t.get("videoId") for t in self.player.queue if t.get("videoId")]
+        video_ids = [t.video_id for t in self.player.queue if t.video_id]
 
         if not video_ids:
             return
@@ -279,12 +291,6 @@ class QueuePanel(Gtk.Box):
         threading.Thread(target=thread_func, daemon=True).start()
 
     def _on_map(self, *args):
-        # Refresh list when sidebar becomes visible - but only if count changed
-        if self.store.get_n_items() != len(self.player.queue):
-            self._populate()
-        else:
-            self._update_item_states()
-
         self._refresh_playlists_menu()
         self._update_shuffle_state()
         self._update_repeat_state()
@@ -336,27 +342,72 @@ class QueuePanel(Gtk.Box):
         self._programmatic_update = True
         try:
             queue = self.player.queue
-            current_idx = self.player.current_queue_index
+            items = [QueueItem(track, queue.uid_at(i)) for i, track in enumerate(queue)]
+            self._playing_item = None
+            self.store.splice(0, self.store.get_n_items(), items)
+        finally:
+            self._programmatic_update = False
 
-            items = []
-            player_state = self.player.get_state_string()
-            is_paused = player_state in ("paused", "stopped")
+        self._on_current_changed(self.player.queue, self.player.current_queue_index)
 
-            for i, track in enumerate(queue):
-                items.append(QueueItem(track, i, i == current_idx, is_paused))
+    def _on_queue_inserted(self, queue, position, n):
+        items = [
+            QueueItem(queue[i], queue.uid_at(i)) for i in range(position, position + n)
+        ]
+        self._programmatic_update = True
+        try:
+            self.store.splice(position, 0, items)
+        finally:
+            self._programmatic_update = False
 
-            self.store.splice(0, self.store.get_n_items(), items)
-            self._last_queue_len = len(queue)
+    def _on_queue_removed(self, queue, position, n):
+        self._programmatic_update = True
+        try:
+            self.store.splice(position, n, [])
+        finally:
+            self._programmatic_update = False
 
-            # Restore selection to current index
-            if current_idx >= 0 and current_idx < len(items):
-                self.selection_model.set_selected(current_idx)
+    def _on_queue_moved(self, queue, old, new):
+        item = self.store.get_item(old)
+        self._programmatic_update = True
+        try:
+            self.store.remove(old)
+            self.store.insert(new, item)
+        finally:
+            self._programmatic_update = False
+
+    def _on_queue_updated(self, queue, position):
+        item = self.store.get_item(position)
+        if item:
+            item.track = queue[position]
+            # Rows refresh their labels on this notification
+            item.notify("is-playing")
+
+    def _on_current_changed(self, queue, position):
+        """Moves the playing marker; only the old and new rows are touched."""
+        self._programmatic_update = True
+        try:
+            if self._playing_item:
+                self._playing_item.is_playing = False
+                self._playing_item = None
+
+            if 0 <= position < self.store.get_n_items():
+                item = self.store.get_item(position)
+                item.is_paused = self._is_paused()
+                item.is_playing = True
+                self._playing_item = item
+                self.selection_model.set_selected(position)
+            else:
+                self.selection_model.unselect_all()
 
             if self.get_mapped():
                 GLib.idle_add(self._scroll_to_current)
         finally:
             self._programmatic_update = False
 
+    def _is_paused(self):
+        return self.player.get_state_string() in ("paused", "stopped")
+
     def _on_factory_setup(self, factory, list_item):
         widget = QueueRowWidget()
         list_item.set_child(widget)
@@ -364,69 +415,34 @@ class QueuePanel(Gtk.Box):
     def _on_factory_bind(self, factory, list_item):
         widget = list_item.get_child()
         item = list_item.get_item()
-        widget.bind(item, self)
+        widget.bind(item, self, list_item)
 
     def _on_selection_changed(self, model, position, n_items):
         if self._programmatic_update:
             return
 
-        item = model.get_selected_item()
-        if item:
+        index = model.get_selected()
+        if index != Gtk.INVALID_LIST_POSITION:
             # Prevent re-playing current track if clicked
-            if item.index == self.player.current_queue_index:
+            if index == self.player.current_queue_index:
                 return
 
-            self.player.play_queue_index(item.index)
+            self.player.play_queue_index(index)
 
     def _on_row_move(self, old_index, new_index):
         if self.player.move_queue_item(old_index, new_index):
             pass
 
-    def _on_player_update(self, player, *args):
+    def _on_player_update(self, player, state):
         self._update_shuffle_state()
         self._update_repeat_state()
 
-        # Determine if this is a state-changed or metadata-changed signal
-        # state-changed (player, state) -> args = (state,)
-        # metadata-changed (player, title, artist, thumb, ...) -> args = (title, ...)
-
-        state = args[0] if len(args) == 1 else None
-
-        # If queue length changed OR structural update requested, we MUST repopulate
-        if state == "queue-updated" or self.store.get_n_items() != len(
-            self.player.queue
-        ):
-            self._populate()
-        else:
-            # Otherwise, just update indicators (very efficient!)
-            self._update_item_states()
-
-    def _update_item_states(self):
-        current_idx = self.player.current_queue_index
-        n = self.store.get_n_items()
-
-        self._programmatic_update = True
-        try:
-            player_state = self.player.get_state_string()
-            is_paused_global = player_state in ("paused", "stopped")
-
-            for i in range(n):
-                item = self.store.get_item(i)
-                was_playing = item.is_playing
-                was_paused = item.is_paused
-                is_playing = i == current_idx
-
-                if was_playing != is_playing or was_paused != is_paused_global:
-                    item.is_playing = is_playing
-                    item.is_paused = is_paused_global
-
-            if current_idx >= 0 and current_idx < n:
-                self.selection_model.set_selected(current_idx)
-
-            if self.get_mapped():
-                GLib.idle_add(self._scroll_to_current)
-        finally:
-            self._programmatic_update = False
+        # Structural changes arrive as queue deltas; only the playing row
+        # needs to reflect play/pause.
+        if self._playing_item:
+            is_paused = self._is_paused()
+            if self._playing_item.is_paused != is_paused:
+                self._playing_item.is_paused = is_paused
 
     def _show_toast(self, message):
         root = self.get_root()
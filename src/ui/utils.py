@@ -1,35 +1,102 @@
 import threading
-import urllib.request
 from collections import OrderedDict
 import re
 from gi.repository import Gtk, Gdk, GdkPixbuf, GLib
+from ui.image_loader import IMAGE_POOL
 
-# Bounded LRU Cache to prevent memory leaks (max 100 images)
-IMG_CACHE = OrderedDict()
-MAX_CACHE_SIZE = 100
+# Largest edge we ever decode to; enough for any UI element (including expanded player)
+MAX_DECODE_DIM = 1600
 
 
-def cache_pixbuf(url, pixbuf):
-    if not url or not pixbuf:
-        return
-    if url in IMG_CACHE:
-        IMG_CACHE.move_to_end(url)
-        return
+class TextureCache:
+    """
+    Byte-bounded LRU of decoded textures keyed by (url, width, height, mode),
+    so each widget size holds only the pixels it actually paints.
+    """
+
+    def __init__(self, max_bytes=96 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (texture, nbytes)
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, texture):
+        if not texture:
+            return
+        nbytes = texture.get_width() * texture.get_height() * 4
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old:
+                self._bytes -= old[1]
+            self._entries[key] = (texture, nbytes)
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+
+
+TEXTURE_CACHE = TextureCache()
+
+
+def decode_texture(data, box_w, box_h, mode="fit"):
+    """
+    Decodes image bytes straight to the target size and returns a Gdk.Texture.
+
+    mode:
+      "fit"    - scale down to fit inside box_w x box_h
+      "fill"   - scale down until the shorter side covers the box, no crop
+      "cover"  - like fill, then center-crop to the box_w:box_h aspect ratio
+      "square" - like fill, then center-crop to a square
+
+    Images are never upscaled. The size is applied in the loader's
+    size-prepared handler so JPEGs are downsampled while decoding instead of
+    materialising the full-resolution RGBA buffer first.
+    """
+
+    def on_size_prepared(loader, w, h):
+        if mode == "fit":
+            scale = min(box_w / w, box_h / h)
+        else:
+            scale = max(box_w / w, box_h / h)
+        scale = min(scale, 1.0)
+        if scale < 1.0:
+            loader.set_size(max(1, int(w * scale)), max(1, int(h * scale)))
+
+    loader = GdkPixbuf.PixbufLoader()
+    loader.connect("size-prepared", on_size_prepared)
+    loader.write(data)
+    loader.close()
+    pixbuf = loader.get_pixbuf()
+    if not pixbuf:
+        return None
 
-    # Scale down very large images before caching to save massive amounts of RAM
-    # 1600px is more than enough for any UI element (including expanded player)
     w = pixbuf.get_width()
     h = pixbuf.get_height()
-    max_dim = 1600
-    if w > max_dim or h > max_dim:
-        scale = max_dim / max(w, h)
-        pixbuf = pixbuf.scale_simple(
-            int(w * scale), int(h * scale), GdkPixbuf.InterpType.BILINEAR
+    crop_w, crop_h = w, h
+    if mode == "cover":
+        # Crop to the box's aspect ratio; a source smaller than the box (never
+        # upscaled here) is then scaled up by the widget without letterboxing.
+        if w * box_h > h * box_w:
+            crop_w = max(1, round(h * box_w / box_h))
+        else:
+            crop_h = max(1, round(w * box_h / box_w))
+    elif mode == "square":
+        crop_w = crop_h = min(w, h)
+
+    if (crop_w, crop_h) != (w, h):
+        pixbuf = pixbuf.new_subpixbuf(
+            (w - crop_w) // 2, (h - crop_h) // 2, crop_w, crop_h
         )
 
-    IMG_CACHE[url] = pixbuf
-    if len(IMG_CACHE) > MAX_CACHE_SIZE:
-        IMG_CACHE.popitem(last=False)
+    return Gdk.Texture.new_for_pixbuf(pixbuf)
 
 
 def get_high_res_url(url, target_size=None):
@@ -120,6 +187,18 @@ def get_yt_music_link(item_id, is_album=False):
     return f"https://music.youtube.com/playlist?list={item_id}"
 
 
+def filter_change(old_text, new_text):
+    """
+    How a substring filter changed, so Gtk filters only re-check what they must:
+    typing on narrows the matches, deleting widens them.
+    """
+    if old_text in new_text:
+        return Gtk.FilterChange.MORE_STRICT
+    if new_text in old_text:
+        return Gtk.FilterChange.LESS_STRICT
+    return Gtk.FilterChange.DIFFERENT
+
+
 def parse_item_metadata(item):
     """
     Robustly extracts metadata (year, type, is_explicit) from ytmusicapi item formats.
@@ -233,19 +312,26 @@ class AsyncImage(Gtk.Image):
         if url:
             self.load_url(url)
 
-    # ... (load_url, _fetch_image same) ...
+    def _texture_key(self, url):
+        # To support HiDPI (e.g. 200% scale), we double the target pixel density
+        # GTK will scale the texture back down smoothly, keeping it crisp.
+        return (url, self.target_w * 2, self.target_h * 2, "cover")
 
     def load_url(self, url, **kwargs):
         orig_url = url
         url = get_high_res_url(url, self.target_w)
+        # Drop any pending fetch for the previous URL of this widget
+        IMAGE_POOL.cancel(self)
         self.url = url
         if not url:
             self.set_from_icon_name("image-missing-symbolic")
             return
 
-        cached_pixbuf = IMG_CACHE.get(url)
-        if cached_pixbuf:
-            IMG_CACHE.move_to_end(url)
+        key = self._texture_key(url)
+        texture = TEXTURE_CACHE.get(key)
+        if texture:
+            self._apply_texture(texture, url)
+            return
 
         fallbacks = kwargs.get("fallbacks") or get_ytimg_fallbacks(url)
         # Prioritize the clean fallback versions.
@@ -254,91 +340,43 @@ class AsyncImage(Gtk.Image):
         if url != orig_url and orig_url not in fallbacks:
             fallbacks.append(orig_url)
 
-        thread = threading.Thread(
-            target=self._fetch_image, args=(url, fallbacks, cached_pixbuf)
+        IMAGE_POOL.fetch(
+            url,
+            lambda result, error: self._on_image_fetched(result, error, url, key),
+            owner=self,
+            fallbacks=fallbacks,
         )
-        thread.daemon = True
-        thread.start()
-
-    def _fetch_image(self, url, fallbacks=None, cached_pixbuf=None):
-        try:
-            pixbuf = cached_pixbuf
-            if not pixbuf:
-                # Download image data
-                with urllib.request.urlopen(url) as response:
-                    data = response.read()
-
-                loader = GdkPixbuf.PixbufLoader()
-                loader.write(data)
-                loader.close()
-                pixbuf = loader.get_pixbuf()
-
-                if pixbuf:
-                    # Cache the original full-res (scaled to max 1600) pixbuf
-                    # We increase max_dim here to 1600 for better header quality
-                    w = pixbuf.get_width()
-                    h = pixbuf.get_height()
-                    max_dim = 1600
-                    if w > max_dim or h > max_dim:
-                        scale = max_dim / max(w, h)
-                        pixbuf = pixbuf.scale_simple(
-                            int(w * scale),
-                            int(h * scale),
-                            GdkPixbuf.InterpType.BILINEAR,
-                        )
-
-                    cache_pixbuf(url, pixbuf)
-
-            if pixbuf:
-                # Now perform the widget-specific scaling and cropping in the background thread
-                # To support HiDPI (e.g. 200% scale), we double the target pixel density
-                # GTK will scale the texture back down smoothly, keeping it crisp.
-                tw = self.target_w * 2
-                th = self.target_h * 2
-
-                w = pixbuf.get_width()
-                h = pixbuf.get_height()
-
-                # Calculate scale to fill the target size (cover)
-                scale = max(tw / w, th / h)
-                new_w = int(w * scale)
-                new_h = int(h * scale)
-
-                # Scale properly
-                scaled = pixbuf.scale_simple(
-                    new_w, new_h, GdkPixbuf.InterpType.BILINEAR
-                )
 
-                # Center crop to target dimensions
-                final_pixbuf = scaled
-                if new_w > tw or new_h > th:
-                    offset_x = max(0, (new_w - tw) // 2)
-                    offset_y = max(0, (new_h - th) // 2)
-                    cw = min(tw, new_w - offset_x)
-                    ch = min(th, new_h - offset_y)
-                    if cw > 0 and ch > 0:
-                        try:
-                            final_pixbuf = scaled.new_subpixbuf(
-                                offset_x, offset_y, cw, ch
-                            )
-                        except Exception as e:
-                            print(f"Pixbuf crop error: {e}")
+    def cancel(self):
+        """Abandons any pending fetch, e.g. when a list row is unbound."""
+        IMAGE_POOL.cancel(self)
+        self.url = None
 
+    def _on_image_fetched(self, result, error, url, key):
+        # Runs on a pool worker
+        if error or not result or self.url != url:
+            return
+        try:
+            data, working_url = result
+            if working_url != url:
+                print(f"Using fallback: {working_url}")
+                # Update current URL to match the fallback
+                self.url = working_url
+
+            # Another widget of the same size may have decoded it meanwhile
+            texture = TEXTURE_CACHE.get(key)
+            if not texture:
+                _, box_w, box_h, mode = key
+                texture = decode_texture(data, box_w, box_h, mode)
+                TEXTURE_CACHE.put(key, texture)
+
+            if texture:
                 # Apply on main thread
-                GLib.idle_add(self._apply_pixbuf, final_pixbuf, url)
-
-        except Exception:
-            if fallbacks and self.url == url:
-                next_url = fallbacks.pop(0)
-                self.url = next_url  # Update current URL to match the fallback
-
-                # If we have a player, notify it about the working fallback URL
-                # when it finally succeeds. This is handled in _apply_pixbuf.
-
-                print(f"Trying fallback: {next_url}")
-                self._fetch_image(next_url, fallbacks)
+                GLib.idle_add(self._apply_texture, texture, working_url)
+        except Exception as e:
+            print(f"Image decode error: {e}")
 
-    def _apply_pixbuf(self, pixbuf, url=None):
+    def _apply_texture(self, texture, url=None):
         # Race condition check: only apply if the URL hasn't changed since request
         if url and self.url != url:
             return
@@ -350,7 +388,6 @@ class AsyncImage(Gtk.Image):
             # We'll rely on the player to handle the update logic.
             GLib.idle_add(self._sync_player_url, url)
 
-        texture = Gdk.Texture.new_for_pixbuf(pixbuf)
         self.set_from_paintable(texture)
 
     def _sync_player_url(self, url):
@@ -368,6 +405,7 @@ class AsyncImage(Gtk.Image):
     def set_from_file(self, file):
         """Optimistically set image from a local file object (GFile)"""
         try:
+            IMAGE_POOL.cancel(self)
             # We must load into a pixbuf first to handle scaling correctly
             path = file.get_path()
             # Multiplying by 2 to support HiDPI displays
@@ -434,18 +472,33 @@ class AsyncPicture(Gtk.Picture):
         else:
             self.set_paintable(None)
 
+    def _texture_key(self, url):
+        if self.target_size:
+            # Scale to 2x for HiDPI quality
+            box = self.target_size * 2
+        else:
+            box = MAX_DECODE_DIM
+        if self.crop_to_square:
+            mode = "square"
+        else:
+            mode = "fill" if self.target_size else "fit"
+        return (url, box, box, mode)
+
     def load_url(self, url, **kwargs):
         orig_url = url
         url = get_high_res_url(url, self.target_size)
+        # Drop any pending fetch for the previous URL of this widget
+        IMAGE_POOL.cancel(self)
         self.url = url
         if not url:
             self.set_paintable(None)
             return
 
         # Check cache
-        if url in IMG_CACHE:
-            pixbuf = IMG_CACHE[url]
-            GLib.idle_add(self._apply_pixbuf, pixbuf, url)
+        key = self._texture_key(url)
+        texture = TEXTURE_CACHE.get(key)
+        if texture:
+            self._apply_texture(texture, url)
             return
 
         fallbacks = kwargs.get("fallbacks") or get_ytimg_fallbacks(url)
@@ -455,79 +508,44 @@ class AsyncPicture(Gtk.Picture):
         if url != orig_url and orig_url not in fallbacks:
             fallbacks.append(orig_url)
 
-        target_size = self.target_size
-        crop = self.crop_to_square
+        IMAGE_POOL.fetch(
+            url,
+            lambda result, error: self._on_image_fetched(result, error, url, key),
+            owner=self,
+            fallbacks=fallbacks,
+        )
 
-        threading.Thread(
-            target=self._fetch_image,
-            args=(url, target_size, crop, fallbacks),
-            daemon=True,
-        ).start()
+    def cancel(self):
+        """Abandons any pending fetch, e.g. when a list row is unbound."""
+        IMAGE_POOL.cancel(self)
+        self.url = None
 
-    def _fetch_image(self, url, target_size=None, crop=False, fallbacks=None):
+    def _on_image_fetched(self, result, error, url, key):
+        # Runs on a pool worker.
+        # Failures are silent for list items to avoid spamming console
+        if error or not result or self.url != url:
+            return
         try:
-            # We use MusicClient's session if possible or just requests
-            import requests
-
-            # Reuse connection if possible
-            resp = requests.get(url, timeout=10)
-            if resp.status_code != 200:
-                raise Exception(f"HTTP {resp.status_code}")
-
-            loader = GdkPixbuf.PixbufLoader()
-            loader.write(resp.content)
-            loader.close()
-            pixbuf = loader.get_pixbuf()
-
-            if pixbuf:
-                w = pixbuf.get_width()
-                h = pixbuf.get_height()
-
-                # Scale to max_dim=1600 for high-quality caching
-                max_dim = 1600
-                if w > max_dim or h > max_dim:
-                    scale = max_dim / max(w, h)
-                    pixbuf = pixbuf.scale_simple(
-                        int(w * scale),
-                        int(h * scale),
-                        GdkPixbuf.InterpType.BILINEAR,
-                    )
-                    w = pixbuf.get_width()
-                    h = pixbuf.get_height()
-
-                # Cache the high-res version BEFORE potential thumbnail downscaling
-                cache_pixbuf(url, pixbuf)
-
-                if target_size:
-                    # Scale to 2x for HiDPI quality (this is the widget-specific version)
-                    tw = target_size * 2
-                    th = target_size * 2
-                    if w > tw or h > th:
-                        scale = max(tw / w, th / h)
-                        pixbuf = pixbuf.scale_simple(
-                            int(w * scale),
-                            int(h * scale),
-                            GdkPixbuf.InterpType.BILINEAR,
-                        )
-
-            GLib.idle_add(self._apply_pixbuf, pixbuf, url)
+            data, working_url = result
+            if working_url != url:
+                self.url = working_url
+
+            texture = TEXTURE_CACHE.get(key)
+            if not texture:
+                _, box_w, box_h, mode = key
+                texture = decode_texture(data, box_w, box_h, mode)
+                TEXTURE_CACHE.put(key, texture)
 
+            GLib.idle_add(self._apply_texture, texture, working_url)
         except Exception:
-            if fallbacks and self.url == url:
-                next_url = fallbacks.pop(0)
-                self.url = next_url
-                self._fetch_image(next_url, target_size, crop, fallbacks)
-            else:
-                # Silently fail for list items to avoid spamming console
-                # but keep error for single loads
-                pass
-
-    def _apply_pixbuf(self, pixbuf, url=None):
+            pass
+
+    def _apply_texture(self, texture, url=None):
         # Race condition check
         if url and self.url != url:
             return
 
-        if not pixbuf:
+        if not texture:
             self.set_paintable(None)
             return
 
@@ -535,18 +553,6 @@ class AsyncPicture(Gtk.Picture):
         if self.player and url and "ytimg.com" in url:
             GLib.idle_add(self._sync_player_url, url)
 
-        # Crop to center square if requested
-        if self.crop_to_square and pixbuf:
-            w = pixbuf.get_width()
-            h = pixbuf.get_height()
-            if w != h:
-                size = min(w, h)
-                x_off = (w - size) // 2
-                y_off = (h - size) // 2
-                pixbuf = pixbuf.new_subpixbuf(x_off, y_off, size, size)
-
-        # Convert to Texture and paint
-        texture = Gdk.Texture.new_for_pixbuf(pixbuf)
         self.set_paintable(texture)
 
     def _sync_player_url(self, url):
@@ -682,19 +688,25 @@ class LikeButton(Gtk.Button):
         self.status = new_status
         self.update_icon()
 
+        video_id = self.video_id
+
         def do_rate():
-            success = self.client.rate_song(self.video_id, new_status)
+            success = self.client.rate_song(video_id, new_status)
             if not success:
                 # Revert on failure
-                GLib.idle_add(self.revert, old_status)
+                GLib.idle_add(self.revert, old_status, video_id)
 
         thread = threading.Thread(target=do_rate)
         thread.daemon = True
         thread.start()
 
-    def revert(self, status):
+    def revert(self, status, video_id=None):
+        # A recycled row may show another track by now
+        if video_id is not None and video_id != self.video_id:
+            return False
         self.status = status
         self.update_icon()
+        return False
 
     def set_data(self, video_id, status):
         self.video_id = video_id
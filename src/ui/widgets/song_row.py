@@ -209,6 +209,7 @@ class SongRowWidget(Gtk.Box):
             except Exception:
                 pass
             self._notify_handler_id = None
+        self.img.cancel()
         self._stop_animation()
 
     def _apply_playing_state(self, is_playing):
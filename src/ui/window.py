@@ -4,6 +4,7 @@ gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 
 from gi.repository import Gtk, Gdk, Adw, GObject, Gio, GLib
+import startup_trace
 
 
 class MainWindow(Adw.ApplicationWindow):
@@ -109,6 +110,24 @@ class MainWindow(Adw.ApplicationWindow):
         self.search_entry.set_hexpand(True)
         self.search_entry.connect("search-changed", self.on_global_search_changed)
         self.search_entry.connect("stop-search", self.on_search_stop)
+        self.search_entry.connect("activate", self.on_search_activate)
+
+        # As-you-type suggestions. autohide=False so the entry keeps focus.
+        self.suggestion_list = Gtk.ListBox()
+        self.suggestion_list.set_selection_mode(Gtk.SelectionMode.NONE)
+        self.suggestion_list.add_css_class("navigation-sidebar")
+        self.suggestion_list.set_size_request(320, -1)
+        self.suggestion_list.connect("row-activated", self.on_suggestion_activated)
+
+        self.suggestion_popover = Gtk.Popover()
+        self.suggestion_popover.set_child(self.suggestion_list)
+        self.suggestion_popover.set_autohide(False)
+        self.suggestion_popover.set_has_arrow(False)
+        self.suggestion_popover.set_position(Gtk.PositionType.BOTTOM)
+        self.suggestion_popover.set_halign(Gtk.Align.START)
+        self.suggestion_popover.set_parent(self.search_entry)
+        self._remote_suggestion_timer = None
+        self._suggested_text = None  # entry text set by picking a suggestion
 
         search_clamp.set_child(self.search_entry)
         self.search_bar.set_child(search_clamp)
@@ -138,6 +157,7 @@ class MainWindow(Adw.ApplicationWindow):
         from player.player import Player
 
         self.player = Player()
+        startup_trace.mark("player")
 
         self.queue_panel = QueuePanel(self.player)
 
@@ -222,8 +242,25 @@ class MainWindow(Adw.ApplicationWindow):
         # 6. Set the window content to the ToastOverlay
         self.set_content(self.toast_overlay)
 
+        # Slow progress updates down while minimised (GTK 4.12+)
+        if hasattr(self.props, "suspended"):
+            self.connect(
+                "notify::suspended",
+                lambda win, param: self.player.set_progress_suspended(
+                    win.get_property("suspended")
+                ),
+            )
+
         # Initialize Pages (Must be before breakpoint)
         self.init_pages()
+        startup_trace.mark("pages")
+
+        # The saved session is validated off the main thread; react once it reports
+        from api.client import MusicClient
+
+        MusicClient().auth_events.connect(
+            "session-validated", self._on_session_validated
+        )
 
         # Responsive Breakpoint
         breakpoint = Adw.Breakpoint.new(
@@ -294,11 +331,19 @@ class MainWindow(Adw.ApplicationWindow):
     def on_view_changed(self, stack, param):
         visible_name = self.view_stack.get_visible_child_name()
 
-        # Update Back Button for the new active tab
-        self.update_back_button_visibility()
+        # Tabs are built on first visit; a freshly built page loads itself
+        just_built = self._ensure_tab_page(visible_name)
+
+        # Update Back Button for the new active tab (the library refresh below
+        # is the only one for a tab switch)
+        self._sync_back_button()
 
         # Auto-refresh library if selected
-        if visible_name == "library" and hasattr(self, "library_page"):
+        if (
+            visible_name == "library"
+            and hasattr(self, "library_page")
+            and not just_built
+        ):
             # Delay slightly to allow UI transition and background state settlement
             GLib.timeout_add(100, self.library_page.load_library)
 
@@ -312,24 +357,33 @@ class MainWindow(Adw.ApplicationWindow):
             self.title_widget.set_title(title if title else "Mixtapes")
 
     def update_back_button_visibility(self, *args):
+        at_root = self._sync_back_button()
+
+        # Refresh library if we just returned to root of library tab
+        if (
+            at_root
+            and self.view_stack.get_visible_child_name() == "library"
+            and hasattr(self, "library_page")
+        ):
+            self.library_page.load_library()
+
+    def _sync_back_button(self):
+        """Shows the back button if the active tab can go back. Returns True at its root."""
         nav = self._get_active_nav_view()
         if nav:
             visible_page = nav.get_visible_page()
             if visible_page and nav.get_previous_page(visible_page):
                 self.back_btn.set_visible(True)
+                return False
             else:
                 self.back_btn.set_visible(False)
                 # Reset title when back at root
                 if hasattr(self, "title_widget"):
                     self.title_widget.set_title("Mixtapes")
-
-                # Refresh library if we just returned to root of library tab
-                if self.view_stack.get_visible_child_name() == "library" and hasattr(
-                    self, "library_page"
-                ):
-                    self.library_page.load_library()
+                return True
         else:
             self.back_btn.set_visible(False)
+            return False
 
     def on_back_clicked(self, btn):
         nav = self._get_active_nav_view()
@@ -387,6 +441,58 @@ class MainWindow(Adw.ApplicationWindow):
         )
         app_group.add(debug_row)
 
+        playback_group = Adw.PreferencesGroup()
+        playback_group.set_title("Playback")
+        page.add(playback_group)
+
+        gapless_row = Adw.SwitchRow()
+        gapless_row.set_title("Gapless Playback")
+        gapless_row.set_subtitle(
+            "Start the next track without a pause when it is already loaded"
+        )
+        gapless_row.set_active(self.player.gapless_enabled)
+        gapless_row.connect(
+            "notify::active",
+            lambda switch, param: self.player.set_gapless(switch.get_active()),
+        )
+        playback_group.add(gapless_row)
+
+        low_bandwidth_row = Adw.SwitchRow()
+        low_bandwidth_row.set_title("Low Bandwidth Mode")
+        low_bandwidth_row.set_subtitle(
+            "Stream lower bitrate audio on metered or slow connections"
+        )
+        low_bandwidth_row.set_active(self.player.low_bandwidth)
+        low_bandwidth_row.connect(
+            "notify::active",
+            lambda switch, param: self.player.set_low_bandwidth(switch.get_active()),
+        )
+        playback_group.add(low_bandwidth_row)
+
+        buffer_row = Adw.SpinRow.new_with_range(1, 60, 1)
+        buffer_row.set_title("Buffer Length")
+        buffer_row.set_subtitle("Seconds of audio to buffer ahead on slow connections")
+        buffer_row.set_value(self.player.buffer_duration)
+        buffer_row.connect(
+            "notify::value",
+            lambda row, param: self.player.set_buffer_settings(
+                duration=row.get_value()
+            ),
+        )
+        playback_group.add(buffer_row)
+
+        audio_cache_row = Adw.SwitchRow()
+        audio_cache_row.set_title("Cache Played Tracks")
+        audio_cache_row.set_subtitle(
+            "Keep a local copy of played tracks so replays start instantly"
+        )
+        audio_cache_row.set_active(self.player.audio_cache.enabled)
+        audio_cache_row.connect(
+            "notify::active",
+            lambda switch, param: self.player.set_audio_cache(switch.get_active()),
+        )
+        playback_group.add(audio_cache_row)
+
         group = Adw.PreferencesGroup()
         group.set_title("Account")
         page.add(group)
@@ -427,56 +533,78 @@ class MainWindow(Adw.ApplicationWindow):
         # Create Pages
         # Refactored to Single Global Header architecture
         # Each tab is just a NavigationView wrapping the content
+        # Page contents are constructed lazily in _ensure_tab_page so that
+        # only the initially visible tab costs anything before the first frame.
 
-        def create_tab_nav(page_content, title, icon, name):
+        def create_tab_nav(title, icon, name):
             # Nav Page & View
             # We wrap content in NavigationPage because NavigationView requires it
-            nav_page = Adw.NavigationPage(child=page_content, title=title)
+            nav_page = Adw.NavigationPage(title=title)
             nav_page.set_tag("root")  # Tag for resetting
             nav_view = Adw.NavigationView()
             nav_view.add(nav_page)
+            self._tab_roots[name] = nav_page
 
             # Connect to page changes to update Back Button
             nav_view.connect("notify::visible-page", self.update_back_button_visibility)
-            nav_view.connect("notify::visible-page", self.update_back_button_visibility)
 
             return nav_view
 
-        # Instantiate Pages
-        home_page = HomePage(self.player)
-        self.library_page = LibraryPage(self.player, self.open_playlist)
-        search_page = SearchPage(self.player, self.open_playlist)
-        self.search_page = search_page  # Store for global key controller
+        # name -> (attribute to store the page in, factory)
+        self._tab_factories = {
+            "home": ("home_page", lambda: HomePage(self.player)),
+            "library": (
+                "library_page",
+                lambda: LibraryPage(self.player, self.open_playlist),
+            ),
+            "search": (
+                # Stored for global key controller
+                "search_page",
+                lambda: SearchPage(self.player, self.open_playlist),
+            ),
+        }
+        self._tab_roots = {}
 
         self.tab_header_widgets = []  # Init list
 
         # Add to Stack and Configure Pages
         page_home = self.view_stack.add_named(
-            create_tab_nav(home_page, "Home", "user-home-symbolic", "home"), "home"
+            create_tab_nav("Home", "user-home-symbolic", "home"), "home"
         )
         page_home.set_title("Home")
         page_home.set_icon_name("user-home-symbolic")
 
         page_lib = self.view_stack.add_named(
-            create_tab_nav(
-                self.library_page, "Library", "media-optical-symbolic", "library"
-            ),
+            create_tab_nav("Library", "media-optical-symbolic", "library"),
             "library",
         )
         page_lib.set_title("Library")
         page_lib.set_icon_name("media-optical-symbolic")
 
-        page_lib.set_icon_name("media-optical-symbolic")
-
         page_search = self.view_stack.add_named(
-            create_tab_nav(search_page, "Explore", "compass2-symbolic", "search"),
+            create_tab_nav("Explore", "compass2-symbolic", "search"),
             "search",
         )
         page_search.set_title("Explore")
         page_search.set_icon_name("compass2-symbolic")
 
+        self._ensure_tab_page(self.view_stack.get_visible_child_name() or "home")
+
         self.previous_view_stack_item = "home"
 
+    def _ensure_tab_page(self, name):
+        """Builds the content of tab `name` if needed. Returns True if it was just built."""
+        factories = getattr(self, "_tab_factories", None)
+        if not factories or name not in factories or name not in self._tab_roots:
+            return False
+        attr, factory = factories[name]
+        if hasattr(self, attr):
+            return False
+        page = factory()
+        setattr(self, attr, page)
+        self._tab_roots[name].set_child(page)
+        return True
+
     def set_header_title(self, title):
         pass
 
@@ -540,9 +668,16 @@ class MainWindow(Adw.ApplicationWindow):
     def on_global_search_changed(self, entry):
         text = entry.get_text()
 
+        if self._suggested_text is not None:
+            # Set from a picked suggestion, which already searched
+            suggested, self._suggested_text = self._suggested_text, None
+            if text == suggested:
+                return
+
         # Context-Aware Search Logic
         playlist_page = self._get_active_playlist_page()
         if playlist_page:
+            self._show_suggestions([])
             # Filter Playlist Content
             if hasattr(playlist_page, "filter_content"):
                 playlist_page.filter_content(text)
@@ -556,9 +691,111 @@ class MainWindow(Adw.ApplicationWindow):
                     nav.pop_to_tag("root")
 
             if hasattr(self, "search_page"):
+                self._update_suggestions(text)
                 self.search_page.on_external_search(text)
 
+    def on_search_activate(self, entry):
+        # Enter searches right away instead of waiting for the debounce
+        self._show_suggestions([])
+        text = entry.get_text()
+        if text.strip() and hasattr(self, "search_page"):
+            if not self._get_active_playlist_page():
+                self.search_page.search_now(text)
+
+    # ── Suggestions ──
+
+    def _update_suggestions(self, text):
+        if self._remote_suggestion_timer:
+            GLib.source_remove(self._remote_suggestion_timer)
+            self._remote_suggestion_timer = None
+
+        suggestions = self.search_page.suggestions
+        if not text.strip():
+            suggestions.remote.cancel()
+            self._show_suggestions([])
+            return
+
+        # Local matches are a bisect away; show them before anything else
+        local = suggestions.local(text)
+        self._show_suggestions(local)
+
+        def fetch_remote():
+            self._remote_suggestion_timer = None
+            suggestions.remote.search(
+                text, lambda remote: self._on_remote_suggestions(text, local, remote)
+            )
+            return False
+
+        if suggestions.remote.cached(text) is not None:
+            fetch_remote()
+        else:
+            self._remote_suggestion_timer = GLib.timeout_add(150, fetch_remote)
+
+    def _on_remote_suggestions(self, text, local, remote):
+        if not remote or self.search_entry.get_text() != text:
+            return
+        from api.suggestions import Suggestion, fold
+
+        shown = {fold(s.label) for s in local}
+        merged = list(local)
+        for query in remote:
+            if len(merged) >= 10:
+                break
+            if isinstance(query, str) and fold(query) not in shown:
+                shown.add(fold(query))
+                merged.append(Suggestion("query", query, None, query))
+        self._show_suggestions(merged)
+
+    SUGGESTION_ICONS = {
+        "query": "system-search-symbolic",
+        "artist": "avatar-default-symbolic",
+        "playlist": "view-list-symbolic",
+        "track": "audio-x-generic-symbolic",
+    }
+
+    def _show_suggestions(self, suggestions):
+        child = self.suggestion_list.get_first_child()
+        while child:
+            next_child = child.get_next_sibling()
+            self.suggestion_list.remove(child)
+            child = next_child
+
+        if not suggestions or not self.search_bar.get_search_mode():
+            self.suggestion_popover.popdown()
+            return
+
+        for suggestion in suggestions:
+            row = Adw.ActionRow(title=GLib.markup_escape_text(suggestion.label))
+            if suggestion.subtitle:
+                row.set_subtitle(GLib.markup_escape_text(suggestion.subtitle))
+            row.add_prefix(
+                Gtk.Image.new_from_icon_name(
+                    self.SUGGESTION_ICONS.get(suggestion.kind, "system-search-symbolic")
+                )
+            )
+            row.set_activatable(True)
+            row.suggestion = suggestion
+            self.suggestion_list.append(row)
+        self.suggestion_popover.popup()
+
+    def on_suggestion_activated(self, listbox, row):
+        suggestion = row.suggestion
+        self._show_suggestions([])
+
+        if suggestion.kind == "query":
+            self._suggested_text = suggestion.payload
+            self.search_entry.set_text(suggestion.payload)
+            self.search_entry.set_position(-1)
+            self.search_page.search_now(suggestion.payload)
+        elif suggestion.kind == "artist":
+            self.open_artist(suggestion.payload, suggestion.label)
+        elif suggestion.kind == "playlist":
+            self.open_playlist(suggestion.payload)
+        elif suggestion.kind == "track":
+            self.player.play_tracks([suggestion.payload])
+
     def on_search_stop(self, entry):
+        self._show_suggestions([])
         self.search_bar.set_search_mode(False)
         # Clear filter if we were filtering?
         playlist_page = self._get_active_playlist_page()
@@ -568,6 +805,9 @@ class MainWindow(Adw.ApplicationWindow):
     def on_search_mode_changed(self, search_bar, param):
         mode = search_bar.get_search_mode()
 
+        if not mode:
+            self._show_suggestions([])
+
         if mode:
             # Enabling search
             self.search_entry.grab_focus()
@@ -580,6 +820,10 @@ class MainWindow(Adw.ApplicationWindow):
                 if isinstance(nav, Adw.NavigationView):
                     nav.pop_to_tag("root")
 
+            # Pick up playlists/artists/tracks loaded since the last search
+            if hasattr(self, "search_page"):
+                self.search_page.suggestions.refresh()
+
     # on_search_btn_clicked removed (replaced by binding)
 
     def open_playlist(self, playlist_id, initial_data=None):
@@ -791,20 +1035,10 @@ class MainWindow(Adw.ApplicationWindow):
             return
 
         # First check if the current track object in queue has the album ID natively
-        track = None
-        if 0 <= self.player.current_queue_index < len(self.player.queue):
-            track = self.player.queue[self.player.current_queue_index]
+        track = self.player.queue.current_track()
 
-        album_id = None
-        album_name = "Album"
-
-        if track and "album" in track and track["album"]:
-            album = track["album"]
-            if isinstance(album, dict):
-                album_id = album.get("id")
-                album_name = album.get("name", album_name)
-            elif isinstance(album, str):
-                album_name = album
+        album_id = track.album_id if track else None
+        album_name = (track.album if track else None) or "Album"
 
         if not album_id:
             # Fall back to fetching watch playlist to see if it belongs to an album
@@ -859,12 +1093,28 @@ class MainWindow(Adw.ApplicationWindow):
         from ui.login import LoginDialog
 
         client = MusicClient()
-        # Check if auth file exists AND is valid
-        if not client.is_authenticated() or not client.validate_session():
-            print("Authentication missing or invalid. Showing login dialog.")
+        # Check if auth file exists; validity is confirmed in the background
+        # and reported through _on_session_validated
+        if not client.is_authenticated():
+            print("Authentication missing. Showing login dialog.")
             # Show login dialog
             # We need to do this after the window is shown or using a timeout
             GObject.timeout_add(500, lambda: self.show_login(LoginDialog))
+        else:
+            client.validate_session_async()
+
+    def _on_session_validated(self, events, is_valid):
+        from ui.login import LoginDialog
+
+        # Emitted on the main loop after any fallback session was swapped in,
+        # so is_valid and the client's state agree here.
+        if is_valid:
+            return
+        print("Authentication invalid. Showing login dialog.")
+        # Pages may have loaded optimistically with the saved session
+        if hasattr(self, "library_page"):
+            self.library_page.load_library()
+        self.show_login(LoginDialog)
 
     def show_login(self, dialog_cls):
         dialog = dialog_cls(self)